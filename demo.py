@@ -39,6 +39,7 @@ def demo():
         print(f"\n[{title}]")
         input("  Press Enter to hear Aizen's response...")
         action()
+        assistant.voice.wait()
     
     print("\n" + "="*60)
     print("Demo complete! Run 'python main.py' for interactive mode.")
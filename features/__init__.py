@@ -1,7 +1,21 @@
 # Features package initialization
+#
+# Feature classes are imported on first attribute access so that optional
+# dependencies (requests, bs4, psutil) are only loaded for features in use.
 
-from .system_control import SystemController
-from .web_search import WebSearch
-from .weather import WeatherService
+import importlib
+
+_FEATURES = {
+    'SystemController': '.system_control',
+    'WebSearch': '.web_search',
+    'WeatherService': '.weather',
+}
 
 __all__ = ['SystemController', 'WebSearch', 'WeatherService']
+
+
+def __getattr__(name):
+    if name in _FEATURES:
+        module = importlib.import_module(_FEATURES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
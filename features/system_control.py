@@ -14,6 +14,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Spoken application names and the Windows commands that start them
+APP_COMMANDS = {
+    'notepad': 'notepad.exe',
+    'calculator': 'calc.exe',
+    'browser': 'start chrome',
+    'explorer': 'explorer.exe',
+    'spotify': 'spotify.exe'
+}
+
 
 class SystemController:
     """Control system functions."""
@@ -34,18 +43,9 @@ class SystemController:
         try:
             logger.info(f"Opening application: {app_name}")
             
-            if self.platform == 'nt':  # Windows
-                # Common Windows apps
-                apps_map = {
-                    'notepad': 'notepad.exe',
-                    'calculator': 'calc.exe',
-                    'browser': 'start chrome',
-                    'explorer': 'explorer.exe',
-                    'spotify': 'spotify.exe'
-                }
-                
-                command = apps_map.get(app_name.lower(), app_name)
-                subprocess.Popen(command, shell=True)
+            if self.platform == 'nt' and app_name.lower() in APP_COMMANDS:  # Windows
+                # Only known commands go through the shell
+                subprocess.Popen(APP_COMMANDS[app_name.lower()], shell=True)
                 
             else:  # Linux/Mac
                 subprocess.Popen([app_name])
@@ -155,6 +155,28 @@ class SystemController:
         except Exception as e:
             logger.error(f"Failed to lock screen: {e}")
             return False
+    
+    def handle_command(self, text: str) -> dict:
+        """Handle a system status voice/text command.
+        
+        Args:
+            text: User input, e.g. "system status"
+            
+        Returns:
+            Command response dictionary
+        """
+        info = self.get_system_info()
+        
+        if not info:
+            return {'text': "I could not read the system status.", 'context': 'error'}
+        if 'status' in info:
+            return {'text': f"System monitoring unavailable: {info['status']}", 'context': 'error'}
+        
+        return {
+            'text': (f"CPU usage is {info['cpu_usage']}, memory usage is {info['memory_usage']} "
+                     f"with {info['memory_available']} available, disk usage is {info['disk_usage']}."),
+            'context': 'task_complete'
+        }
 
 
 if __name__ == "__main__":
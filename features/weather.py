@@ -1,6 +1,7 @@
 """Weather information feature."""
 
 import logging
+import re
 import requests
 from typing import Optional, Dict
 
@@ -110,6 +111,23 @@ class WeatherService:
         summary += f"Humidity is {weather['humidity']}."
         
         return summary
+    
+    def handle_command(self, text: str) -> Dict[str, str]:
+        """Handle a weather voice/text command.
+        
+        Args:
+            text: User input, e.g. "what's the weather in Tokyo"
+            
+        Returns:
+            Command response dictionary
+        """
+        match = re.search(r'\b(?:in|for|at)\s+([a-zA-Z][a-zA-Z\s]*?)\s*[?.!]*$', text)
+        location = match.group(1).strip() if match else "auto"
+        
+        return {
+            'text': self.get_weather_summary(location),
+            'context': 'weather'
+        }
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 """Web search functionality for J.A.R.V.I.S."""
 
 import logging
+import re
 from typing import List, Dict
 import requests
 from bs4 import BeautifulSoup
@@ -82,6 +83,23 @@ class WebSearch:
                 summary += f"   {result['snippet'][:100]}...\n"
         
         return summary
+    
+    def handle_command(self, text: str) -> Dict[str, str]:
+        """Handle a search voice/text command.
+        
+        Args:
+            text: User input, e.g. "search for Bleach episodes"
+            
+        Returns:
+            Command response dictionary
+        """
+        query = re.sub(r'^.*?\b(?:search for|look up|google)\s+', '', text, flags=re.IGNORECASE)
+        query = query.strip(' ?.!')
+        
+        return {
+            'text': self.get_summary(query),
+            'context': 'knowledge'
+        }
 
 
 if __name__ == "__main__":
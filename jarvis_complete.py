@@ -72,6 +72,7 @@ class JarvisComplete:
         # Goodbye
         print("\n")
         self.voice.goodbye()
+        self.voice.wait()
         
         print("\n" + "="*60)
         print("Demo complete! All features working.")
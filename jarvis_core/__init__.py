@@ -1,6 +1,33 @@
-"""J.A.R.V.I.S. core modules."""
+"""J.A.R.V.I.S. core modules.
 
-from .assistant import JarvisAssistant
-from .commands import CommandProcessor
+Names are imported on first attribute access, so submodules such as
+model_registry can be used by the voice packages without importing the
+assistant (which imports those packages in turn).
+"""
 
-__all__ = ['JarvisAssistant', 'CommandProcessor']
+import importlib
+
+_EXPORTS = {
+    'JarvisAssistant': '.assistant',
+    'CommandProcessor': '.commands',
+    'TriggerIndex': '.trigger_index',
+    'FuzzyIntentMatcher': '.intent_matcher',
+    'CommandGrammar': '.grammar',
+    'PluginRegistry': '.plugins',
+    'PluginSpec': '.plugins',
+    'PluginLoadError': '.plugins',
+    'IntentRouter': '.router',
+    'ModelRegistry': '.model_registry',
+    'models': '.model_registry',
+}
+
+__all__ = ['JarvisAssistant', 'CommandProcessor', 'TriggerIndex', 'FuzzyIntentMatcher',
+           'CommandGrammar', 'PluginRegistry', 'PluginSpec', 'PluginLoadError',
+           'IntentRouter', 'ModelRegistry', 'models']
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
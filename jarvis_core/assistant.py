@@ -10,6 +10,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from voice_synthesis.aizen_voice import AizenVoice
 from jarvis_core.commands import CommandProcessor
+from jarvis_core.plugins import PluginRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,18 @@ class JarvisAssistant:
         self.voice = AizenVoice(config_path)
         
         # Initialize command processor
-        self.commands = CommandProcessor()
+        commands_config = self.config.get('commands', {})
+        fuzzy_threshold = commands_config.get('fuzzy_threshold', 0.47)
+        if not commands_config.get('fuzzy_matching', True):
+            fuzzy_threshold = None
+        self.commands = CommandProcessor(
+            fuzzy_threshold=fuzzy_threshold,
+            default_timeout=commands_config.get('handler_timeout')
+        )
+        
+        # Feature commands are imported on first use
+        self.plugins = PluginRegistry(self.config)
+        self.plugins.install(self.commands)
         
         # State
         self.running = False
@@ -68,6 +80,9 @@ class JarvisAssistant:
         logger.info("Stopping J.A.R.V.I.S...")
         self.running = False
         self.voice.goodbye()
+        self.voice.wait()
+        self.voice.close()
+        self.commands.shutdown()
     
     def process_text_input(self, text: str) -> bool:
         """Process text input from user.
@@ -95,19 +110,17 @@ class JarvisAssistant:
                 context
             )
             
-            # Speak the response
-            self.voice.speak(personalized_response)
-            
-            # Print to console
+            # Print first; speech is queued and plays in the background
             print(f"\nAizen: {personalized_response}\n")
+            self.voice.speak(personalized_response)
             
             # Check if should exit
             if response_data.get('exit', False):
                 return False
         else:
             # Command not recognized
-            self.voice.speak(result['response'])
             print(f"\nAizen: {result['response']}\n")
+            self.voice.speak(result['response'])
         
         # Add to conversation context
         self.conversation_context.append({
@@ -131,6 +144,8 @@ class JarvisAssistant:
                 should_continue = self.process_text_input(user_input)
                 
                 if not should_continue:
+                    # Let the farewell finish before the process exits
+                    self.voice.wait()
                     break
                     
         except KeyboardInterrupt:
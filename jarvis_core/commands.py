@@ -1,19 +1,67 @@
 """Command processor for J.A.R.V.I.S."""
 
+import asyncio
 import logging
 import datetime
+import functools
 import re
-from typing import Dict, Callable, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Callable, Any, NamedTuple, Optional
+
+from .trigger_index import TriggerIndex
+from .grammar import CommandGrammar
+from .intent_matcher import FuzzyIntentMatcher, NUMPY_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
 
+class CommandMatch(NamedTuple):
+    """A command selected for some input text.
+    
+    confidence is 1.0 for grammar matches, derived from word boundaries and
+    input coverage for trigger matches, and the similarity score for fuzzy
+    matches.
+    """
+    command: str
+    slots: Optional[dict]
+    confidence: float
+    method: str
+
+
 class CommandProcessor:
     """Process and execute user commands."""
     
-    def __init__(self):
-        """Initialize command processor."""
+    def __init__(self, fuzzy_threshold: Optional[float] = 0.47,
+                 default_timeout: Optional[float] = None, max_workers: int = 4):
+        """Initialize command processor.
+        
+        Args:
+            fuzzy_threshold: Minimum similarity for fuzzy matching when no
+                trigger matches exactly (None disables fuzzy matching)
+            default_timeout: Timeout in seconds for handlers registered
+                without their own (None waits indefinitely)
+            max_workers: Threads available for blocking handlers
+        """
         self.commands: Dict[str, Callable] = {}
+        self.trigger_index = TriggerIndex()
+        self.grammar = CommandGrammar()
+        self.default_timeout = default_timeout
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="command")
+        
+        # Blocking handlers still running after their timeout, and the
+        # event loop thread coroutine handlers run on for process()
+        self._pool_lock = threading.Lock()
+        self._hung: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        if fuzzy_threshold is not None and NUMPY_AVAILABLE:
+            self.fuzzy_matcher = FuzzyIntentMatcher(threshold=fuzzy_threshold)
+        else:
+            self.fuzzy_matcher = None
+        
         self._register_default_commands()
         logger.info("Command processor initialized")
     
@@ -25,53 +73,353 @@ class CommandProcessor:
         self.register_command("bye", self.goodbye, ["goodbye", "bye", "exit", "quit"])
         self.register_command("help", self.get_help, ["help", "commands", "what can you do"])
     
-    def register_command(self, name: str, handler: Callable, triggers: list):
+    def register_command(self, name: str, handler: Callable, triggers: list,
+                         timeout: Optional[float] = None):
         """Register a new command.
         
         Args:
             name: Command name
-            handler: Function to handle the command
+            handler: Function or coroutine function to handle the command.
+                Blocking functions run on the processor's thread pool.
             triggers: List of phrases that trigger this command
+            timeout: Seconds before the handler is abandoned (defaults to
+                the processor's default_timeout)
         """
+        self._unregister(name)
+        
         self.commands[name] = {
             'handler': handler,
-            'triggers': triggers
+            'triggers': triggers,
+            'timeout': timeout,
+            'is_async': asyncio.iscoroutinefunction(handler)
         }
+        
+        for trigger in triggers:
+            self.trigger_index.add(name, trigger)
+            if self.fuzzy_matcher is not None:
+                self.fuzzy_matcher.add(name, trigger)
         logger.debug(f"Registered command: {name}")
     
-    def process(self, text: str) -> Dict[str, Any]:
-        """Process a command from text.
+    def register_grammar(self, name: str, handler: Callable, patterns: list,
+                         response: Optional[str] = None, timeout: Optional[float] = None):
+        """Register a command whose templates extract typed slots.
+        
+        Templates are compiled once here (see jarvis_core.grammar), e.g.
+        "set [the] volume to {level:percent} [percent|%]".
+        
+        Args:
+            name: Command name
+            handler: Function or coroutine function called with the slots as
+                keyword arguments. May return a response dictionary; False
+                reports failure; anything else uses the response template.
+            patterns: List of command templates
+            response: Success text, formatted with the slots
+            timeout: Seconds before the handler is abandoned
+        """
+        self._unregister(name)
+        
+        # Compile first so a bad template leaves nothing half-registered
+        for pattern in patterns:
+            self.grammar.add(name, pattern)
+        
+        adapter = self._grammar_adapter(name, handler, response)
+        self.commands[name] = {
+            'handler': adapter,
+            'triggers': patterns,
+            'timeout': timeout,
+            'is_async': asyncio.iscoroutinefunction(adapter)
+        }
+        logger.debug(f"Registered grammar command: {name}")
+    
+    @staticmethod
+    def _grammar_adapter(name: str, handler: Callable, response: Optional[str]) -> Callable:
+        """Wrap a slot handler so it returns a response dictionary."""
+        def to_response(result: Any, slots: dict) -> Dict[str, str]:
+            if isinstance(result, dict):
+                return result
+            if result is False:
+                return {'text': f"I was unable to complete '{name}'.", 'context': 'error'}
+            text = response.format(**slots) if response else "Done."
+            return {'text': text, 'context': 'task_complete'}
+        
+        if asyncio.iscoroutinefunction(handler):
+            async def adapter(text: str, **slots) -> Dict[str, str]:
+                return to_response(await handler(**slots), slots)
+        else:
+            def adapter(text: str, **slots) -> Dict[str, str]:
+                return to_response(handler(**slots), slots)
+        
+        return adapter
+    
+    def _unregister(self, name: str):
+        """Remove a command from every index."""
+        if name not in self.commands:
+            return
+        
+        self.trigger_index.remove_command(name)
+        self.grammar.remove_command(name)
+        if self.fuzzy_matcher is not None:
+            self.fuzzy_matcher.remove_command(name)
+        del self.commands[name]
+    
+    def match(self, text: str) -> Optional[CommandMatch]:
+        """Find the command for a piece of text without running it.
         
         Args:
             text: User input text
             
         Returns:
-            Dictionary with response and metadata
+            Selected command with its slots and confidence, or None
         """
         text_lower = text.lower().strip()
-        logger.info(f"Processing command: {text}")
         
-        # Find matching command
-        for cmd_name, cmd_data in self.commands.items():
-            for trigger in cmd_data['triggers']:
-                if trigger in text_lower:
-                    logger.info(f"Matched command: {cmd_name}")
-                    result = cmd_data['handler'](text)
-                    return {
-                        'command': cmd_name,
-                        'response': result,
-                        'success': True
-                    }
-        
-        # No command matched
+        # Slot grammar first: its templates are more specific than triggers
+        parsed = self.grammar.match(text_lower)
+        if parsed is not None:
+            logger.info(f"Matched command: {parsed.command} (slots: {parsed.slots})")
+            return CommandMatch(parsed.command, parsed.slots, 1.0, 'grammar')
+        
+        # Find matching command (longest trigger wins, then registration order)
+        match = self.trigger_index.best_match(text_lower)
+        if match is not None:
+            logger.info(f"Matched command: {match.command} (trigger: '{match.trigger}')")
+            confidence = self._trigger_confidence(text_lower, match.start, match.end)
+            return CommandMatch(match.command, None, confidence, 'trigger')
+        
+        if self.fuzzy_matcher is not None:
+            # Only pay for fuzzy scoring on an exact miss (e.g. mis-transcriptions)
+            fuzzy = self.fuzzy_matcher.match(text_lower)
+            if fuzzy is not None:
+                logger.info(f"Fuzzy matched command: {fuzzy.command} "
+                            f"(trigger: '{fuzzy.trigger}', score: {fuzzy.score:.2f})")
+                return CommandMatch(fuzzy.command, None, fuzzy.score, 'fuzzy')
+        
+        return None
+    
+    @staticmethod
+    def _trigger_confidence(text: str, start: int, end: int) -> float:
+        """Confidence that a trigger occurrence is what the user asked for.
+        
+        A whole-word trigger scores 0.5 to 1.0 depending on how much of the
+        input it covers; a trigger inside another word ("hi" in "this")
+        scores at most 0.25.
+        """
+        coverage = (end - start) / max(len(text), 1)
+        bounded = ((start == 0 or not text[start - 1].isalnum()) and
+                   (end == len(text) or not text[end].isalnum()))
+        return 0.5 + 0.5 * coverage if bounded else 0.25 * coverage
+    
+    def _handler_for(self, cmd_name: str, slots: Optional[dict]) -> Callable:
+        """Handler for a matched command, with any slots bound."""
+        handler = self.commands[cmd_name]['handler']
+        if slots is not None:
+            handler = functools.partial(handler, **slots)
+        return handler
+    
+    def _timeout_for(self, cmd_name: str) -> Optional[float]:
+        """Effective timeout for a command."""
+        timeout = self.commands[cmd_name]['timeout']
+        return self.default_timeout if timeout is None else timeout
+    
+    def _no_match(self, text: str) -> Dict[str, Any]:
+        """Result for text that matched no command."""
         logger.warning(f"No command matched for: {text}")
         return {
             'command': None,
             'response': "I do not understand that command.",
             'success': False,
-            'context': 'error'
+            'context': 'error',
+            'confidence': 0.0
+        }
+    
+    def _timed_out(self, cmd_name: str, timeout: float) -> Dict[str, Any]:
+        """Result for a handler that exceeded its timeout."""
+        logger.warning(f"Command '{cmd_name}' timed out after {timeout}s")
+        return {
+            'command': cmd_name,
+            'response': "That is taking longer than expected.",
+            'success': False,
+            'context': 'error',
+            'timeout': True
+        }
+    
+    def _failed(self, cmd_name: str, error: Exception) -> Dict[str, Any]:
+        """Result for a handler that raised (including plugins that failed to load)."""
+        logger.error(f"Command '{cmd_name}' failed: {error}")
+        return {
+            'command': cmd_name,
+            'response': "I was unable to complete that request.",
+            'success': False,
+            'context': 'error',
+            'error': str(error)
+        }
+    
+    def process(self, text: str) -> Dict[str, Any]:
+        """Process a command from text.
+        
+        Blocks until the handler finishes or its timeout expires. Coroutine
+        handlers are run on a private event loop thread, so this also works
+        (blocking the caller) from inside a running loop; process_async
+        does not block it.
+        
+        Args:
+            text: User input text
+            
+        Returns:
+            Dictionary with response and metadata
+        """
+        logger.info(f"Processing command: {text}")
+        
+        match = self.match(text)
+        if match is None:
+            return self._no_match(text)
+        return self.execute(match, text)
+    
+    def execute(self, match: CommandMatch, text: str) -> Dict[str, Any]:
+        """Run the handler for an already matched command.
+        
+        Args:
+            match: Result of match()
+            text: User input text
+            
+        Returns:
+            Dictionary with response and metadata
+        """
+        cmd_name = match.command
+        cmd_data = self.commands[cmd_name]
+        handler = self._handler_for(cmd_name, match.slots)
+        timeout = self._timeout_for(cmd_name)
+        
+        try:
+            if cmd_data['is_async']:
+                future = asyncio.run_coroutine_threadsafe(handler(text), self._event_loop())
+                try:
+                    result = future.result(timeout=timeout)
+                except FutureTimeoutError:
+                    # Cancels the task on the loop
+                    future.cancel()
+                    return self._timed_out(cmd_name, timeout)
+            elif timeout is not None:
+                future = self.executor.submit(handler, text)
+                try:
+                    result = future.result(timeout=timeout)
+                except FutureTimeoutError:
+                    self._abandon(future)
+                    return self._timed_out(cmd_name, timeout)
+            else:
+                result = handler(text)
+        except Exception as e:
+            return self._failed(cmd_name, e)
+        
+        return {
+            'command': cmd_name,
+            'response': result,
+            'success': True,
+            'confidence': match.confidence
         }
     
+    async def process_async(self, text: str) -> Dict[str, Any]:
+        """Process a command without blocking the event loop.
+        
+        Coroutine handlers are awaited directly and blocking handlers run on
+        the processor's thread pool, so several commands can be in flight at
+        once. On timeout a coroutine handler is cancelled; a blocking handler
+        cannot be interrupted and finishes in the background.
+        
+        Args:
+            text: User input text
+            
+        Returns:
+            Dictionary with response and metadata
+        """
+        logger.info(f"Processing command: {text}")
+        
+        match = self.match(text)
+        if match is None:
+            return self._no_match(text)
+        return await self.execute_async(match, text)
+    
+    async def execute_async(self, match: CommandMatch, text: str) -> Dict[str, Any]:
+        """Async counterpart of execute().
+        
+        Args:
+            match: Result of match()
+            text: User input text
+            
+        Returns:
+            Dictionary with response and metadata
+        """
+        cmd_name = match.command
+        cmd_data = self.commands[cmd_name]
+        handler = self._handler_for(cmd_name, match.slots)
+        timeout = self._timeout_for(cmd_name)
+        
+        future = None
+        if cmd_data['is_async']:
+            pending = handler(text)
+        else:
+            future = self.executor.submit(handler, text)
+            pending = asyncio.wrap_future(future)
+        
+        try:
+            result = await asyncio.wait_for(pending, timeout)
+        except asyncio.TimeoutError:
+            if future is not None:
+                self._abandon(future)
+            return self._timed_out(cmd_name, timeout)
+        except Exception as e:
+            return self._failed(cmd_name, e)
+        
+        return {
+            'command': cmd_name,
+            'response': result,
+            'success': True,
+            'confidence': match.confidence
+        }
+    
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """The private loop coroutine handlers run on, started on first use."""
+        with self._pool_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="command-loop",
+                                 daemon=True).start()
+            return self._loop
+    
+    def _abandon(self, future):
+        """Account for a blocking handler that timed out.
+        
+        A running thread cannot be interrupted, so the handler keeps its
+        worker. Once hung handlers hold every worker, later commands would
+        only queue behind them; the pool is replaced with a fresh one and
+        the old threads are left to finish on their own.
+        
+        Args:
+            future: The handler's future
+        """
+        if future.cancel():
+            return
+        
+        with self._pool_lock:
+            hung = self._hung
+            hung.add(future)
+            if len(hung) >= self.max_workers:
+                logger.warning(f"{len(hung)} command handlers are still running after timing "
+                               f"out; starting a fresh thread pool")
+                self.executor.shutdown(wait=False)
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                   thread_name_prefix="command")
+                self._hung = set()
+        future.add_done_callback(hung.discard)
+    
+    def shutdown(self):
+        """Release the handler thread pool and event loop."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        with self._pool_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+    
     # Default command handlers
     
     def get_time(self, text: str) -> Dict[str, str]:
@@ -0,0 +1,220 @@
+"""Slot-extracting command grammar.
+
+Command templates such as "set [the] volume to {level:percent} [percent|%]"
+are compiled into a single regular expression at registration time, so an
+utterance is parsed into a command and typed slots with one regex match.
+Templates must cover the whole utterance, apart from a leading wake word
+or politeness phrase ("jarvis, please ...", "can you ...") and a trailing
+"please", so a command phrase inside a question does not fire.
+
+Template syntax (space separated):
+    word          literal word
+    {name:type}   slot of the given type (see SLOT_TYPES and set_choices())
+    [a|b]         optional word or alternatives
+    (a|b)         required alternatives
+"""
+
+import logging
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_duration(value: str) -> int:
+    """Convert "5 minutes" / "30 sec" / "2 hours" to seconds."""
+    amount, unit = re.match(r'(\d+)\s*([a-z]+)', value).groups()
+    multiplier = {'s': 1, 'm': 60, 'h': 3600}[unit[0]]
+    return int(amount) * multiplier
+
+
+# Slot type -> (regex, converter)
+SLOT_TYPES: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    'int': (r'\d+', int),
+    'number': (r'\d+(?:\.\d+)?', float),
+    # Clamped to 0-100, so responses report the level actually applied
+    'percent': (r'\d+', lambda value: max(0, min(100, int(value)))),
+    'duration': (r'\d+\s*(?:seconds?|secs?|minutes?|mins?|hours?|hrs?)', _parse_duration),
+    # Only the names passed to CommandGrammar.set_choices('app', ...)
+    'app': (r'(?!)', str),
+    'text': (r'.+?', str),
+}
+
+# Politeness and punctuation allowed after a complete command
+_TRAILER = r'(?:\s+please)?[\s.!?]*$'
+
+# Politeness allowed before a command (after the optional wake word)
+_POLITE = r'(?:(?:please|(?:can|could|would|will)\s+you(?:\s+please)?)\s+)?'
+
+
+class GrammarMatch(NamedTuple):
+    """A parsed command with its typed slots."""
+    command: str
+    pattern: str
+    slots: Dict[str, Any]
+
+
+class _Rule(NamedTuple):
+    command: str
+    pattern: str
+    regex: str
+    slots: Dict[str, Tuple[str, Callable[[str], Any]]]
+
+
+class CommandGrammar:
+    """Compiled set of slot-extracting command templates."""
+
+    def __init__(self, wake_words: Tuple[str, ...] = ('jarvis',)):
+        """Initialize an empty grammar.
+
+        Args:
+            wake_words: Names the user may address the assistant with
+                before a command ("hey jarvis, open notepad")
+        """
+        self._rules: List[_Rule] = []
+        self._slot_types = dict(SLOT_TYPES)
+        self._regex = None
+        self._dirty = False
+
+        names = '|'.join(re.escape(word.lower()) for word in wake_words)
+        wake = f"(?:(?:hey\\s+)?(?:{names})\\b[\\s,.!]*)?" if names else ''
+        self._prefix = f"\\W*{wake}{_POLITE}"
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def add(self, command: str, pattern: str):
+        """Compile a template and add it to the grammar.
+
+        Args:
+            command: Command name the template belongs to
+            pattern: Template string
+
+        Raises:
+            ValueError: If the template uses an unknown slot type
+        """
+        rule_id = len(self._rules)
+        regex, slots = self._compile_template(pattern.lower(), rule_id)
+        self._rules.append(_Rule(command, pattern, regex, slots))
+        self._dirty = True
+
+    def remove_command(self, command: str):
+        """Drop every template belonging to a command.
+
+        Args:
+            command: Command name to remove
+        """
+        remaining = [rule for rule in self._rules if rule.command != command]
+        if len(remaining) == len(self._rules):
+            return
+        self._recompile(remaining)
+
+    def set_choices(self, slot_type: str, values):
+        """Restrict a slot type to a fixed set of phrases.
+
+        Args:
+            slot_type: Slot type to (re)define, e.g. "app"
+            values: Allowed phrases (matched case-insensitively, whole)
+        """
+        phrases = sorted({' '.join(value.lower().split()) for value in values if value.strip()},
+                         key=len, reverse=True)
+        regex = '|'.join(r'\s+'.join(map(re.escape, phrase.split())) for phrase in phrases)
+        self._slot_types[slot_type] = (
+            f"(?:{regex})" if regex else r'(?!)',
+            lambda value: ' '.join(value.split())
+        )
+        self._recompile(self._rules)
+
+    def _recompile(self, rules: List[_Rule]):
+        """Compile the given rules again (after slot types changed)."""
+        self._rules = []
+        for rule in rules:
+            self.add(rule.command, rule.pattern)
+        self._dirty = True
+
+    def _compile_template(self, pattern: str, rule_id: int) -> Tuple[str, Dict[str, tuple]]:
+        """Translate a template into a regex fragment.
+
+        Returns:
+            Regex fragment and a map of group name -> (slot name, converter)
+        """
+        slots = {}
+        regex = ''
+        # A leading optional token carries its own trailing whitespace
+        needs_separator = False
+
+        for token in pattern.split():
+            optional = False
+
+            slot = re.fullmatch(r'\{(\w+):(\w+)\}', token)
+            if slot:
+                name, slot_type = slot.groups()
+                if slot_type not in self._slot_types:
+                    raise ValueError(f"Unknown slot type '{slot_type}' in: {pattern}")
+                slot_regex, convert = self._slot_types[slot_type]
+                group = f"r{rule_id}_{name}"
+                slots[group] = (name, convert)
+                fragment = f"(?P<{group}>{slot_regex})"
+            elif token.startswith('[') and token.endswith(']'):
+                optional = True
+                fragment = self._alternatives(token[1:-1])
+            elif token.startswith('(') and token.endswith(')'):
+                fragment = self._alternatives(token[1:-1])
+            else:
+                fragment = re.escape(token)
+
+            if optional and not needs_separator:
+                regex += f"(?:{fragment}\\s+)?"
+            elif optional:
+                regex += f"(?:\\s*{fragment})?"
+            elif needs_separator:
+                regex += f"\\s+{fragment}"
+            else:
+                regex += fragment
+            needs_separator = needs_separator or not optional
+
+        return regex, slots
+
+    @staticmethod
+    def _alternatives(body: str) -> str:
+        """Regex for "a|b|c" alternatives."""
+        return '(?:' + '|'.join(re.escape(option) for option in body.split('|')) + ')'
+
+    def _build(self):
+        """Combine every rule into one alternation."""
+        if self._rules:
+            alternatives = '|'.join(
+                f"(?P<r{i}>{rule.regex}){_TRAILER}" for i, rule in enumerate(self._rules)
+            )
+            self._regex = re.compile(f"{self._prefix}(?:{alternatives})")
+        else:
+            self._regex = None
+        self._dirty = False
+        logger.debug(f"Command grammar rebuilt: {len(self._rules)} templates")
+
+    def match(self, text: str) -> Optional[GrammarMatch]:
+        """Parse an utterance.
+
+        Args:
+            text: Input text (lowercased internally)
+
+        Returns:
+            Matched command and converted slots, or None
+        """
+        if self._dirty:
+            self._build()
+        if self._regex is None:
+            return None
+
+        # Anchored: the template has to start the utterance
+        found = self._regex.match(text.lower().strip())
+        if found is None:
+            return None
+
+        # The rule's wrapping group closes last, so it is the match's lastgroup
+        rule = self._rules[int(found.lastgroup[1:])]
+        slots = {
+            name: convert(found.group(group).strip())
+            for group, (name, convert) in rule.slots.items()
+        }
+        return GrammarMatch(rule.command, rule.pattern, slots)
@@ -0,0 +1,196 @@
+"""Fuzzy intent matching for mis-transcribed commands.
+
+Triggers are embedded as character n-gram TF-IDF vectors stacked into one
+matrix, so an utterance is scored against every trigger with a single
+matrix-vector product. Function words are dropped before embedding: they
+carry no intent, and in long questions they would otherwise outweigh the
+one or two words that resemble a trigger.
+"""
+
+import logging
+import math
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    logging.warning("numpy not installed. Fuzzy intent matching unavailable.")
+
+logger = logging.getLogger(__name__)
+
+STOP_WORDS = frozenset("""
+    a about am an and are at be by can could did do does for from give going
+    how i i'm in is it it's its like me my now of on or please should some
+    something tell that the there think this to want was were what what's
+    whats when where who why will with would you your
+""".split())
+
+
+class IntentMatch(NamedTuple):
+    """Best fuzzy match for an utterance."""
+    command: str
+    trigger: str
+    score: float
+
+
+class FuzzyIntentMatcher:
+    """Character n-gram TF-IDF matcher over command triggers."""
+
+    def __init__(self, ngram_range: tuple = (2, 3), threshold: float = 0.47):
+        """Initialize the matcher.
+
+        Args:
+            ngram_range: Smallest and largest character n-gram length
+            threshold: Minimum cosine similarity for a match (0.0 to 1.0)
+        """
+        self.ngram_range = ngram_range
+        self.threshold = threshold
+        self._entries: List[tuple] = []
+        self._vocabulary: Dict[str, int] = {}
+        self._idf = None
+        self._matrix = None
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, command: str, trigger: str):
+        """Add a trigger phrase for a command.
+
+        Args:
+            command: Command name the trigger belongs to
+            trigger: Trigger phrase
+        """
+        self._entries.append((command, trigger.lower()))
+        self._dirty = True
+
+    def remove_command(self, command: str):
+        """Drop every trigger belonging to a command.
+
+        Args:
+            command: Command name to remove
+        """
+        remaining = [entry for entry in self._entries if entry[0] != command]
+        if len(remaining) != len(self._entries):
+            self._entries = remaining
+            self._dirty = True
+
+    def _ngrams(self, text: str) -> List[str]:
+        """Split the content words of a text into padded character n-grams."""
+        words = re.findall(r"[\w']+", text.lower())
+        # A text made only of function words ("what can you do") keeps them
+        words = [word for word in words if word not in STOP_WORDS] or words
+        text = f" {' '.join(words)} "
+        low, high = self.ngram_range
+        return [
+            text[i:i + n]
+            for n in range(low, high + 1)
+            for i in range(len(text) - n + 1)
+        ]
+
+    def _build(self):
+        """Recompute the vocabulary, IDF weights and trigger matrix."""
+        self._dirty = False
+
+        if not NUMPY_AVAILABLE or not self._entries:
+            self._matrix = None
+            return
+
+        vocabulary: Dict[str, int] = {}
+        rows = []
+        for _, trigger in self._entries:
+            counts: Dict[int, int] = {}
+            for gram in self._ngrams(trigger):
+                col = vocabulary.setdefault(gram, len(vocabulary))
+                counts[col] = counts.get(col, 0) + 1
+            rows.append(counts)
+
+        tf = np.zeros((len(rows), len(vocabulary)), dtype=np.float32)
+        for row, counts in enumerate(rows):
+            tf[row, list(counts)] = list(counts.values())
+
+        # Smoothed IDF, as in scikit-learn's TfidfVectorizer
+        doc_freq = np.count_nonzero(tf, axis=0)
+        n_docs = len(rows)
+        self._idf = (np.log((1 + n_docs) / (1 + doc_freq)) + 1).astype(np.float32)
+
+        matrix = tf * self._idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self._matrix = matrix / np.maximum(norms, 1e-12)
+        self._vocabulary = vocabulary
+
+        logger.debug(f"Fuzzy matcher rebuilt: {n_docs} triggers, {len(vocabulary)} n-grams")
+
+    def _vectorize(self, texts: Sequence[str]):
+        """Embed texts into the trigger n-gram space (one row per text)."""
+        vectors = np.zeros((len(texts), len(self._vocabulary)), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for gram in self._ngrams(text):
+                col = self._vocabulary.get(gram)
+                if col is not None:
+                    vectors[row, col] += 1
+
+        vectors *= self._idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def scores(self, text: str):
+        """Cosine similarity of the text against every trigger.
+
+        Args:
+            text: Utterance to score
+
+        Returns:
+            Array of scores in trigger registration order
+        """
+        if self._dirty:
+            self._build()
+        if self._matrix is None:
+            return None
+
+        return self._matrix @ self._vectorize([text])[0]
+
+    def match(self, text: str, threshold: Optional[float] = None) -> Optional[IntentMatch]:
+        """Find the best-scoring trigger for an utterance.
+
+        Args:
+            text: Utterance to match
+            threshold: Override for the minimum score
+
+        Returns:
+            Best match, or None if nothing scores above the threshold
+        """
+        return self.match_batch([text], threshold)[0]
+
+    def match_batch(self, texts: Sequence[str],
+                    threshold: Optional[float] = None) -> List[Optional[IntentMatch]]:
+        """Match several utterances with one matrix product.
+
+        Args:
+            texts: Utterances to match
+            threshold: Override for the minimum score
+
+        Returns:
+            Best match (or None) for each utterance, in input order
+        """
+        if self._dirty:
+            self._build()
+        if self._matrix is None or not texts:
+            return [None] * len(texts)
+
+        threshold = self.threshold if threshold is None else threshold
+        scores = self._vectorize(texts) @ self._matrix.T
+        best = np.argmax(scores, axis=1)
+
+        results = []
+        for row, col in enumerate(best):
+            score = float(scores[row, col])
+            if score < threshold or math.isclose(score, 0.0):
+                results.append(None)
+            else:
+                command, trigger = self._entries[col]
+                results.append(IntentMatch(command, trigger, score))
+        return results
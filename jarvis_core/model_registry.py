@@ -0,0 +1,453 @@
+"""Process-wide registry of shared, reference-counted models.
+
+TTS engines, Whisper models and Porcupine handles are expensive to load
+and several components ask for the same one (the GUI and the assistant
+each create an AizenVoice, for example). The registry hands every caller
+the same instance for the same configuration and unloads it when the
+last user releases it.
+
+Models wrapped in a ResidentModel can additionally be dropped from memory
+while idle by the MemoryBudget and are reloaded on their next use.
+"""
+
+import gc
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident memory of this process."""
+    if not PSUTIL_AVAILABLE:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def _gpu_bytes() -> Optional[int]:
+    """CUDA memory allocated by torch, if torch is loaded and has a GPU."""
+    torch = sys.modules.get('torch')
+    if torch is None or not torch.cuda.is_available():
+        return None
+    return torch.cuda.memory_allocated()
+
+
+class _Entry:
+    """A loaded (or loading) model and its bookkeeping."""
+
+    def __init__(self, kind: str, key: Hashable, closer: Optional[Callable[[Any], None]]):
+        self.kind = kind
+        self.key = key
+        self.closer = closer
+        self.instance = None
+        self.refs = 1
+        self.error: Optional[BaseException] = None
+        self.ready = threading.Event()
+        self.load_seconds = 0.0
+        self.rss_bytes: Optional[int] = None
+        self.gpu_bytes: Optional[int] = None
+
+
+class ModelRegistry:
+    """Reference-counted cache of heavy models keyed by kind and configuration.
+
+    Loading happens outside the registry lock, so one slow model does not
+    block lookups of others; concurrent requests for the same model wait
+    for the first load instead of starting their own.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, Hashable], _Entry] = {}
+
+    def acquire(self, kind: str, key: Hashable, factory: Callable[[], Any],
+                closer: Optional[Callable[[Any], None]] = None) -> Any:
+        """Get the shared model, loading it on first use.
+
+        Args:
+            kind: Model family ("tts", "whisper", "porcupine", ...)
+            key: Hashable description of the configuration that
+                determines the model
+            factory: Function that loads the model
+            closer: Function that frees the model when the last reference
+                is released
+
+        Returns:
+            The shared instance
+        """
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is not None:
+                entry.refs += 1
+                loader = False
+            else:
+                entry = _Entry(kind, key, closer)
+                self._entries[(kind, key)] = entry
+                loader = True
+
+        if not loader:
+            entry.ready.wait()
+            if entry.error is not None:
+                raise entry.error
+            logger.debug(f"Reusing shared {kind} model ({entry.refs} users)")
+            return entry.instance
+
+        rss_before, gpu_before = _rss_bytes(), _gpu_bytes()
+        start = time.perf_counter()
+        try:
+            entry.instance = factory()
+        except BaseException as e:
+            entry.error = e
+            with self._lock:
+                self._entries.pop((kind, key), None)
+            entry.ready.set()
+            raise
+
+        entry.load_seconds = time.perf_counter() - start
+        rss_after, gpu_after = _rss_bytes(), _gpu_bytes()
+        if rss_before is not None:
+            entry.rss_bytes = rss_after - rss_before
+        if gpu_before is not None:
+            entry.gpu_bytes = gpu_after - gpu_before
+        entry.ready.set()
+
+        logger.info(f"Loaded shared {kind} model in {entry.load_seconds:.1f}s")
+        return entry.instance
+
+    def release(self, instance: Any) -> bool:
+        """Drop one reference to a model, unloading it after the last one.
+
+        Args:
+            instance: Object returned by acquire()
+
+        Returns:
+            True if the model was unloaded
+        """
+        with self._lock:
+            for slot, entry in self._entries.items():
+                if entry.instance is instance:
+                    break
+            else:
+                return False
+
+            entry.refs -= 1
+            if entry.refs > 0:
+                return False
+            del self._entries[slot]
+
+        if entry.closer is not None:
+            try:
+                entry.closer(instance)
+            except Exception as e:
+                logger.warning(f"Error unloading {entry.kind} model: {e}")
+        logger.info(f"Unloaded shared {entry.kind} model")
+        return True
+
+    def memory_report(self) -> List[Dict[str, Any]]:
+        """What each loaded model costs.
+
+        Memory is the change in process RSS (and CUDA allocation) across
+        the load, so it is approximate when models load concurrently.
+
+        Returns:
+            One entry per model with its kind, key, users, load time in
+            seconds and memory in MB (None when not measurable)
+        """
+        def mb(value):
+            return None if value is None else value / (1024 * 1024)
+
+        with self._lock:
+            entries = [e for e in self._entries.values() if e.ready.is_set()]
+
+        return [{
+            'kind': entry.kind,
+            'key': entry.key,
+            'users': entry.refs,
+            'load_s': entry.load_seconds,
+            'rss_mb': mb(entry.rss_bytes),
+            'gpu_mb': mb(entry.gpu_bytes)
+        } for entry in entries]
+
+    def log_memory_report(self):
+        """Log memory_report() one line per model."""
+        for row in self.memory_report():
+            rss = "n/a" if row['rss_mb'] is None else f"{row['rss_mb']:.0f} MB"
+            gpu = "" if row['gpu_mb'] is None else f", GPU {row['gpu_mb']:.0f} MB"
+            key = str(row['key'])
+            if len(key) > 60:
+                key = key[:57] + "..."
+            logger.info(f"Model {row['kind']} {key}: {row['users']} user(s), "
+                        f"loaded in {row['load_s']:.1f}s, RSS {rss}{gpu}")
+
+
+class ResidentModel:
+    """A model that can be unloaded while idle and reloaded on demand.
+
+    Callers borrow the instance with use(); it is loaded if needed and
+    cannot be unloaded while borrowed. Reloads after an unload are timed,
+    so the latency the memory budget costs is visible.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any],
+                 unloader: Optional[Callable[[Any], None]] = None,
+                 budget: Optional["MemoryBudget"] = None):
+        """Initialize without loading.
+
+        Args:
+            name: Label for logs and reports
+            loader: Function that loads and returns the model
+            unloader: Function that frees a model before it is dropped
+            budget: Memory budget to register with (defaults to the
+                process-wide memory_budget)
+        """
+        self.name = name
+        self.loader = loader
+        self.unloader = unloader
+
+        self._lock = threading.RLock()
+        self._instance = None
+        self._active = 0
+        self._last_used = time.monotonic()
+        self.loads = 0
+        self.unloads = 0
+        self.reload_times: List[float] = []
+
+        self.budget = memory_budget if budget is None else budget
+        self.budget.register(self)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._instance is not None
+
+    @property
+    def in_use(self) -> bool:
+        return self._active > 0
+
+    @property
+    def idle_seconds(self) -> float:
+        """Seconds since the model was last returned by a user."""
+        return 0.0 if self._active else time.monotonic() - self._last_used
+
+    def load(self) -> Any:
+        """Load the model if it is not resident.
+
+        Returns:
+            The model
+        """
+        with self._lock:
+            if self._instance is None:
+                start = time.perf_counter()
+                self._instance = self.loader()
+                elapsed = time.perf_counter() - start
+
+                if self.loads:
+                    self.reload_times.append(elapsed)
+                    logger.info(f"Reloaded {self.name} in {elapsed:.1f}s")
+                self.loads += 1
+                self._last_used = time.monotonic()
+            return self._instance
+
+    @contextmanager
+    def use(self) -> Iterator[Any]:
+        """Borrow the model, loading it first if it was unloaded."""
+        with self._lock:
+            instance = self.load()
+            self._active += 1
+        try:
+            yield instance
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._last_used = time.monotonic()
+
+    def prewarm(self, background: bool = True):
+        """Load the model ahead of its next use.
+
+        Args:
+            background: Load on a worker thread
+        """
+        if self.is_loaded:
+            return
+        if background:
+            threading.Thread(target=self.load, name=f"prewarm-{self.name}", daemon=True).start()
+        else:
+            self.load()
+
+    def unload(self) -> bool:
+        """Drop the model from memory unless it is in use.
+
+        Returns:
+            True if the model was unloaded
+        """
+        with self._lock:
+            if self._instance is None or self._active:
+                return False
+            instance, self._instance = self._instance, None
+            self.unloads += 1
+
+        if self.unloader is not None:
+            try:
+                self.unloader(instance)
+            except Exception as e:
+                logger.warning(f"Error unloading {self.name}: {e}")
+        del instance
+        _free_memory()
+        logger.info(f"Unloaded idle model {self.name}")
+        return True
+
+    def close(self):
+        """Unload and stop tracking the model."""
+        self.budget.unregister(self)
+        self.unload()
+
+
+def _free_memory():
+    """Return freed model memory to the allocator (and the GPU)."""
+    gc.collect()
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+class MemoryBudget:
+    """Unloads resident models that sit idle or push the process over budget.
+
+    A watcher thread, started when the first model registers, unloads any
+    model unused for idle_seconds and, while RSS exceeds max_rss_mb (psutil
+    required), the least recently used idle models first.
+    """
+
+    def __init__(self, idle_seconds: Optional[float] = 600, max_rss_mb: Optional[float] = None,
+                 check_interval: float = 30.0):
+        """Initialize memory budget.
+
+        Args:
+            idle_seconds: Unload models unused for this long (None disables)
+            max_rss_mb: Resident memory above which idle models are unloaded
+                (None disables)
+            check_interval: Seconds between checks
+        """
+        self.idle_seconds = idle_seconds
+        self.max_rss_mb = max_rss_mb
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._residents: List[ResidentModel] = []
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def configure(self, config: Optional[dict]):
+        """Apply settings from the `memory` config section.
+
+        Args:
+            config: Dictionary with idle_unload_minutes, max_rss_mb and
+                check_interval_seconds (missing keys keep their values)
+        """
+        config = config or {}
+        if 'idle_unload_minutes' in config:
+            minutes = config['idle_unload_minutes']
+            self.idle_seconds = None if minutes is None else minutes * 60
+        if 'max_rss_mb' in config:
+            self.max_rss_mb = config['max_rss_mb']
+        if 'check_interval_seconds' in config:
+            self.check_interval = config['check_interval_seconds']
+        self._wakeup.set()
+
+    def register(self, resident: ResidentModel):
+        """Track a model and start the watcher if needed."""
+        with self._lock:
+            self._residents.append(resident)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._watch, name="memory-budget", daemon=True)
+                self._thread.start()
+
+    def unregister(self, resident: ResidentModel):
+        """Stop tracking a model."""
+        with self._lock:
+            if resident in self._residents:
+                self._residents.remove(resident)
+
+    def prewarm(self):
+        """Reload every unloaded model in the background (e.g. on the wake word)."""
+        with self._lock:
+            residents = list(self._residents)
+        for resident in residents:
+            resident.prewarm()
+
+    def enforce(self) -> int:
+        """Unload idle and over-budget models now.
+
+        Returns:
+            Number of models unloaded
+        """
+        with self._lock:
+            residents = [r for r in self._residents if r.is_loaded and not r.in_use]
+
+        unloaded = 0
+        if self.idle_seconds is not None:
+            for resident in residents:
+                if resident.idle_seconds >= self.idle_seconds and resident.unload():
+                    unloaded += 1
+
+        if self.max_rss_mb is not None and PSUTIL_AVAILABLE:
+            for resident in sorted(residents, key=lambda r: r.idle_seconds, reverse=True):
+                if _rss_bytes() / (1024 * 1024) <= self.max_rss_mb:
+                    break
+                if resident.unload():
+                    unloaded += 1
+                    logger.info(f"Memory over {self.max_rss_mb} MB budget, unloaded {resident.name}")
+
+        return unloaded
+
+    def _watch(self):
+        """Watcher loop."""
+        while True:
+            self._wakeup.wait(self.check_interval)
+            self._wakeup.clear()
+            try:
+                self.enforce()
+            except Exception as e:
+                logger.error(f"Memory budget check failed: {e}")
+
+    def residency(self) -> List[Dict[str, Any]]:
+        """Current state of each tracked model.
+
+        Returns:
+            One entry per model with whether it is loaded or in use, idle
+            seconds, load and unload counts, and the reload latency the
+            budget caused (count, mean and last, in milliseconds)
+        """
+        with self._lock:
+            residents = list(self._residents)
+
+        report = []
+        for resident in residents:
+            reloads = list(resident.reload_times)
+            report.append({
+                'model': resident.name,
+                'loaded': resident.is_loaded,
+                'in_use': resident.in_use,
+                'idle_s': resident.idle_seconds,
+                'loads': resident.loads,
+                'unloads': resident.unloads,
+                'reloads': len(reloads),
+                'reload_mean_ms': sum(reloads) / len(reloads) * 1000 if reloads else None,
+                'last_reload_ms': reloads[-1] * 1000 if reloads else None
+            })
+        return report
+
+
+# Shared by the whole process
+models = ModelRegistry()
+memory_budget = MemoryBudget()
@@ -0,0 +1,251 @@
+"""Lazy plugin registry for feature commands.
+
+Plugins are declared by module path and only imported the first time one
+of their triggers matches, so disabled or unused features cost nothing at
+startup.
+"""
+
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PluginLoadError(RuntimeError):
+    """A plugin's module or class could not be loaded."""
+
+
+class PluginSpec(NamedTuple):
+    """Declaration of a lazily loaded command.
+
+    target is "package.module:function" or "package.module:Class.method";
+    classes are instantiated once with no arguments and shared between
+    plugins that name the same class. Plugins with grammar patterns are
+    called with the extracted slots instead of the input text, and
+    response is formatted with those slots on success.
+    """
+    name: str
+    target: str
+    triggers: List[str]
+    feature: Optional[str] = None
+    timeout: Optional[float] = None
+    patterns: Optional[List[str]] = None
+    response: Optional[str] = None
+
+
+# Applications "open <name>" may start unless commands.apps is configured
+DEFAULT_APPS = ['notepad', 'calculator', 'browser', 'explorer', 'spotify']
+
+DEFAULT_PLUGINS = [
+    PluginSpec(
+        name="weather",
+        target="features.weather:WeatherService.handle_command",
+        triggers=["weather", "temperature outside", "forecast"],
+        feature="weather",
+        timeout=15
+    ),
+    PluginSpec(
+        name="search",
+        target="features.web_search:WebSearch.handle_command",
+        triggers=["search for", "look up", "google"],
+        feature="web_search",
+        timeout=15
+    ),
+    PluginSpec(
+        name="system_info",
+        target="features.system_control:SystemController.handle_command",
+        triggers=["system info", "system status", "cpu usage", "memory usage"],
+        feature="system_control"
+    ),
+    PluginSpec(
+        name="volume",
+        target="features.system_control:SystemController.set_volume",
+        triggers=[],
+        feature="system_control",
+        patterns=[
+            "(set|turn|change) [the] volume to {level:percent} [percent|%]",
+            "volume {level:percent} [percent|%]",
+        ],
+        response="Volume set to {level}%."
+    ),
+    PluginSpec(
+        name="open_app",
+        target="features.system_control:SystemController.open_application",
+        triggers=[],
+        feature="system_control",
+        patterns=["(open|launch|start) [the] {app_name:app}"],
+        response="Opening {app_name}."
+    ),
+    PluginSpec(
+        name="lock_screen",
+        target="features.system_control:SystemController.lock_screen",
+        triggers=[],
+        feature="system_control",
+        patterns=["lock [the] (screen|computer|workstation)"],
+        response="The screen is locked."
+    ),
+]
+
+
+class PluginRegistry:
+    """Registry of lazily imported command plugins."""
+
+    def __init__(self, config: Optional[dict] = None):
+        """Initialize plugin registry.
+
+        Args:
+            config: Loaded configuration; plugins whose `features.<name>`
+                flag is false are skipped
+        """
+        self.config = config or {}
+        self.plugins: Dict[str, PluginSpec] = {}
+        self._handlers: Dict[str, Callable] = {}
+        self._instances: Dict[str, Any] = {}
+        self._import_times: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def declare(self, spec: PluginSpec) -> bool:
+        """Declare a plugin without importing it.
+
+        Args:
+            spec: Plugin declaration
+
+        Returns:
+            True if the plugin is enabled and was declared
+        """
+        if not self.is_enabled(spec):
+            logger.info(f"Plugin disabled by config: {spec.name}")
+            return False
+
+        self.plugins[spec.name] = spec
+        logger.debug(f"Declared plugin: {spec.name} -> {spec.target}")
+        return True
+
+    def is_enabled(self, spec: PluginSpec) -> bool:
+        """Whether the plugin's feature flag allows it."""
+        if spec.feature is None:
+            return True
+        return bool(self.config.get('features', {}).get(spec.feature, True))
+
+    def install(self, processor, specs: Optional[List[PluginSpec]] = None):
+        """Declare plugins and register lazy handlers with a command processor.
+
+        Args:
+            processor: CommandProcessor to register commands with
+            specs: Plugins to install (defaults to DEFAULT_PLUGINS)
+        """
+        # The {app} slot only accepts these names, never free text
+        apps = self.config.get('commands', {}).get('apps', DEFAULT_APPS)
+        processor.grammar.set_choices('app', apps)
+
+        for spec in DEFAULT_PLUGINS if specs is None else specs:
+            if not self.declare(spec):
+                continue
+
+            if spec.patterns:
+                processor.register_grammar(
+                    spec.name,
+                    self._lazy_slot_handler(spec.name),
+                    spec.patterns,
+                    response=spec.response,
+                    timeout=spec.timeout
+                )
+            else:
+                processor.register_command(
+                    spec.name,
+                    self._lazy_handler(spec.name),
+                    spec.triggers,
+                    timeout=spec.timeout
+                )
+
+    def _lazy_handler(self, name: str) -> Callable:
+        """Build a handler that imports the plugin on first call."""
+        def handler(text: str) -> Dict[str, str]:
+            return self.load(name)(text)
+
+        handler.__name__ = f"lazy_{name}"
+        return handler
+
+    def _lazy_slot_handler(self, name: str) -> Callable:
+        """Build a slot handler that imports the plugin on first call."""
+        def handler(**slots) -> Any:
+            return self.load(name)(**slots)
+
+        handler.__name__ = f"lazy_{name}"
+        return handler
+
+    def load(self, name: str) -> Callable:
+        """Import a plugin's target if needed and return the callable.
+
+        Args:
+            name: Plugin name
+
+        Returns:
+            The resolved handler
+
+        Raises:
+            PluginLoadError: If importing or instantiating the target
+                fails (e.g. a missing dependency); retried on the next call
+        """
+        handler = self._handlers.get(name)
+        if handler is not None:
+            return handler
+
+        with self._lock:
+            if name in self._handlers:
+                return self._handlers[name]
+
+            spec = self.plugins[name]
+            module_path, _, attr_path = spec.target.partition(':')
+
+            start = time.perf_counter()
+            try:
+                module = importlib.import_module(module_path)
+
+                if '.' in attr_path:
+                    class_name, method_name = attr_path.split('.', 1)
+                    key = f"{module_path}:{class_name}"
+                    if key not in self._instances:
+                        self._instances[key] = getattr(module, class_name)()
+                    handler = getattr(self._instances[key], method_name)
+                else:
+                    handler = getattr(module, attr_path)
+            except Exception as e:
+                self._errors[name] = f"{type(e).__name__}: {e}"
+                logger.error(f"Failed to load plugin '{name}' ({spec.target}): {e}")
+                raise PluginLoadError(f"Plugin '{name}' is unavailable: {e}") from e
+
+            self._import_times[name] = time.perf_counter() - start
+            self._handlers[name] = handler
+            self._errors.pop(name, None)
+
+        logger.info(f"Loaded plugin '{name}' in {self._import_times[name] * 1000:.1f} ms")
+        return handler
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a plugin has been imported."""
+        return name in self._handlers
+
+    def import_report(self) -> List[Dict[str, Any]]:
+        """Import cost of each declared plugin.
+
+        Returns:
+            One entry per plugin with its target, load state, import
+            time in milliseconds (None if not yet loaded) and the last
+            load error (None if none)
+        """
+        report = []
+        for name, spec in self.plugins.items():
+            seconds = self._import_times.get(name)
+            report.append({
+                'plugin': name,
+                'target': spec.target,
+                'loaded': name in self._handlers,
+                'import_ms': None if seconds is None else seconds * 1000,
+                'error': self._errors.get(name)
+            })
+        return report
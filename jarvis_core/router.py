@@ -0,0 +1,132 @@
+"""Rules-first routing between local commands and the AI brain."""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IntentRouter:
+    """Serve turns locally when possible and escalate the rest to the LLM.
+
+    Every utterance is matched against the CommandProcessor (grammar,
+    triggers, fuzzy intents) first. Only when the local confidence is below
+    the threshold, or the local handler fails or raises, does the turn go
+    to the AI brain. Counters record how many turns each side served and how long
+    they took, so the threshold can be tuned against the latency saved.
+    """
+
+    def __init__(self, processor, ai_brain=None, threshold: float = 0.6):
+        """Initialize router.
+
+        Args:
+            processor: CommandProcessor for local commands
+            ai_brain: Object with get_response(text) (e.g. AIBrain), or None
+            threshold: Minimum local confidence to skip the LLM (0.0 to 1.0)
+        """
+        self.processor = processor
+        self.ai_brain = ai_brain
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zero the routing counters."""
+        with self._lock:
+            self._counts = {'local': 0, 'llm': 0, 'unhandled': 0, 'escalated': 0}
+            self._latency = {'local': 0.0, 'llm': 0.0}
+
+    def route(self, text: str) -> Dict[str, Any]:
+        """Answer an utterance locally or through the LLM.
+
+        Args:
+            text: User input text
+
+        Returns:
+            Dictionary with 'text', 'context', 'source' ("local", "llm" or
+            "none"), 'command', 'confidence', 'latency' and 'exit'
+        """
+        start = time.perf_counter()
+        match = self.processor.match(text)
+        confidence = match.confidence if match else 0.0
+
+        if match is not None and (confidence >= self.threshold or self.ai_brain is None):
+            try:
+                result = self.processor.execute(match, text)
+            except Exception as e:
+                logger.error(f"Local command '{match.command}' raised: {e}")
+                result = {'success': False}
+            if result['success']:
+                response = result['response']
+                return self._finish('local', start, {
+                    'text': response['text'],
+                    'context': response.get('context', 'neutral'),
+                    'command': match.command,
+                    'confidence': confidence,
+                    'exit': response.get('exit', False)
+                })
+            logger.info(f"Local command '{match.command}' failed, escalating")
+
+        if self.ai_brain is None:
+            with self._lock:
+                self._counts['unhandled'] += 1
+            return {
+                'text': "I do not understand that command.",
+                'context': 'error',
+                'source': 'none',
+                'command': None,
+                'confidence': confidence,
+                'latency': time.perf_counter() - start,
+                'exit': False
+            }
+
+        if match is not None:
+            with self._lock:
+                self._counts['escalated'] += 1
+            logger.info(f"Escalating to LLM: '{match.command}' confidence "
+                        f"{confidence:.2f} < {self.threshold:.2f}")
+
+        return self._finish('llm', start, {
+            'text': self.ai_brain.get_response(text),
+            'context': 'neutral',
+            'command': None,
+            'confidence': confidence,
+            'exit': False
+        })
+
+    def _finish(self, source: str, start: float, reply: Dict[str, Any]) -> Dict[str, Any]:
+        """Record counters for a served turn and annotate the reply."""
+        latency = time.perf_counter() - start
+        with self._lock:
+            self._counts[source] += 1
+            self._latency[source] += latency
+
+        reply['source'] = source
+        reply['latency'] = latency
+        logger.info(f"Turn served by {source} in {latency * 1000:.1f} ms")
+        return reply
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Routing counters.
+
+        Returns:
+            Turn counts per source, the number of matched turns escalated
+            for low confidence, the local share of served turns and the
+            mean latency (seconds) per source
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            latency = dict(self._latency)
+
+        served = counts['local'] + counts['llm']
+        return {
+            'local_turns': counts['local'],
+            'llm_turns': counts['llm'],
+            'unhandled_turns': counts['unhandled'],
+            'escalated_turns': counts['escalated'],
+            'local_ratio': counts['local'] / served if served else None,
+            'local_mean_latency': latency['local'] / counts['local'] if counts['local'] else None,
+            'llm_mean_latency': latency['llm'] / counts['llm'] if counts['llm'] else None,
+        }
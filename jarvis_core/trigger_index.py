@@ -0,0 +1,228 @@
+"""Multi-pattern trigger index for the command processor.
+
+Finds every registered trigger phrase in a single pass over the input
+using an Aho-Corasick automaton instead of testing each trigger in turn.
+"""
+
+import logging
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class TriggerMatch(NamedTuple):
+    """A trigger occurrence found in the input text."""
+    command: str
+    trigger: str
+    start: int
+    end: int
+    order: int
+
+
+class TriggerIndex:
+    """Aho-Corasick automaton over command trigger phrases.
+
+    The automaton is kept up to date as triggers are added and removed:
+    only the trie path of the changed trigger and the states whose failure
+    links lead to it are touched, so re-registering one command (e.g. a
+    reloaded plugin) costs nothing like a rebuild of the whole index.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        # Node 0 is the root. Each node has goto edges, its parent and the
+        # character leading to it, a failure link and the nodes failing over
+        # to it, the patterns ending exactly there, and the merged output
+        # including everything reachable by failure links. Freed node ids
+        # are reused.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._parent: List[int] = [0]
+        self._char: List[str] = ['']
+        self._fail: List[int] = [0]
+        self._fail_children: List[Set[int]] = [set()]
+        self._ends: List[List[int]] = [[]]
+        self._output: List[List[int]] = [[]]
+        self._free: List[int] = []
+        self._patterns: Dict[int, TriggerMatch] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def states(self) -> int:
+        """Number of live automaton states, root included."""
+        return len(self._goto) - len(self._free)
+
+    def add(self, command: str, trigger: str):
+        """Add a trigger phrase for a command.
+
+        Args:
+            command: Command name the trigger belongs to
+            trigger: Phrase to look for (matched case-insensitively)
+        """
+        trigger = trigger.lower()
+        if not trigger:
+            return
+
+        node = 0
+        for char in trigger:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = self._new_node(node, char)
+            node = next_node
+
+        pattern_id = self._next_order
+        self._next_order += 1
+        self._patterns[pattern_id] = TriggerMatch(command, trigger, 0, len(trigger), pattern_id)
+        self._ends[node].append(pattern_id)
+        for state in self._fail_subtree(node):
+            self._output[state].append(pattern_id)
+
+    def remove_command(self, command: str):
+        """Drop every trigger belonging to a command.
+
+        Args:
+            command: Command name to remove
+        """
+        removed = 0
+        for pattern_id, pattern in list(self._patterns.items()):
+            if pattern.command != command:
+                continue
+            removed += 1
+
+            node = self._find(pattern.trigger)
+            self._ends[node].remove(pattern_id)
+            for state in self._fail_subtree(node):
+                self._output[state].remove(pattern_id)
+            del self._patterns[pattern_id]
+
+            # Prune the branch the trigger no longer needs
+            while node and not self._goto[node] and not self._ends[node]:
+                parent = self._parent[node]
+                self._drop_node(node)
+                node = parent
+
+        if removed:
+            logger.debug(f"Removed {removed} triggers of '{command}': "
+                         f"{len(self._patterns)} triggers, {self.states} states left")
+
+    def _new_node(self, parent: int, char: str) -> int:
+        """Create the child of parent on char and link it into the automaton."""
+        if self._free:
+            node = self._free.pop()
+        else:
+            node = len(self._goto)
+            self._goto.append({})
+            self._parent.append(0)
+            self._char.append('')
+            self._fail.append(0)
+            self._fail_children.append(set())
+            self._ends.append([])
+            self._output.append([])
+
+        self._goto[parent][char] = node
+        self._parent[node] = parent
+        self._char[node] = char
+
+        # Longest proper suffix of the node's string that is already a state
+        fallback = parent
+        target = 0
+        while fallback:
+            fallback = self._fail[fallback]
+            if char in self._goto[fallback]:
+                target = self._goto[fallback][char]
+                break
+        self._link(node, target)
+        self._output[node] = list(self._output[target])
+
+        # A state now fails over to the new node if it is the char-child of
+        # a state whose failure chain reaches parent and it used to fail over
+        # to target. Below a state that has a char-child at all, the children
+        # already fail over to something at least as long, so stop there.
+        queue = deque(self._fail_children[parent])
+        while queue:
+            state = queue.popleft()
+            child = self._goto[state].get(char)
+            if child is None:
+                queue.extend(self._fail_children[state])
+            elif self._fail[child] == target:
+                self._link(child, node)
+
+        return node
+
+    def _drop_node(self, node: int):
+        """Remove a leaf without patterns, handing its failure children on."""
+        target = self._fail[node]
+        for state in list(self._fail_children[node]):
+            self._link(state, target)
+        self._fail_children[target].discard(node)
+
+        del self._goto[self._parent[node]][self._char[node]]
+        self._output[node] = []
+        self._free.append(node)
+
+    def _link(self, node: int, target: int):
+        """Point the failure link of node at target."""
+        self._fail_children[self._fail[node]].discard(node)
+        self._fail[node] = target
+        self._fail_children[target].add(node)
+
+    def _fail_subtree(self, node: int) -> List[int]:
+        """The node and every state whose failure chain passes through it."""
+        states = [node]
+        queue = deque([node])
+        while queue:
+            for child in self._fail_children[queue.popleft()]:
+                states.append(child)
+                queue.append(child)
+        return states
+
+    def _find(self, trigger: str) -> int:
+        """State reached by following trie edges for a stored trigger."""
+        node = 0
+        for char in trigger:
+            node = self._goto[node][char]
+        return node
+
+    def find_all(self, text: str) -> List[TriggerMatch]:
+        """Find every trigger occurrence in the text.
+
+        Args:
+            text: Input text (lowercased internally)
+
+        Returns:
+            Matches in order of their end position
+        """
+        matches = []
+        node = 0
+        for pos, char in enumerate(text.lower()):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+
+            for pattern_id in self._output[node]:
+                pattern = self._patterns[pattern_id]
+                end = pos + 1
+                matches.append(pattern._replace(start=end - len(pattern.trigger), end=end))
+
+        return matches
+
+    def best_match(self, text: str) -> Optional[TriggerMatch]:
+        """Return the most specific trigger found in the text.
+
+        The longest trigger wins; ties go to the trigger registered first,
+        so the result does not depend on where in the text it occurs.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Winning match, or None if no trigger occurs
+        """
+        best = None
+        for match in self.find_all(text):
+            if best is None or (len(match.trigger), -match.order) > (len(best.trigger), -best.order):
+                best = match
+        return best
@@ -12,6 +12,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from ui.main_window import MainWindow
 from voice_activation.continuous_listener import ContinuousListener
 from jarvis_core.assistant import JarvisAssistant
+from jarvis_core.router import IntentRouter
+from jarvis_core.model_registry import memory_budget, models
 from voice_synthesis.aizen_voice import AizenVoice
 
 # Import new features
@@ -51,6 +53,10 @@ class EnhancedJarvisApp:
             logging.info("AI brain initialized")
         else:
             self.ai_brain = None
+        
+        # Local commands first, LLM only for low-confidence turns
+        threshold = self.assistant.config.get('ai', {}).get('local_confidence_threshold', 0.6)
+        self.router = IntentRouter(self.assistant.commands, self.ai_brain, threshold)
             
         # Voice recognition (if available)
         if WHISPER_AVAILABLE:
@@ -98,18 +104,20 @@ class EnhancedJarvisApp:
         return self.qt_app.exec_()
         
     def process_voice_command(self, text: str):
-        """Process voice command with AI."""
-        if self.ai_brain:
-            response = self.ai_brain.get_response(text)
-            self.voice.speak(response)
-            self.window.add_message("You", text)
-            self.window.add_message("Aizen", response)
-        else:
-            # Fallback to basic command processing
-            result = self.assistant.process_text_input(text)
+        """Process voice command, escalating to the AI only when needed."""
+        reply = self.router.route(text)
+        response = self.voice.respond_with_personality(reply['text'], reply['context'])
+        
+        self.voice.speak(response)
+        self.window.add_message("You", text)
+        self.window.add_message("Aizen", response)
         
     def cleanup(self):
         """Cleanup resources."""
+        logging.info(f"Routing stats: {self.router.stats()}")
+        models.log_memory_report()
+        logging.info(f"Model residency: {memory_budget.residency()}")
+        
         if self.voice_thread:
             self.voice_thread.stop()
             self.voice_thread.wait()
@@ -97,6 +97,8 @@ def main():
                 print(f"\nYou: {cmd}")
                 assistant.process_text_input(cmd)
             
+            assistant.voice.wait()
+            
         elif args.mode == 'voice':
             # Voice mode (not yet implemented)
             assistant.run_voice_mode()
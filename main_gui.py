@@ -4,18 +4,24 @@ This is the new main entry point with visual UI and wake word detection.
 """
 
 import sys
+import queue
 import logging
 import argparse
 from pathlib import Path
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
+import numpy as np
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from ui.main_window import MainWindow
+from voice_activation.capture import CaptureHub
 from voice_activation.continuous_listener import ContinuousListener
+from voice_activation.speech_recognition import WhisperRecognizer
+from voice_activation.vad import frame_level_db
 from jarvis_core.assistant import JarvisAssistant
+from jarvis_core.model_registry import memory_budget, models
 from voice_synthesis.aizen_voice import AizenVoice
 
 
@@ -24,27 +30,74 @@ class VoiceThread(QThread):
     
     wake_word_detected = pyqtSignal()
     command_received = pyqtSignal(str)
+    partial_transcript = pyqtSignal(str)
     
-    def __init__(self):
+    def __init__(self, tts_engine=None, recognizer=None, capture=None, config_path="config.yaml"):
         super().__init__()
         self.listener = None
+        self.tts_engine = tts_engine
+        self.recognizer = recognizer
+        self.capture = capture
+        self.config_path = config_path
         
     def run(self):
         """Run voice listener in thread."""
-        self.listener = ContinuousListener()
+        self.listener = ContinuousListener(self.config_path, capture=self.capture)
         self.listener.set_wake_word_callback(self._on_wake_word)
+        if self.tts_engine is not None:
+            self.listener.set_speech_output(self.tts_engine)
+        if self.recognizer is not None:
+            self.listener.set_recognizer(self.recognizer)
+            self.listener.set_command_callback(self._on_command)
+            self.listener.set_partial_callback(self.partial_transcript.emit)
         self.listener.start()
         
     def _on_wake_word(self):
         """Handle wake word detection."""
         self.wake_word_detected.emit()
         
+    def _on_command(self, text: str):
+        """Handle a transcribed command."""
+        self.command_received.emit(text)
+        
     def stop(self):
         """Stop voice listener."""
         if self.listener:
             self.listener.stop()
 
 
+class CommandThread(QThread):
+    """Thread that runs commands so slow handlers do not freeze the UI."""
+    
+    command_done = pyqtSignal(bool)
+    
+    def __init__(self, assistant):
+        super().__init__()
+        self.assistant = assistant
+        self.commands = queue.Queue()
+        
+    def run(self):
+        """Process submitted commands in order until stopped."""
+        while True:
+            text = self.commands.get()
+            if text is None:
+                return
+            try:
+                keep_running = self.assistant.process_text_input(text)
+            except Exception as e:
+                logging.error(f"Command failed: {e}", exc_info=True)
+                keep_running = True
+            self.command_done.emit(keep_running)
+            
+    def submit(self, text: str):
+        """Queue a command; command_done is emitted when it has run."""
+        self.commands.put(text)
+        
+    def stop(self):
+        """Stop after the commands already queued."""
+        self.commands.put(None)
+
+
 class JarvisApp:
     """Main application controller."""
     
@@ -62,8 +115,15 @@ class JarvisApp:
         self.voice = AizenVoice(config_path)
         self.assistant = JarvisAssistant(config_path)
         
-        # Voice thread
+        # Voice thread, and the thread that runs recognized commands
         self.voice_thread = None
+        self.command_thread = None
+        self.recognizer = None
+        
+        # Microphone capture shared by the listener and the visualizer
+        self.capture = None
+        self.level_feed = None
+        self.level_timer = None
         
         # Connect UI signals
         self._connect_signals()
@@ -98,13 +158,40 @@ class JarvisApp:
         """Start voice activation system."""
         logging.info("Starting voice activation...")
         
-        self.voice_thread = VoiceThread()
+        self.capture = CaptureHub.from_config(self.window.config)
+        
+        # Drive the visualizer from the captured audio
+        self.level_feed = self.capture.subscribe('visualizer', 0.5)
+        self.level_frame = np.zeros(self.capture.frame_length, dtype=np.int16)
+        self.level_timer = QTimer()
+        self.level_timer.timeout.connect(self._update_audio_level)
+        self.level_timer.start(50)
+        
+        self.command_thread = CommandThread(self.assistant)
+        self.command_thread.command_done.connect(self._on_command_done)
+        self.command_thread.start()
+        
+        self.recognizer = WhisperRecognizer(self.config_path)
+        self.voice_thread = VoiceThread(self.voice.tts_engine, self.recognizer,
+                                        self.capture, self.config_path)
         self.voice_thread.wake_word_detected.connect(self._on_wake_word)
+        self.voice_thread.command_received.connect(self._on_command)
+        self.voice_thread.partial_transcript.connect(self._on_partial_transcript)
         self.voice_thread.start()
         
         self.window.set_status("🎤 Listening for wake word...")
         self.window.add_message("System", "Voice activation enabled. Say 'Jarvis' to activate.")
         
+    def _update_audio_level(self):
+        """Show the loudest frame captured since the last update."""
+        level = None
+        while self.level_feed.read_into(self.level_frame, 0):
+            # -60 dBFS and below is shown as silence
+            frame_level = (frame_level_db(self.level_frame) + 60) / 60
+            level = frame_level if level is None else max(level, frame_level)
+        if level is not None:
+            self.window.update_audio_level(level)
+        
     def _on_wake_word(self):
         """Handle wake word detection."""
         logging.info("Wake word detected!")
@@ -112,12 +199,31 @@ class JarvisApp:
         self.window.set_listening(True)
         self.window.add_message("System", "Wake word detected!")
         
-        # Play activation sound
-        self.voice.speak("Yes?")
+        # The listener is already recording the command (including what was
+        # said right after the wake word); no spoken prompt to talk over it
+        self.window.set_status("🎤 Listening for command...")
+        
+    def _on_partial_transcript(self, text: str):
+        """Show the command transcribed so far while it is spoken."""
+        self.window.set_status(f"🎤 {text}...")
+        
+    def _on_command(self, text: str):
+        """Handle a command transcribed after the wake word."""
+        logging.info(f"Voice command: {text}")
         
-        # TODO: Start recording and transcribing user command
-        # For now, just show the state
         self.window.set_listening(False)
+        self.window.add_message("You", text)
+        self.window.set_status("⚙️ Working...")
+        
+        # Handlers may block up to their timeout; keep the event loop free
+        self.command_thread.submit(text)
+        
+    def _on_command_done(self, keep_running: bool):
+        """Handle a command finishing on the command thread."""
+        if not keep_running:
+            self.qt_app.quit()
+            return
+            
         self.window.set_status("🎤 Listening for wake word...")
         
     def cleanup(self):
@@ -125,6 +231,27 @@ class JarvisApp:
         if self.voice_thread:
             self.voice_thread.stop()
             self.voice_thread.wait()
+        if self.command_thread:
+            self.command_thread.stop()
+            self.command_thread.wait()
+        if self.recognizer:
+            # Drop the Whisper model from the registry
+            self.recognizer.close()
+        
+        if self.level_timer:
+            self.level_timer.stop()
+        if self.capture:
+            self.capture.stop()
+        
+        # Both hold a reference to the shared TTS engine; the model is
+        # freed once the last one is released
+        self.voice.close()
+        self.assistant.voice.close()
+        self.assistant.commands.shutdown()
+        
+        # Anything still listed here was not released
+        models.log_memory_report()
+        logging.info(f"Model residency: {memory_budget.residency()}")
 
 
 def setup_logging(verbose: bool = False):
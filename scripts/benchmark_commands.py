@@ -0,0 +1,124 @@
+"""Benchmark command trigger matching.
+
+Compares the compiled trigger index used by CommandProcessor against the
+old nested loop (every trigger of every command tested with `in`), and
+times slot extraction with the default command grammar.
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jarvis_core.trigger_index import TriggerIndex
+from jarvis_core.grammar import CommandGrammar
+from jarvis_core.plugins import DEFAULT_APPS, DEFAULT_PLUGINS
+
+
+def make_triggers(num_triggers: int, seed: int = 0) -> dict:
+    """Generate random multi-word triggers grouped into commands."""
+    rng = random.Random(seed)
+    words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+             for _ in range(2000)]
+
+    commands = {}
+    for i in range(num_triggers):
+        name = f"cmd_{i // 5}"
+        trigger = ' '.join(rng.choices(words, k=rng.randint(2, 4)))
+        commands.setdefault(name, []).append(trigger)
+    return commands, words
+
+
+def nested_loop_match(commands: dict, text: str):
+    """The original CommandProcessor matching loop."""
+    for name, triggers in commands.items():
+        for trigger in triggers:
+            if trigger in text:
+                return name
+    return None
+
+
+def benchmark(num_triggers: int, num_queries: int):
+    """Run both matchers over the same queries and print timings."""
+    commands, words = make_triggers(num_triggers)
+    rng = random.Random(1)
+
+    queries = []
+    all_triggers = [t for triggers in commands.values() for t in triggers]
+    for i in range(num_queries):
+        filler = ' '.join(rng.choices(words, k=8))
+        if i % 2 == 0:
+            # Hit: embed a real trigger in the sentence
+            queries.append(f"{filler} {rng.choice(all_triggers)} please")
+        else:
+            # Miss: the common case for free-form LLM questions
+            queries.append(f"{filler} tell me something")
+
+    start = time.perf_counter()
+    index = TriggerIndex()
+    for name, triggers in commands.items():
+        for trigger in triggers:
+            index.add(name, trigger)
+    build_time = time.perf_counter() - start
+
+    # Re-registering one command, as a plugin reload does
+    name, triggers = next(iter(commands.items()))
+    start = time.perf_counter()
+    index.remove_command(name)
+    for trigger in triggers:
+        index.add(name, trigger)
+    reload_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loop_hits = sum(nested_loop_match(commands, q) is not None for q in queries)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index_hits = sum(index.best_match(q) is not None for q in queries)
+    index_time = time.perf_counter() - start
+
+    print(f"\n📊 {num_triggers} triggers, {num_queries} queries")
+    print(f"   Index build:  {build_time * 1000:8.1f} ms")
+    print(f"   Re-register:  {reload_time * 1000:8.3f} ms ({len(triggers)} triggers)")
+    print(f"   Nested loop:  {loop_time / num_queries * 1e6:8.1f} µs/query ({loop_hits} hits)")
+    print(f"   Trigger index:{index_time / num_queries * 1e6:8.1f} µs/query ({index_hits} hits)")
+    print(f"   Speedup:      {loop_time / index_time:8.1f}x")
+
+
+def benchmark_grammar(num_queries: int):
+    """Time slot extraction with the default system-control grammar."""
+    grammar = CommandGrammar()
+    grammar.set_choices('app', DEFAULT_APPS)
+    for spec in DEFAULT_PLUGINS:
+        for pattern in spec.patterns or []:
+            grammar.add(spec.name, pattern)
+
+    queries = ["set the volume to 40 percent", "open notepad", "lock the screen",
+               "what is the meaning of life"]
+
+    start = time.perf_counter()
+    for i in range(num_queries):
+        grammar.match(queries[i % len(queries)])
+    elapsed = time.perf_counter() - start
+
+    print(f"\n📊 Slot grammar, {len(grammar)} templates, {num_queries} queries")
+    print(f"   Parse:        {elapsed / num_queries * 1e6:8.1f} µs/query")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark command trigger matching')
+    parser.add_argument('--triggers', type=int, default=10000, help='Number of triggers')
+    parser.add_argument('--queries', type=int, default=1000, help='Number of queries')
+    args = parser.parse_args()
+
+    benchmark(args.triggers, args.queries)
+    benchmark_grammar(args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark Coqui speaker conditioning with and without the latent cache.
+
+Synthesizes the same sentence several times with the configured voice
+model and reference clip, first calling the model's conditioning hook
+directly (as Coqui does on every utterance), then through a
+SpeakerLatentCache in a temporary directory. Reported per pass:
+
+    - conditioning time per utterance (the hook itself when uncached,
+      the cache lookup when cached)
+    - synthesis time per utterance, conditioning included
+
+Needs Coqui TTS and the reference audio named in config.yaml.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_synthesis.speaker_latents import SpeakerLatentCache
+
+
+def timed(owner, method_name: str, times: list):
+    """Replace owner.method_name with a version recording its duration."""
+    original = getattr(owner, method_name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            times.append(time.perf_counter() - start)
+
+    setattr(owner, method_name, wrapper)
+    return original
+
+
+def synthesize(model, kwargs: dict, runs: int) -> list:
+    """Seconds per model.tts() call."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        model.tts(**kwargs)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(label: str, conditioning: list, synthesis: list):
+    print(f"   {label:<10} conditioning mean {np.mean(conditioning) * 1000:8.1f} ms   "
+          f"synthesis mean {np.mean(synthesis) * 1000:8.0f} ms   ({len(synthesis)} utterances)")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark the speaker latent cache')
+    parser.add_argument('--config', default='config.yaml', help='Configuration file')
+    parser.add_argument('--runs', type=int, default=5, help='Utterances per pass')
+    parser.add_argument('--text', default="Since when were you under the impression that I wasn't.",
+                        help='Sentence to synthesize')
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as f:
+        voice = yaml.safe_load(f)['voice']
+    reference = voice.get('reference_audio')
+    if not reference or not Path(reference).exists():
+        print(f"❌ Reference audio not found: {reference}")
+        return 1
+
+    try:
+        from TTS.api import TTS
+    except ImportError:
+        print("❌ Coqui TTS not installed. Install with: pip install TTS")
+        return 1
+
+    model = TTS(voice['voice_model'])
+    hook = SpeakerLatentCache.conditioning_hook(model)
+    if hook is None:
+        print(f"❌ {voice['voice_model']} has no speaker conditioning to cache")
+        return 1
+    owner, method_name, _ = hook
+    kwargs = {'text': args.text, 'speaker_wav': reference, 'language': voice.get('language', 'en')}
+
+    print(f"\n📊 {voice['voice_model']}, reference {Path(reference).name}, "
+          f"{type(owner).__name__}.{method_name}")
+
+    # Uncached: the hook runs for every utterance
+    hook_times = []
+    original = timed(owner, method_name, hook_times)
+    synthesis = synthesize(model, kwargs, args.runs)
+    report("Uncached:", hook_times, synthesis)
+
+    # Cached: the first utterance computes, the rest reuse
+    setattr(owner, method_name, original)
+    cache = SpeakerLatentCache(tempfile.mkdtemp(), model_name=voice['voice_model'])
+    cache.install(model)
+    synthesis = synthesize(model, kwargs, args.runs)
+    report("Cached:", cache.compute_times + cache.reuse_times, synthesis)
+
+    stats = cache.stats()
+    print(f"\n   Cache: {stats['computed']} computed ({stats['compute_mean_ms'] or 0:.0f} ms), "
+          f"{stats['reused']} reused ({stats['reuse_mean_ms'] or 0:.2f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
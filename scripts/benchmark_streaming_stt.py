@@ -0,0 +1,169 @@
+"""Benchmark streaming against batch Whisper transcription.
+
+Each clip is fed to a StreamingTranscriber in real time, frame by frame,
+followed by the silence the endpointer waits for before it ends a
+command. Then the same audio is transcribed in one go, as happens without
+streaming. Reported per clip:
+
+    - finalization latency: time from the end of the recording until
+      the text is ready (finish() for streaming, transcribe() for batch)
+    - real-time factor: decode time over audio time (streaming decodes
+      overlapping windows, so it spends more CPU in total)
+    - when the first partial hypothesis arrived
+    - how much audio the final streaming decode covered (the uncommitted
+      tail; committed audio is dropped as words settle)
+    - word error rate against a reference transcript (<clip>.txt next to
+      the WAV file), or against the batch transcript if there is none
+
+Clips must be 16 kHz mono WAV files.
+"""
+
+import argparse
+import re
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_activation.speech_recognition import WhisperRecognizer
+from voice_activation.streaming_recognizer import StreamingTranscriber
+
+SAMPLE_RATE = 16000
+FRAME_LENGTH = 512
+
+
+def load_clip(path: Path) -> np.ndarray:
+    with wave.open(str(path), 'rb') as wav:
+        if wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1:
+            raise ValueError(f"{path}: expected {SAMPLE_RATE} Hz mono")
+        return np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level edit distance over the reference length."""
+    ref = re.findall(r"[\w']+", reference.lower())
+    hyp = re.findall(r"[\w']+", hypothesis.lower())
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    row = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        previous, row[0] = row[0], i
+        for j, h in enumerate(hyp, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (r != h))
+    return row[-1] / len(ref)
+
+
+def stream_clip(recognizer, audio: np.ndarray, language: str, step: float,
+                window: float) -> tuple:
+    """Feed a clip in real time.
+
+    Returns:
+        Transcript, stream stats, seconds until the first partial
+    """
+    partials = []
+    started = time.perf_counter()
+    stream = StreamingTranscriber(
+        recognizer, language, SAMPLE_RATE, step_seconds=step, window_seconds=window,
+        on_partial=lambda text: partials.append(time.perf_counter() - started)
+    )
+
+    frame_seconds = FRAME_LENGTH / SAMPLE_RATE
+    for i in range(0, len(audio), FRAME_LENGTH):
+        stream.feed(audio[i:i + FRAME_LENGTH])
+        # Wait for the capture to deliver the next frame
+        delay = started + (i // FRAME_LENGTH + 1) * frame_seconds - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    text = stream.finish()
+    return text, stream.stats(), partials[0] if partials else None
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark streaming vs batch transcription')
+    parser.add_argument('clips', nargs='+', help='16 kHz mono WAV files or directories of them')
+    parser.add_argument('--config', default='config.yaml', help='Configuration file')
+    parser.add_argument('--step', type=float, help='Seconds of new audio between decodes')
+    parser.add_argument('--window', type=float, help='Longest uncommitted tail in seconds')
+    parser.add_argument('--trailing-silence', type=float,
+                        help='Silence fed after each clip (default: endpoint_hangover_ms)')
+    args = parser.parse_args()
+
+    files = []
+    for clip in map(Path, args.clips):
+        files += sorted(clip.glob('*.wav')) if clip.is_dir() else [clip]
+    if not files:
+        print("❌ No WAV files given")
+        return 1
+
+    with open(args.config, 'r') as f:
+        settings = yaml.safe_load(f).get('speech_recognition', {})
+    language = settings.get('language', 'en')
+    step = args.step or settings.get('stream_step_seconds', 1.0)
+    window = args.window or settings.get('stream_window_seconds', 5)
+    trailing = args.trailing_silence
+    if trailing is None:
+        trailing = settings.get('endpoint_hangover_ms', 700) / 1000
+
+    recognizer = WhisperRecognizer(args.config)
+    if recognizer.model is None:
+        print("❌ Whisper model could not be loaded")
+        return 1
+
+    print(f"\n🎙️  {len(files)} clips, model {settings.get('model_size', 'base')}, "
+          f"step {step:.1f} s, window {window:.0f} s, {trailing:.1f} s trailing silence")
+    print(f"\n{'Clip':<24} {'Audio':>6} {'Batch':>8} {'Stream':>8} {'RTF b/s':>11} "
+          f"{'1st partial':>11} {'WER b/s':>11}")
+
+    totals = {'audio': 0.0, 'batch_decode': 0.0, 'stream_decode': 0.0}
+    batch_latencies, stream_latencies, final_windows = [], [], []
+    for path in files:
+        audio = np.concatenate([load_clip(path), np.zeros(int(trailing * SAMPLE_RATE), np.int16)])
+        audio_seconds = len(audio) / SAMPLE_RATE
+
+        text, stats, first_partial = stream_clip(recognizer, audio, language, step, window)
+
+        started = time.perf_counter()
+        batch_text = recognizer.transcribe(audio.astype(np.float32) / 32768.0, language) or ''
+        batch_seconds = time.perf_counter() - started
+
+        reference_path = path.with_suffix('.txt')
+        reference = reference_path.read_text() if reference_path.exists() else batch_text
+        stream_decode = stats['real_time_factor'] * audio_seconds
+
+        totals['audio'] += audio_seconds
+        totals['batch_decode'] += batch_seconds
+        totals['stream_decode'] += stream_decode
+        batch_latencies.append(batch_seconds)
+        stream_latencies.append(stats['finalize_seconds'])
+        final_windows.append(stats['final_window_seconds'] or 0.0)
+
+        partial = f"{first_partial:9.2f} s" if first_partial is not None else f"{'-':>11}"
+        print(f"{path.name[:24]:<24} {audio_seconds:5.1f}s "
+              f"{batch_seconds * 1000:6.0f}ms {stats['finalize_seconds'] * 1000:6.0f}ms "
+              f"{batch_seconds / audio_seconds:5.2f}/{stats['real_time_factor']:<5.2f} {partial} "
+              f"{word_error_rate(reference, batch_text):5.2f}/{word_error_rate(reference, text):<5.2f}")
+        if reference_path.exists() or text != batch_text:
+            print(f"   stream: {text}")
+
+    print(f"\n📊 Finalization latency (median): batch {np.median(batch_latencies) * 1000:.0f} ms, "
+          f"streaming {np.median(stream_latencies) * 1000:.0f} ms")
+    print(f"   Real-time factor: batch {totals['batch_decode'] / totals['audio']:.2f}, "
+          f"streaming {totals['stream_decode'] / totals['audio']:.2f}")
+    print(f"   Final streaming decode (median): {np.median(final_windows):.1f} s of audio, "
+          f"clips average {totals['audio'] / len(files):.1f} s")
+    print("\n   Batch/Stream: time from the end of the recording until the text is ready")
+    print("   RTF: decode time over audio time (below 1 keeps up with live speech)")
+    print("   WER: against <clip>.txt when present, otherwise against the batch transcript")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
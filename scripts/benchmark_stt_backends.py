@@ -0,0 +1,141 @@
+"""Compare speech recognition backends on a fixed set of local clips.
+
+Every backend in speech_recognition (whisper, whisper-int8,
+faster-whisper) transcribes the same clips with the configured model
+size. Reported per backend:
+
+    - load time and the resident memory the loaded model adds
+    - peak resident memory of the whole run
+    - real-time factor: decode time over audio time (one untimed warm-up
+      transcription first)
+    - word error rate against reference transcripts (<clip>.txt next to
+      each 16 kHz mono WAV file)
+
+Each backend runs in a fresh process, so memory figures are not skewed
+by models loaded before it.
+"""
+
+import argparse
+import json
+import re
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmark_streaming_stt import SAMPLE_RATE, load_clip, word_error_rate
+from voice_activation.speech_recognition import BACKENDS, WhisperRecognizer, create_backend
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def rss_mb() -> float:
+    return psutil.Process().memory_info().rss / 2 ** 20
+
+
+def run_backend(name: str, config_path: str, files: list) -> dict:
+    """Load one backend and transcribe every clip (runs in the child process)."""
+    with open(config_path, 'r') as f:
+        settings = yaml.safe_load(f).get('speech_recognition', {})
+    language = settings.get('language', 'en')
+    clips = [(load_clip(path).astype(np.float32) / 32768.0, path) for path in files]
+
+    baseline = rss_mb() if PSUTIL_AVAILABLE else None
+    started = time.perf_counter()
+    recognizer = WhisperRecognizer(config_path, backend=create_backend(dict(settings, engine=name)))
+    if recognizer.model is None:
+        raise RuntimeError("model could not be loaded")
+    load_seconds = time.perf_counter() - started
+    model_mb = rss_mb() - baseline if baseline is not None else None
+
+    recognizer.transcribe(clips[0][0], language)
+
+    audio_seconds = decode_seconds = 0.0
+    errors = reference_words = 0.0
+    for audio, path in clips:
+        started = time.perf_counter()
+        text = recognizer.transcribe(audio, language) or ''
+        decode_seconds += time.perf_counter() - started
+        audio_seconds += len(audio) / SAMPLE_RATE
+
+        reference_path = path.with_suffix('.txt')
+        if reference_path.exists():
+            reference = reference_path.read_text()
+            words = len(re.findall(r"[\w']+", reference))
+            errors += word_error_rate(reference, text) * words
+            reference_words += words
+
+    return {
+        'load_seconds': load_seconds,
+        'model_mb': model_mb,
+        # ru_maxrss is in KiB on Linux
+        'peak_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'real_time_factor': decode_seconds / audio_seconds,
+        'wer': errors / reference_words if reference_words else None
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Compare speech recognition backends')
+    parser.add_argument('clips', nargs='+', help='16 kHz mono WAV files or directories of them')
+    parser.add_argument('--config', default='config.yaml', help='Configuration file')
+    parser.add_argument('--engines', nargs='+', default=list(BACKENDS), help='Backends to compare')
+    parser.add_argument('--single', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    files = []
+    for clip in map(Path, args.clips):
+        files += sorted(clip.glob('*.wav')) if clip.is_dir() else [clip]
+    if not files:
+        print("❌ No WAV files given")
+        return 1
+
+    if args.single:
+        print(json.dumps(run_backend(args.single, args.config, files)))
+        return 0
+
+    with open(args.config, 'r') as f:
+        settings = yaml.safe_load(f).get('speech_recognition', {})
+    audio_seconds = sum(len(load_clip(path)) for path in files) / SAMPLE_RATE
+    references = sum(path.with_suffix('.txt').exists() for path in files)
+    print(f"\n🎙️  {len(files)} clips, {audio_seconds:.0f} s of audio, {references} with references, "
+          f"model {settings.get('model_size', 'base')}")
+    print(f"\n{'Engine':<16} {'Load':>6} {'Model':>8} {'Peak':>8} {'RTF':>6} {'WER':>6}")
+
+    for name in args.engines:
+        child = subprocess.run(
+            [sys.executable, __file__, *map(str, files), '--config', args.config, '--single', name],
+            capture_output=True, text=True
+        )
+        if child.returncode != 0:
+            # The recognizer logs why loading failed before the traceback
+            lines = child.stderr.strip().splitlines() or ['failed']
+            reason = next((line for line in lines if 'Failed to load' in line), lines[-1])
+            print(f"{name:<16} ⚠️  skipped: {reason}")
+            continue
+
+        result = json.loads(child.stdout.strip().splitlines()[-1])
+        wer = f"{result['wer'] * 100:5.1f}%" if result['wer'] is not None else f"{'-':>6}"
+        model = f"{result['model_mb']:6.0f}MB" if result['model_mb'] is not None else f"{'-':>8}"
+        print(f"{name:<16} {result['load_seconds']:5.1f}s {model} "
+              f"{result['peak_mb']:6.0f}MB {result['real_time_factor']:6.2f} {wer}")
+
+    print("\n   Model: resident memory added by loading the model; Peak: whole process")
+    print("   RTF: decode time over audio time (lower is faster, below 1 keeps up with speech)")
+    print("   WER: against <clip>.txt references")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Benchmark the handoff from synthesis to audible playback.
+
+Compares the old path (write a temp WAV, initialize pygame's mixer, load
+the file back and play it) against in-memory playback through the
+persistent AudioOutput stream. Uses a synthetic clip, so no TTS model is
+needed, but an audio output device is.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_synthesis.audio_output import AudioClip, AudioOutput, SOUNDDEVICE_AVAILABLE, encode_wav
+
+
+def make_clip(duration_ms: int, samplerate: int = 22050) -> AudioClip:
+    """A quiet sine tone standing in for synthesized speech."""
+    t = np.arange(int(samplerate * duration_ms / 1000)) / samplerate
+    return AudioClip((0.05 * np.sin(2 * np.pi * 220 * t)).astype(np.float32), samplerate)
+
+
+def benchmark_file_round_trip(clip: AudioClip, runs: int):
+    """Time the temp-file path up to the start of playback."""
+    path = os.path.join(tempfile.mkdtemp(), "temp_speech.wav")
+
+    try:
+        import pygame
+    except ImportError:
+        pygame = None
+        print("⚠️  pygame not installed, timing only the disk round trip")
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        with open(path, 'wb') as f:
+            f.write(encode_wav(clip.data, clip.samplerate))
+
+        if pygame is not None:
+            pygame.mixer.init()
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.play()
+            times.append(time.perf_counter() - start)
+            while pygame.mixer.music.get_busy():
+                time.sleep(0.01)
+        else:
+            with open(path, 'rb') as f:
+                f.read()
+            times.append(time.perf_counter() - start)
+
+    return times
+
+
+def benchmark_in_memory(clip: AudioClip, runs: int):
+    """Time persistent-stream playback until the first samples are output."""
+    output = AudioOutput()
+    times = []
+    for _ in range(runs):
+        latency = output.play(clip)
+        if latency is not None:
+            times.append(latency)
+    output.close()
+    return times
+
+
+def report(label: str, times):
+    if not times:
+        print(f"   {label:<18} n/a")
+        return
+    print(f"   {label:<18} mean {np.mean(times) * 1000:7.2f} ms   "
+          f"p95 {np.percentile(times, 95) * 1000:7.2f} ms")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark TTS playback handoff')
+    parser.add_argument('--runs', type=int, default=20, help='Clips to play per method')
+    parser.add_argument('--clip-ms', type=int, default=300, help='Clip length in milliseconds')
+    args = parser.parse_args()
+
+    clip = make_clip(args.clip_ms)
+    print(f"\n📊 Synthesis-to-audio handoff, {args.runs} × {args.clip_ms} ms clips")
+
+    report("Temp file:", benchmark_file_round_trip(clip, args.runs))
+
+    if SOUNDDEVICE_AVAILABLE:
+        report("In-memory stream:", benchmark_in_memory(clip, args.runs))
+    else:
+        print("❌ sounddevice not installed, cannot time the in-memory stream")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Benchmark the VAD gate in front of the wake word engine.
+
+Streams a corpus of WAV recordings through the configured wake word
+engine (built as the listener builds it) frame by frame, once without a
+gate and once per gate setting, and reports the share of frames that
+reached the engine, the CPU cost relative to real time, and
+how many files still produced a detection. A synthetic room-noise clip
+is measured as well to show the idle cost when nobody is talking.
+"""
+
+import argparse
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_activation.vad import SpeechGate, WEBRTCVAD_AVAILABLE
+from voice_activation.wake_engines import KeywordSpec, create_engine
+
+SAMPLE_RATE = 16000
+FRAME_LENGTH = 512
+
+
+def load_wav(path: Path, sample_rate: int) -> np.ndarray:
+    """Read a 16-bit WAV file as mono int16 at sample_rate."""
+    with wave.open(str(path), 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path.name}: only 16-bit WAV is supported")
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+
+    samples = samples.astype(np.float32)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if rate != sample_rate:
+        positions = np.arange(0, len(samples), rate / sample_rate)
+        samples = np.interp(positions, np.arange(len(samples)), samples)
+    return samples.astype(np.int16)
+
+
+def room_noise(seconds: float, level_db: float, sample_rate: int) -> np.ndarray:
+    """Gaussian noise at a given RMS level, standing in for an idle room."""
+    rng = np.random.default_rng(0)
+    rms = 32768.0 * 10 ** (level_db / 20)
+    return np.clip(rng.normal(0, rms, int(seconds * sample_rate)), -32768, 32767).astype(np.int16)
+
+
+def run(clip: np.ndarray, engine, gate_config: dict, frame_length: int) -> tuple:
+    """Stream one clip through the gate and engine.
+
+    Returns:
+        CPU seconds, frames seen, frames processed, detections
+    """
+    gate = SpeechGate.from_config(gate_config, SAMPLE_RATE, frame_length) if gate_config else None
+    frames = len(clip) // frame_length
+    processed = 0
+    detections = 0
+    if engine is not None:
+        # Nothing heard in the previous clip may carry over
+        engine.reset()
+
+    cpu_start = time.process_time()
+    for i in range(frames):
+        frame = clip[i * frame_length:(i + 1) * frame_length]
+        batch = [frame]
+        if gate is not None:
+            if not gate.admit(frame):
+                continue
+            batch = list(gate.take_backlog()) + batch
+
+        for pcm in batch:
+            processed += 1
+            if engine is not None and engine.process(pcm) >= 0:
+                detections += 1
+    cpu = time.process_time() - cpu_start
+
+    return cpu, frames, processed, detections
+
+
+def gate_settings(args) -> list:
+    """(label, voice_activation config) pairs to compare."""
+    common = {'vad_hangover_ms': args.hangover_ms, 'vad_lookback_ms': args.lookback_ms}
+    settings = [("no gate", None)]
+    for threshold in args.thresholds:
+        settings.append((f"energy {threshold:g} dBFS",
+                         dict(common, vad_gate='energy', vad_threshold_db=threshold)))
+    if WEBRTCVAD_AVAILABLE:
+        for level in args.aggressiveness:
+            settings.append((f"webrtc level {level}",
+                             dict(common, vad_gate='webrtc', vad_aggressiveness=level)))
+    return settings
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark the wake word VAD gate')
+    parser.add_argument('corpus', nargs='?', help='Directory of WAV recordings')
+    parser.add_argument('--config', default='config.yaml', help='Configuration file')
+    parser.add_argument('--engine', help='Wake word engine (default: voice_activation.engine)')
+    parser.add_argument('--keyword', help='Keyword to detect (default: the configured ones)')
+    parser.add_argument('--sensitivity', type=float, help='Sensitivity (default: configured)')
+    parser.add_argument('--thresholds', type=float, nargs='+', default=[-55, -50, -45],
+                        help='Energy gate thresholds in dBFS')
+    parser.add_argument('--aggressiveness', type=int, nargs='+', default=[1, 2, 3],
+                        help='WebRTC VAD levels')
+    parser.add_argument('--hangover-ms', type=int, default=300, help='Gate hangover')
+    parser.add_argument('--lookback-ms', type=int, default=100, help='Gate lookback')
+    parser.add_argument('--idle-seconds', type=float, default=60, help='Length of the room-noise clip')
+    parser.add_argument('--noise-db', type=float, default=-65, help='Room-noise level in dBFS')
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as f:
+        settings = yaml.safe_load(f).get('voice_activation', {})
+    if args.engine:
+        settings['engine'] = args.engine
+    if args.sensitivity is not None:
+        settings['sensitivity'] = args.sensitivity
+    keywords = None
+    if args.keyword:
+        keywords = [KeywordSpec(args.keyword.lower(), settings.get('sensitivity', 0.5))]
+
+    engine = None
+    frame_length = FRAME_LENGTH
+    try:
+        engine = create_engine(settings, keywords)
+        frame_length = engine.frame_length
+    except Exception as e:
+        print(f"⚠️  Wake word engine unavailable ({e}): measuring the gate alone, no detections")
+    if not WEBRTCVAD_AVAILABLE:
+        print("⚠️  webrtcvad not installed: skipping the WebRTC gate")
+
+    clips = []
+    if args.corpus:
+        for path in sorted(Path(args.corpus).glob('*.wav')):
+            clips.append((path.name, load_wav(path, SAMPLE_RATE)))
+        print(f"\n📁 {len(clips)} recordings, "
+              f"{sum(len(c) for _, c in clips) / SAMPLE_RATE:.0f} s of audio")
+    idle = room_noise(args.idle_seconds, args.noise_db, SAMPLE_RATE)
+
+    print(f"\n{'Setting':<20} {'Idle frames':>11} {'Idle CPU':>9} "
+          f"{'Corpus frames':>13} {'Corpus CPU':>10} {'Files detected':>15}")
+
+    baseline = None
+    for label, config in gate_settings(args):
+        idle_cpu, idle_frames, idle_processed, _ = run(idle, engine, config, frame_length)
+
+        cpu = seen = processed = 0
+        detected = set()
+        for name, clip in clips:
+            clip_cpu, clip_seen, clip_processed, detections = run(clip, engine, config, frame_length)
+            cpu += clip_cpu
+            seen += clip_seen
+            processed += clip_processed
+            if detections:
+                detected.add(name)
+
+        if baseline is None:
+            baseline = detected
+        kept = f"{len(detected & baseline)}/{len(baseline)}" if clips else "-"
+        corpus_seconds = seen * frame_length / SAMPLE_RATE
+
+        print(f"{label:<20} "
+              f"{idle_processed / max(1, idle_frames) * 100:10.1f}% "
+              f"{idle_cpu / args.idle_seconds * 100:8.3f}% "
+              f"{processed / max(1, seen) * 100:12.1f}% "
+              + (f"{cpu / corpus_seconds * 100:9.3f}% " if clips else f"{'-':>10} ")
+              + f"{kept:>15}")
+
+    print("\n   Frames: share that reached the engine (lookback replays included)")
+    print("   CPU: one core's time per second of audio")
+    print("   Files detected: files with a detection that the ungated run also found")
+
+    if engine is not None:
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
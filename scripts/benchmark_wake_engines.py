@@ -0,0 +1,109 @@
+"""Benchmark the CPU cost of each wake word engine.
+
+For every installed engine, the same audio is fed frame by frame
+(without the VAD gate) to one engine instance that checks all keywords
+in a single pass, and to one single-keyword instance per keyword. Costs
+are reported per second of audio, since engines use different frame
+lengths, and as the share of one core needed to keep up in real time.
+"""
+
+import argparse
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_activation.wake_engines import ENGINES, create_engine, keyword_specs
+
+
+def load_audio(path: str, seconds: float, sample_rate: int) -> np.ndarray:
+    """A 16 kHz mono WAV file, or synthetic noise with tone bursts."""
+    if path:
+        with wave.open(path, 'rb') as wav:
+            if wav.getframerate() != sample_rate or wav.getnchannels() != 1:
+                raise ValueError(f"{path}: expected {sample_rate} Hz mono")
+            return np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0, 300, int(seconds * sample_rate))
+    t = np.arange(sample_rate // 2) / sample_rate
+    for start in range(0, len(audio) - len(t), 2 * sample_rate):
+        audio[start:start + len(t)] += 6000 * np.sin(2 * np.pi * 300 * t) * np.hanning(len(t))
+    return np.clip(audio, -32768, 32767).astype(np.int16)
+
+
+def run(engine, audio: np.ndarray) -> float:
+    """CPU seconds to push the audio through the engine."""
+    frame = engine.frame.array
+    frames = len(audio) // engine.frame_length
+    cpu_start = time.process_time()
+    for i in range(frames):
+        frame[:] = audio[i * engine.frame_length:(i + 1) * engine.frame_length]
+        engine.process(frame)
+    return time.process_time() - cpu_start
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark wake word engine CPU cost')
+    parser.add_argument('--config', default='config.yaml', help='Configuration file')
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES), help='Engines to compare')
+    parser.add_argument('--keywords', nargs='+',
+                        help='Keywords (default: wake word plus voice_activation.keywords)')
+    parser.add_argument('--wav', help='16 kHz mono WAV file to use instead of synthetic audio')
+    parser.add_argument('--seconds', type=float, default=60, help='Length of the synthetic audio')
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as f:
+        settings = yaml.safe_load(f).get('voice_activation', {})
+    if args.keywords:
+        settings = dict(settings, wake_word=args.keywords[0],
+                        keywords=[{'word': word} for word in args.keywords[1:]])
+    keywords = keyword_specs(settings)
+
+    audio = load_audio(args.wav, args.seconds, 16000)
+    audio_seconds = len(audio) / 16000
+    print(f"\n📊 {audio_seconds:.0f} s of audio, keywords: {', '.join(k.word for k in keywords)}")
+    print(f"\n{'Engine':<14} {'Frame':>6} {'µs/frame':>9} {'One pass':>9} "
+          f"{'Separate':>9} {'Saving':>7}")
+
+    for name in args.engines:
+        try:
+            engine = create_engine(dict(settings, engine=name), keywords)
+        except Exception as e:
+            print(f"{name:<14} ⚠️  skipped: {e}")
+            continue
+
+        one_pass = run(engine, audio)
+        frames = len(audio) // engine.frame_length
+        used = engine.keywords
+        engine.close()
+
+        separate = 0.0
+        if len(used) > 1:
+            for spec in used:
+                single = create_engine(dict(settings, engine=name), [spec])
+                separate += run(single, audio)
+                single.close()
+
+        one_pass_pct = one_pass / audio_seconds * 100
+        if separate:
+            separate_pct = f"{separate / audio_seconds * 100:8.2f}%"
+            saving = f"{(1 - one_pass / separate) * 100:6.0f}%"
+        else:
+            separate_pct, saving = f"{'-':>9}", f"{'-':>7}"
+
+        print(f"{name:<14} {engine.frame_length:6d} {one_pass / frames * 1e6:9.1f} "
+              f"{one_pass_pct:8.2f}% {separate_pct} {saving}")
+
+    print("\n   One pass: all keywords in one engine; Separate: one engine per keyword")
+    print("   Percentages are the share of one core needed to listen in real time")
+
+
+if __name__ == "__main__":
+    main()
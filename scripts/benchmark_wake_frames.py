@@ -0,0 +1,93 @@
+"""Benchmark per-frame PCM handling in the wake word loop.
+
+Compares the old path (struct.unpack_from into a tuple of ints, which
+Porcupine.process() then copies into a fresh ctypes array) with the
+FrameBuffer path used by WakeWordDetector (np.frombuffer into one
+preallocated buffer that is handed to the engine as is). The engine call
+itself is left out, so the numbers are the Python overhead per frame.
+"""
+
+import argparse
+import ctypes
+import struct
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_activation.wake_engines import FrameBuffer
+
+
+def make_frames(count: int, frame_length: int) -> list:
+    """Random PCM frames as PyAudio returns them."""
+    rng = np.random.default_rng(0)
+    return [rng.integers(-3000, 3000, frame_length, dtype=np.int16).tobytes()
+            for _ in range(count)]
+
+
+def unpack_path(frames: list, frame_length: int):
+    """Old loop: tuple of ints, then the copy Porcupine.process() makes."""
+    fmt = "h" * frame_length
+    for pcm in frames:
+        samples = struct.unpack_from(fmt, pcm)
+        (ctypes.c_short * len(samples))(*samples)
+
+
+def numpy_public_path(frames: list, frame_length: int):
+    """NumPy view passed to the public process() (which still copies)."""
+    buffer = FrameBuffer(frame_length)
+    for pcm in frames:
+        frame = buffer.load(pcm)
+        (ctypes.c_short * len(frame))(*frame)
+
+
+def zero_copy_path(frames: list, frame_length: int):
+    """FrameBuffer: one memcpy into a buffer the engine reads directly."""
+    buffer = FrameBuffer(frame_length)
+    for pcm in frames:
+        buffer.load(pcm)
+        ctypes.byref(buffer.c_buffer)
+
+
+def measure(label: str, fn, frames: list, frame_length: int, sample_rate: int):
+    """Time one path and print throughput and real-time CPU share."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    fn(frames, frame_length)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    frames_per_s = len(frames) / wall
+    # Share of one core spent on frame handling when listening in real time
+    realtime_fps = sample_rate / frame_length
+    cpu_percent = cpu / len(frames) * realtime_fps * 100
+
+    print(f"   {label:<22} {frames_per_s:12,.0f} frames/s   "
+          f"{cpu / len(frames) * 1e6:7.2f} µs/frame   {cpu_percent:6.3f}% CPU at real time")
+    return cpu
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark wake word frame handling')
+    parser.add_argument('--frames', type=int, default=20000, help='Frames to process')
+    parser.add_argument('--frame-length', type=int, default=512, help='Samples per frame (Porcupine: 512)')
+    parser.add_argument('--sample-rate', type=int, default=16000, help='Sample rate in Hz')
+    args = parser.parse_args()
+
+    frames = make_frames(args.frames, args.frame_length)
+    print(f"\n📊 {args.frames} frames of {args.frame_length} samples "
+          f"({args.frame_length / args.sample_rate * 1000:.0f} ms each)")
+
+    baseline = measure("struct.unpack_from:", unpack_path, frames, args.frame_length, args.sample_rate)
+    measure("NumPy + process():", numpy_public_path, frames, args.frame_length, args.sample_rate)
+    zero_copy = measure("FrameBuffer (native):", zero_copy_path, frames, args.frame_length, args.sample_rate)
+
+    print(f"   Speedup:               {baseline / zero_copy:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
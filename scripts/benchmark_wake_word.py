@@ -0,0 +1,199 @@
+"""Benchmark wake word detection offline over a labelled WAV corpus.
+
+Every recording is streamed through the capture hub and
+WakeWordDetector.detect() (VAD gate included, as configured) as fast as
+the CPU allows, once per sensitivity. Detections are matched against the
+labelled keyword positions to report recall, false accepts per hour of
+audio, detection latency after the end of the keyword, and throughput.
+
+The corpus is a directory of WAV files plus a labels.csv with one row
+per spoken wake word:
+
+    file,start,end,keyword
+    kitchen_01.wav,1.20,1.74,jarvis
+    kitchen_01.wav,6.05,6.61,jarvis
+
+Times are in seconds; the keyword column is optional (without it any
+configured keyword matches). Files without rows are negatives.
+"""
+
+import argparse
+import csv
+import statistics
+import sys
+import time
+import wave
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_activation.capture import CaptureHub, WavFileSource
+from voice_activation.wake_engines import create_engine
+from voice_activation.wake_word import WakeWordDetector
+
+
+def load_labels(path: Path) -> dict:
+    """Keyword (start, end, keyword) per file name."""
+    labels = defaultdict(list)
+    if path.exists():
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                labels[row['file']].append(
+                    (float(row['start']), float(row['end']), (row.get('keyword') or '').lower())
+                )
+    return labels
+
+
+def wav_seconds(path: Path) -> float:
+    with wave.open(str(path), 'rb') as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def stream_file(path: Path, detector: WakeWordDetector) -> tuple:
+    """Run one recording through the detector.
+
+    Returns:
+        (time, keyword) per detection (time at the end of the frame that
+        fired), CPU seconds spent in the detector, frames processed
+    """
+    engine = detector.engine
+    # Nothing heard in the previous file may carry over
+    engine.reset()
+    hub = CaptureHub(WavFileSource(str(path), engine.frame_length, realtime=False),
+                     engine.sample_rate, engine.frame_length)
+    # Large enough for the whole file, so nothing is dropped
+    ring = hub.subscribe('benchmark', wav_seconds(path) + 1.0)
+    hub.start()
+    hub.source.finished.wait()
+    hub.stop()
+
+    frame_seconds = engine.frame_length / engine.sample_rate
+    detections = []
+    frames = 0
+    cpu_start = time.process_time()
+    while ring.read_into(detector.frame.array, 0):
+        frames += 1
+        index = detector.detect(detector.frame.array)
+        if index >= 0:
+            detections.append((frames * frame_seconds, engine.keywords[index].word))
+    cpu = time.process_time() - cpu_start
+
+    return detections, cpu, frames
+
+
+def score(detections: list, keywords: list, tolerance: float, refractory: float) -> tuple:
+    """Match detections to labelled keywords.
+
+    Returns:
+        Hits, false accepts, latencies (seconds after each keyword's end)
+    """
+    # Collapse repeated firings on the same utterance
+    merged = []
+    for t, word in detections:
+        if not merged or t - merged[-1][0] > refractory:
+            merged.append((t, word))
+
+    matched = set()
+    latencies = []
+    false_accepts = 0
+    for t, word in merged:
+        for i, (start, end, keyword) in enumerate(keywords):
+            if i in matched or (keyword and keyword != word):
+                continue
+            if start <= t <= end + tolerance:
+                matched.add(i)
+                latencies.append(t - end)
+                break
+        else:
+            false_accepts += 1
+
+    return len(matched), false_accepts, latencies
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark wake word detection on a WAV corpus')
+    parser.add_argument('corpus', help='Directory of WAV files with labels.csv')
+    parser.add_argument('--labels', help='Labels file (default: <corpus>/labels.csv)')
+    parser.add_argument('--config', default='config.yaml', help='Configuration file')
+    parser.add_argument('--engine', help='Wake word engine (default: voice_activation.engine)')
+    parser.add_argument('--sensitivities', type=float, nargs='+', default=[0.3, 0.5, 0.7, 0.9],
+                        help='Sensitivities to compare')
+    parser.add_argument('--tolerance', type=float, default=1.0,
+                        help='Seconds after a keyword ends that a detection still counts')
+    parser.add_argument('--refractory', type=float, default=1.0,
+                        help='Detections closer together than this count once')
+    args = parser.parse_args()
+
+    corpus = Path(args.corpus)
+    files = sorted(corpus.glob('*.wav'))
+    if not files:
+        print(f"❌ No WAV files in {corpus}")
+        return 1
+
+    with open(args.config, 'r') as f:
+        settings = yaml.safe_load(f).get('voice_activation', {})
+    if args.engine:
+        settings['engine'] = args.engine
+
+    labels = load_labels(Path(args.labels) if args.labels else corpus / 'labels.csv')
+    total_keywords = sum(len(labels[f.name]) for f in files)
+    total_seconds = sum(wav_seconds(f) for f in files)
+    print(f"\n📁 {len(files)} recordings, {total_seconds / 60:.1f} min of audio, "
+          f"{total_keywords} labelled wake words")
+    print(f"   Engine: {settings.get('engine', 'porcupine')}")
+
+    print(f"\n{'Sens.':>5} {'Recall':>7} {'Misses':>6} {'FA':>4} {'FA/hour':>8} "
+          f"{'Latency p50':>11} {'p95':>6} {'Speed':>8} {'CPU':>7}")
+
+    for sensitivity in args.sensitivities:
+        try:
+            engine = create_engine(dict(settings, sensitivity=sensitivity))
+        except Exception as e:
+            print(f"❌ Wake word engine could not be initialized: {e}")
+            return 1
+        detector = WakeWordDetector(args.config, engine=engine)
+
+        hits = false_accepts = frames = 0
+        cpu = 0.0
+        latencies = []
+        wall_start = time.perf_counter()
+        for path in files:
+            detections, file_cpu, file_frames = stream_file(path, detector)
+            file_hits, file_fa, file_latencies = score(
+                detections, labels[path.name], args.tolerance, args.refractory
+            )
+            hits += file_hits
+            false_accepts += file_fa
+            latencies += file_latencies
+            cpu += file_cpu
+            frames += file_frames
+        wall = time.perf_counter() - wall_start
+        detector.cleanup()
+
+        recall = f"{hits / total_keywords * 100:6.1f}%" if total_keywords else f"{'-':>7}"
+        if len(latencies) >= 2:
+            p50 = f"{statistics.median(latencies) * 1000:8.0f} ms"
+            p95 = f"{np.percentile(latencies, 95) * 1000:6.0f}"
+        elif latencies:
+            p50 = f"{latencies[0] * 1000:8.0f} ms"
+            p95 = f"{'-':>6}"
+        else:
+            p50, p95 = f"{'-':>11}", f"{'-':>6}"
+
+        print(f"{sensitivity:5.2f} {recall} {total_keywords - hits:6d} {false_accepts:4d} "
+              f"{false_accepts / (total_seconds / 3600):8.2f} {p50} {p95} "
+              f"{total_seconds / wall:7.0f}x {cpu / total_seconds * 100:6.2f}%")
+
+    print("\n   Latency: from the end of the labelled keyword to the frame that fired")
+    print("   Speed: audio seconds processed per wall-clock second (files decoded included)")
+    print("   CPU: detector time as a share of one core when listening in real time")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""Tests for the shared capture hub over a WAV file source."""
+
+import wave
+
+import numpy as np
+import pytest
+
+from voice_activation.capture import CaptureHub, WavFileSource
+
+
+@pytest.fixture
+def clip(tmp_path):
+    path = tmp_path / 'clip.wav'
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(np.arange(4096, dtype='<i2').tobytes())
+    return str(path)
+
+
+def play(hub):
+    hub.start()
+    assert hub.source.finished.wait(5)
+    hub.stop()
+
+
+def test_wav_hub_can_be_restarted(clip):
+    hub = CaptureHub(WavFileSource(clip, 512, realtime=False), 16000, 512)
+    ring = hub.subscribe('test', 1.0)
+
+    play(hub)
+    play(hub)
+
+    assert ring.stats()['frames_written'] == 16
+
+
+@pytest.mark.parametrize('audio, message', [
+    ({'source': 'wav'}, "source_file is not set"),
+    ({'source': 'wav', 'source_file': 'missing.wav'}, "source_file not found"),
+])
+def test_wav_source_config_is_validated(audio, message):
+    with pytest.raises(ValueError, match=message):
+        CaptureHub.from_config({'audio': audio})
@@ -0,0 +1,64 @@
+"""Tests for handler timeouts and coroutine handlers in the command processor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from jarvis_core.commands import CommandProcessor
+
+
+@pytest.fixture
+def processor():
+    processor = CommandProcessor(fuzzy_threshold=None, max_workers=4)
+    yield processor
+    processor.shutdown()
+
+
+def test_hung_handlers_do_not_exhaust_the_pool(processor):
+    release = threading.Event()
+    processor.register_command("hang", lambda text: release.wait(10), ["hang"], timeout=0.05)
+    processor.register_command("quick", lambda text: {'text': "done"}, ["quick"], timeout=1)
+
+    try:
+        for _ in range(6):
+            assert processor.process("hang")['timeout'] is True
+
+        result = processor.process("quick")
+    finally:
+        release.set()
+
+    assert result['success'] is True
+    assert result['response'] == {'text': "done"}
+
+
+def test_coroutine_handler_from_running_loop(processor):
+    async def ping(text):
+        await asyncio.sleep(0)
+        return {'text': "pong"}
+
+    processor.register_command("ping", ping, ["ping"], timeout=1)
+
+    async def caller():
+        return processor.process("ping")
+
+    result = asyncio.run(caller())
+
+    assert result['success'] is True
+    assert result['response'] == {'text': "pong"}
+
+
+def test_timed_out_coroutine_handler_is_cancelled(processor):
+    cancelled = threading.Event()
+
+    async def slow(text):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    processor.register_command("slow", slow, ["slow"], timeout=0.05)
+
+    assert processor.process("slow")['timeout'] is True
+    assert cancelled.wait(1)
@@ -0,0 +1,70 @@
+"""Tests for the slot-extracting command grammar."""
+
+import pytest
+
+from jarvis_core.grammar import CommandGrammar
+from jarvis_core.plugins import DEFAULT_APPS, DEFAULT_PLUGINS
+
+
+@pytest.fixture
+def grammar():
+    grammar = CommandGrammar()
+    grammar.set_choices('app', DEFAULT_APPS)
+    for spec in DEFAULT_PLUGINS:
+        for pattern in spec.patterns or []:
+            grammar.add(spec.name, pattern)
+    return grammar
+
+
+@pytest.mark.parametrize('text, command, slots', [
+    ("open notepad", 'open_app', {'app_name': 'notepad'}),
+    ("Jarvis, open the browser.", 'open_app', {'app_name': 'browser'}),
+    ("hey jarvis can you launch spotify please", 'open_app', {'app_name': 'spotify'}),
+    ("please set the volume to 40 percent", 'volume', {'level': 40}),
+    ("set volume to 400", 'volume', {'level': 100}),
+    ("could you lock the screen", 'lock_screen', {}),
+])
+def test_commands_match(grammar, text, command, slots):
+    match = grammar.match(text)
+    assert match is not None
+    assert match.command == command
+    assert match.slots == slots
+
+
+@pytest.mark.parametrize('text', [
+    "how do i open a bank account",
+    "why did the market start falling",
+    "tell me how to lock the screen",
+    "can you explain how to set the volume to 40 percent on linux",
+])
+def test_command_phrase_inside_question_does_not_match(grammar, text):
+    assert grammar.match(text) is None
+
+
+@pytest.mark.parametrize('text', [
+    "start shutdown -s -t 0",
+    "open a bank account",
+    "open notepad && del c:\\windows",
+])
+def test_app_slot_only_accepts_allowed_names(grammar, text):
+    assert grammar.match(text) is None
+
+
+def test_app_choices_can_be_configured():
+    grammar = CommandGrammar()
+    grammar.add('open_app', "open {app_name:app}")
+    assert grammar.match("open visual studio code") is None
+
+    grammar.set_choices('app', ['Visual Studio Code', 'code'])
+    assert grammar.match("open visual  studio code").slots == {'app_name': 'visual studio code'}
+    assert grammar.match("open code").slots == {'app_name': 'code'}
+
+
+def test_two_leading_optionals_are_kept():
+    grammar = CommandGrammar(wake_words=())
+    grammar.add('greet', "[hey] [there] wave {times:int}")
+
+    assert grammar.match("hey there wave 2").slots == {'times': 2}
+    assert grammar.match("hey wave 2").slots == {'times': 2}
+    assert grammar.match("there wave 2").slots == {'times': 2}
+    assert grammar.match("wave 2").slots == {'times': 2}
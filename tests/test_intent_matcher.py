@@ -0,0 +1,43 @@
+"""Tests for fuzzy matching against the full trigger set."""
+
+import pytest
+
+from jarvis_core.commands import CommandProcessor
+from jarvis_core.plugins import PluginRegistry
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    processor = CommandProcessor()
+    PluginRegistry().install(processor)
+    yield processor.fuzzy_matcher
+    processor.shutdown()
+
+
+@pytest.mark.parametrize("text, command", [
+    ("what's the thyme", "time"),
+    ("what thyme is it", "time"),
+    ("whats the wether like", "weather"),
+    ("serch for cats", "search"),
+    ("cpu usaje", "system_info"),
+    ("goodby", "bye"),
+])
+def test_mistranscribed_command_matches(matcher, text, command):
+    match = matcher.match(text)
+
+    assert match is not None
+    assert match.command == command
+
+
+@pytest.mark.parametrize("text", [
+    "can you tell me when the stores open",
+    "why is the sky blue",
+    "who wrote hamlet",
+    "tell me a joke",
+    "what do you think about aizen",
+    "what is the capital of france",
+])
+def test_unrelated_question_does_not_match(matcher, text):
+    assert matcher.match(text) is None
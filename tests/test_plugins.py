@@ -0,0 +1,76 @@
+"""Tests for lazy plugins and handler failures in the command processor."""
+
+import asyncio
+
+import pytest
+
+from jarvis_core.commands import CommandProcessor
+from jarvis_core.plugins import DEFAULT_PLUGINS, PluginLoadError, PluginRegistry, PluginSpec
+
+BROKEN = PluginSpec(
+    name="broken",
+    target="jarvis_tests_missing_module:Service.handle_command",
+    triggers=["search for"]
+)
+
+
+@pytest.fixture
+def processor():
+    processor = CommandProcessor(fuzzy_threshold=None)
+    yield processor
+    processor.shutdown()
+
+
+def test_failed_import_is_reported(processor):
+    registry = PluginRegistry()
+    registry.install(processor, [BROKEN])
+
+    result = processor.process("search for bleach episodes")
+
+    assert result['success'] is False
+    assert result['context'] == 'error'
+    assert result['command'] == 'broken'
+    assert not registry.is_loaded('broken')
+    assert 'ModuleNotFoundError' in registry.import_report()[0]['error']
+
+
+def test_failed_import_raises_plugin_load_error():
+    registry = PluginRegistry()
+    registry.declare(BROKEN)
+
+    with pytest.raises(PluginLoadError):
+        registry.load('broken')
+
+
+def test_failed_import_is_reported_async(processor):
+    PluginRegistry().install(processor, [BROKEN])
+
+    result = asyncio.run(processor.process_async("search for bleach episodes"))
+
+    assert result['success'] is False
+    assert result['context'] == 'error'
+
+
+@pytest.mark.parametrize('timeout', [None, 5])
+def test_handler_exception_is_reported(processor, timeout):
+    def handler(text):
+        raise ValueError("boom")
+
+    processor.register_command("explode", handler, ["explode"], timeout=timeout)
+    result = processor.process("explode")
+
+    assert result['success'] is False
+    assert result['context'] == 'error'
+    assert result['error'] == "boom"
+
+
+def test_volume_response_reports_the_applied_level(processor):
+    volume = next(spec for spec in DEFAULT_PLUGINS if spec.name == 'volume')
+    applied = []
+    processor.register_grammar(volume.name, lambda level: applied.append(level), volume.patterns,
+                               response=volume.response)
+
+    result = processor.process("set volume to 400")
+
+    assert applied == [100]
+    assert result['response']['text'] == "Volume set to 100%."
@@ -0,0 +1,64 @@
+"""Tests for routing between local commands and the AI brain."""
+
+import pytest
+
+from jarvis_core.commands import CommandProcessor
+from jarvis_core.router import IntentRouter
+
+
+class FakeBrain:
+    def __init__(self):
+        self.asked = []
+
+    def get_response(self, text):
+        self.asked.append(text)
+        return "From the LLM."
+
+
+@pytest.fixture
+def processor():
+    processor = CommandProcessor(fuzzy_threshold=None)
+
+    def explode(text):
+        raise RuntimeError("handler crashed")
+
+    processor.register_command("explode", explode, ["explode"])
+    yield processor
+    processor.shutdown()
+
+
+def test_local_command_is_served_locally(processor):
+    brain = FakeBrain()
+    reply = IntentRouter(processor, brain).route("hello")
+
+    assert reply['source'] == 'local'
+    assert brain.asked == []
+
+
+def test_raising_handler_escalates_to_ai_brain(processor):
+    brain = FakeBrain()
+    router = IntentRouter(processor, brain)
+
+    reply = router.route("explode")
+
+    assert reply['source'] == 'llm'
+    assert reply['text'] == "From the LLM."
+    assert brain.asked == ["explode"]
+    assert router.stats()['llm_turns'] == 1
+
+
+def test_processor_error_escalates_to_ai_brain(processor, monkeypatch):
+    def broken_execute(match, text):
+        raise KeyError(match.command)
+
+    monkeypatch.setattr(processor, 'execute', broken_execute)
+    reply = IntentRouter(processor, FakeBrain()).route("hello")
+
+    assert reply['source'] == 'llm'
+
+
+def test_raising_handler_without_ai_brain_is_unhandled(processor):
+    reply = IntentRouter(processor, None).route("explode")
+
+    assert reply['source'] == 'none'
+    assert reply['context'] == 'error'
@@ -0,0 +1,84 @@
+"""Tests for caching Coqui speaker conditioning."""
+
+import threading
+import types
+
+import pytest
+
+from voice_synthesis.speaker_latents import SpeakerLatentCache
+
+
+class FakeXtts:
+    def __init__(self):
+        self.calls = 0
+
+    def get_conditioning_latents(self, audio_path, max_ref_length=30, gpt_cond_len=6):
+        self.calls += 1
+        return ('latents', audio_path, gpt_cond_len)
+
+
+@pytest.fixture
+def reference(tmp_path):
+    path = tmp_path / 'reference.wav'
+    path.write_bytes(b'RIFF fake reference audio')
+    return str(path)
+
+
+@pytest.fixture
+def xtts(tmp_path):
+    tts_model = FakeXtts()
+    model = types.SimpleNamespace(synthesizer=types.SimpleNamespace(tts_model=tts_model))
+    assert SpeakerLatentCache(tmp_path / 'latents', model_name='xtts').install(model)
+    return tts_model
+
+
+def test_wrapper_called_by_keyword(xtts, reference):
+    first = xtts.get_conditioning_latents(audio_path=reference, gpt_cond_len=6)
+    second = xtts.get_conditioning_latents(audio_path=reference, gpt_cond_len=6)
+
+    assert first == second == ('latents', reference, 6)
+    assert xtts.calls == 1
+
+
+def test_keyword_and_positional_calls_share_the_audio_key(xtts, reference):
+    xtts.get_conditioning_latents(reference)
+    xtts.get_conditioning_latents(audio_path=reference)
+
+    assert xtts.calls == 1
+
+
+def test_other_arguments_are_part_of_the_key(xtts, reference):
+    xtts.get_conditioning_latents(audio_path=reference, gpt_cond_len=6)
+    xtts.get_conditioning_latents(audio_path=reference, gpt_cond_len=12)
+
+    assert xtts.calls == 2
+
+
+def test_slow_computation_does_not_block_other_speakers(tmp_path, reference):
+    other = tmp_path / 'other.wav'
+    other.write_bytes(b'RIFF another speaker')
+    cache = SpeakerLatentCache(tmp_path / 'latents')
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return 'slow'
+
+    worker = threading.Thread(target=cache.get, args=('latents', reference, slow))
+    worker.start()
+    try:
+        assert started.wait(5)
+        results = []
+        lookup = threading.Thread(
+            target=lambda: results.append(cache.get('latents', str(other), lambda: 'fast'))
+        )
+        lookup.start()
+        lookup.join(2)
+        assert results == ['fast']
+    finally:
+        release.set()
+        worker.join()
+
+    assert cache.get('latents', reference, lambda: 'recomputed') == 'slow'
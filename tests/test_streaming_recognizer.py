@@ -0,0 +1,93 @@
+"""Tests for incremental transcription while a command is spoken."""
+
+import threading
+import time
+
+import numpy as np
+
+from voice_activation.streaming_recognizer import StreamingTranscriber
+
+RATE = 16000
+WORD_SECONDS = 0.4
+GAP_SECONDS = 0.1
+
+
+class FakeRecognizer:
+    """Reads words back from audio made of constant-valued runs.
+
+    Word k is WORD_SECONDS of samples at k * 1000 followed by a short
+    silence; a run still touching the end of the audio is left out, as a
+    recognizer would not be sure of a word cut off mid-way.
+    """
+
+    def __init__(self):
+        self.windows = []
+        self.decoding = threading.Event()
+        self.hold = threading.Event()
+        self.hold.set()
+
+    def transcribe_words(self, audio, language='en', prompt=None):
+        if threading.current_thread() is not threading.main_thread():
+            self.decoding.set()
+            self.hold.wait()
+        self.windows.append(len(audio) / RATE)
+
+        values = np.rint(audio * 32768 / 1000).astype(int)
+        words = []
+        start = None
+        for i, value in enumerate(np.append(values, 0)):
+            if start is None and value:
+                start = i
+            elif start is not None and value != values[start]:
+                if i < len(values):
+                    words.append((f"w{values[start]}", start / RATE, i / RATE))
+                start = None if not value else i
+        return words
+
+
+def utterance(words):
+    word = int(WORD_SECONDS * RATE)
+    gap = int(GAP_SECONDS * RATE)
+    audio = np.zeros(words * (word + gap), dtype=np.int16)
+    for k in range(words):
+        audio[k * (word + gap):k * (word + gap) + word] = (k + 1) * 1000
+    return audio
+
+
+def wait_for_decodes(stream, count):
+    deadline = time.monotonic() + 5
+    while stream.decodes < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert stream.decodes >= count
+
+
+def test_final_decode_covers_only_the_tail():
+    recognizer = FakeRecognizer()
+    stream = StreamingTranscriber(recognizer, sample_rate=RATE, step_seconds=1.0)
+    audio = utterance(16)  # 8 s
+
+    # One decode per second of audio, each finished before the next second
+    for decodes, i in enumerate(range(0, len(audio), RATE), 1):
+        stream.feed(audio[i:i + RATE])
+        wait_for_decodes(stream, decodes)
+
+    text = stream.finish()
+
+    assert text == ' '.join(f"w{k}" for k in range(1, 17))
+    assert stream.final_window_seconds < 2.0
+    assert max(recognizer.windows) < 3.0
+
+
+def test_finish_does_not_wait_for_running_decode():
+    recognizer = FakeRecognizer()
+    recognizer.hold.clear()
+    stream = StreamingTranscriber(recognizer, sample_rate=RATE, step_seconds=1.0)
+    stream.feed(utterance(3))
+    assert recognizer.decoding.wait(5)
+
+    try:
+        text = stream.finish()
+    finally:
+        recognizer.hold.set()
+
+    assert text == "w1 w2 w3"
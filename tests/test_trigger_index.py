@@ -0,0 +1,75 @@
+"""Tests for incremental updates of the trigger index."""
+
+import random
+
+from jarvis_core.trigger_index import TriggerIndex
+
+
+def brute_force(triggers, text):
+    """(end, command, trigger) of every occurrence, by plain substring search."""
+    found = set()
+    for command, trigger in triggers:
+        start = text.find(trigger)
+        while start != -1:
+            found.add((start + len(trigger), command, trigger))
+            start = text.find(trigger, start + 1)
+    return found
+
+
+def occurrences(index, text):
+    return {(match.end, match.command, match.trigger) for match in index.find_all(text)}
+
+
+def test_random_updates_match_brute_force():
+    rng = random.Random(0)
+    words = ["ab", "abc", "bca", "cab", "ca", "b", "abab", "bab"]
+    triggers = []
+    index = TriggerIndex()
+
+    for _ in range(300):
+        command = f"cmd_{rng.randrange(12)}"
+        if rng.random() < 0.3:
+            index.remove_command(command)
+            triggers = [t for t in triggers if t[0] != command]
+        else:
+            trigger = ' '.join(rng.choices(words, k=rng.randint(1, 2)))
+            index.add(command, trigger)
+            triggers.append((command, trigger))
+
+        text = ' '.join(rng.choices(words, k=6))
+        assert occurrences(index, text) == brute_force(triggers, text)
+
+    fresh = TriggerIndex()
+    for command, trigger in triggers:
+        fresh.add(command, trigger)
+    assert index.states == fresh.states
+
+
+def test_removing_a_command_prunes_only_its_triggers():
+    index = TriggerIndex()
+    index.add("weather", "weather")
+    index.add("forecast", "weather forecast")
+    index.add("time", "what time")
+    states = index.states
+
+    index.remove_command("forecast")
+
+    assert index.best_match("weather forecast please").command == "weather"
+    assert index.best_match("what time is it").command == "time"
+    assert index.states == states - len(" forecast")
+
+    index.add("forecast", "weather forecast")
+
+    assert index.best_match("weather forecast please").command == "forecast"
+    assert index.states == states
+
+
+def test_reregistered_command_loses_ties_to_older_triggers():
+    index = TriggerIndex()
+    index.add("first", "hello")
+    index.add("second", "hello")
+
+    index.remove_command("first")
+    index.add("first", "hello")
+
+    assert index.best_match("hello there").command == "second"
@@ -0,0 +1,87 @@
+"""Tests for playing pre-rendered phrases from the audio cache, and playback timings."""
+
+import sys
+import time
+import types
+
+import pytest
+import yaml
+
+from voice_synthesis.tts_engine import TTSEngine
+
+
+class FakeGTTS:
+    calls = []
+
+    def __init__(self, text, lang):
+        self.text = text
+        FakeGTTS.calls.append(text)
+
+    def write_to_fp(self, fp):
+        fp.write(b"mp3:" + self.text.encode())
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'gtts', types.SimpleNamespace(gTTS=FakeGTTS))
+    FakeGTTS.calls = []
+
+    with open('config.yaml') as f:
+        config = yaml.safe_load(f)
+    config['voice'].update(engine='gtts', streaming=True, cache_enabled=True)
+    config['paths']['cache'] = str(tmp_path / 'cache')
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(yaml.safe_dump(config))
+
+    engine = TTSEngine(str(config_path))
+    played = []
+    monkeypatch.setattr(engine, '_play_clips', lambda clips: played.extend(clips) or [])
+    engine.played = played
+    yield engine
+    engine.close()
+
+
+@pytest.mark.parametrize('phrase', [
+    "Keikaku doori... Precisely as expected.",
+    "Yokoso... watashino sekai e. Welcome to my world.",
+    "Kanpeki... Perfect.",
+])
+def test_warmed_multi_sentence_phrase_plays_without_synthesis(engine, phrase):
+    assert engine.prerender(phrase)
+    assert FakeGTTS.calls == [phrase]
+
+    engine._speak_now(phrase)
+
+    assert FakeGTTS.calls == [phrase]
+    assert [clip.data for clip in engine.played] == [b"mp3:" + phrase.encode()]
+
+
+def test_cold_multi_sentence_text_is_streamed(engine):
+    engine._speak_now("First sentence here. Second sentence here.")
+
+    assert FakeGTTS.calls == ["First sentence here.", "Second sentence here."]
+    assert len(engine.played) == 2
+
+
+def test_close_logs_barge_in_latency(engine, caplog):
+    engine.stop_latencies.extend([0.002, 0.004])
+
+    with caplog.at_level('INFO', logger='voice_synthesis.tts_engine'):
+        engine.close()
+
+    assert "Barge-in stopped playback 2 times in 3.0 ms on average (max 4.0 ms)" in caplog.text
+
+
+def test_time_to_first_audio_is_logged_per_path(engine, monkeypatch, caplog):
+    monkeypatch.setattr(engine, '_play_clips', lambda clips: [time.perf_counter() for _ in clips])
+
+    engine._speak_now("First sentence here. Second sentence here.")
+    engine._speak_now("Hello there.")
+    stats = engine.first_audio_stats()
+
+    assert stats['streamed']['count'] == 1
+    assert stats['whole']['count'] == 1
+    with caplog.at_level('INFO', logger='voice_synthesis.tts_engine'):
+        engine.close()
+    assert "Time to first audio (streamed)" in caplog.text
+    assert "Time to first audio (whole)" in caplog.text
@@ -0,0 +1,52 @@
+"""Tests for wake word engine state."""
+
+import numpy as np
+import pytest
+
+from voice_activation import wake_engines
+from voice_activation.wake_engines import KeywordSpec, OpenWakeWordEngine
+
+
+class FakeModel:
+    """Scores rise with every frame fed, like a stream buffer filling up."""
+
+    def __init__(self, wakeword_models):
+        self.names = wakeword_models
+        self.frames = 0
+
+    def predict(self, frame):
+        self.frames += 1
+        return {name: min(1.0, self.frames / 10) for name in self.names}
+
+    def reset(self):
+        self.frames = 0
+
+
+@pytest.fixture
+def fake_openwakeword(monkeypatch):
+    monkeypatch.setattr(wake_engines, 'OPENWAKEWORD_AVAILABLE', True)
+    monkeypatch.setattr(wake_engines, 'OpenWakeWordModel', FakeModel, raising=False)
+
+
+def test_openwakeword_engines_do_not_share_stream_state(fake_openwakeword):
+    keywords = [KeywordSpec('jarvis', 0.5)]
+    first = OpenWakeWordEngine(keywords)
+    second = OpenWakeWordEngine(keywords)
+    frame = np.zeros(first.frame_length, dtype=np.int16)
+
+    for _ in range(4):
+        first.process(frame)
+
+    assert first.model is not second.model
+    assert second.model.frames == 0
+
+
+def test_openwakeword_reset_clears_stream_state(fake_openwakeword):
+    engine = OpenWakeWordEngine([KeywordSpec('jarvis', 0.5)])
+    frame = np.zeros(engine.frame_length, dtype=np.int16)
+
+    fired = [engine.process(frame) for _ in range(5)]
+    engine.reset()
+
+    assert fired[-1] == 0
+    assert engine.process(frame) == -1
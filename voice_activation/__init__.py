@@ -1,6 +1,11 @@
 """Voice activation package."""
 
+from .capture import CaptureHub, CaptureSource, NullSource, PyAudioSource, SoundDeviceSource, WavFileSource
+from .wake_engines import KeywordSpec, OpenWakeWordEngine, PorcupineEngine, VoskEngine, WakeWordEngine
+from .streaming_recognizer import StreamingTranscriber
 from .wake_word import WakeWordDetector
 from .continuous_listener import ContinuousListener
 
-__all__ = ['WakeWordDetector', 'ContinuousListener']
+__all__ = ['CaptureHub', 'CaptureSource', 'NullSource', 'PyAudioSource', 'SoundDeviceSource',
+           'WavFileSource', 'KeywordSpec', 'WakeWordEngine', 'PorcupineEngine', 'OpenWakeWordEngine',
+           'VoskEngine', 'StreamingTranscriber', 'WakeWordDetector', 'ContinuousListener']
@@ -0,0 +1,437 @@
+"""One microphone capture shared by every consumer of input audio."""
+
+import logging
+import os
+import threading
+import time
+import wave
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .ring_buffer import AudioRingBuffer
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyaudio
+    PYAUDIO_AVAILABLE = True
+except ImportError:
+    PYAUDIO_AVAILABLE = False
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDDEVICE_AVAILABLE = False
+
+# on_block(samples, overflowed): interleaved int16 samples from the source
+BlockCallback = Callable[[np.ndarray, bool], None]
+
+
+class CaptureSource:
+    """Where captured audio comes from.
+
+    start() begins delivering interleaved int16 blocks to a callback on
+    the source's own thread; stop() ends it. Sources report the rate and
+    channel count they actually deliver, and the hub converts from there.
+    """
+
+    def __init__(self, sample_rate: int, channels: int = 1, block_size: int = 512):
+        """Describe the source.
+
+        Args:
+            sample_rate: Rate delivered, in Hz
+            channels: Channels delivered
+            block_size: Frames per block
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.block_size = block_size
+
+    def start(self, on_block: BlockCallback):
+        raise NotImplementedError
+
+    def stop(self):
+        raise NotImplementedError
+
+
+class PyAudioSource(CaptureSource):
+    """Microphone input through PyAudio in callback mode."""
+
+    def __init__(self, sample_rate: int, channels: int = 1, block_size: int = 512,
+                 device: Optional[int] = None):
+        super().__init__(sample_rate, channels, block_size)
+        self.device = device
+        self._audio = None
+        self._stream = None
+
+    def start(self, on_block: BlockCallback):
+        if not PYAUDIO_AVAILABLE:
+            raise RuntimeError("PyAudio not available. Install with: pip install pyaudio")
+
+        def callback(in_data, frame_count, time_info, status_flags):
+            on_block(np.frombuffer(in_data, dtype='<i2'),
+                     bool(status_flags & pyaudio.paInputOverflow))
+            return None, pyaudio.paContinue
+
+        self._audio = pyaudio.PyAudio()
+        self._stream = self._audio.open(
+            rate=self.sample_rate,
+            channels=self.channels,
+            format=pyaudio.paInt16,
+            input=True,
+            input_device_index=self.device,
+            frames_per_buffer=self.block_size,
+            stream_callback=callback
+        )
+
+    def stop(self):
+        if self._stream:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        if self._audio:
+            self._audio.terminate()
+            self._audio = None
+
+
+class SoundDeviceSource(CaptureSource):
+    """Microphone input through a sounddevice InputStream."""
+
+    def __init__(self, sample_rate: int, channels: int = 1, block_size: int = 512,
+                 device=None):
+        super().__init__(sample_rate, channels, block_size)
+        self.device = device
+        self._stream = None
+
+    def start(self, on_block: BlockCallback):
+        if not SOUNDDEVICE_AVAILABLE:
+            raise RuntimeError("sounddevice not available. Install with: pip install sounddevice")
+
+        def callback(indata, frames, time_info, status):
+            on_block(indata.reshape(-1), bool(status.input_overflow))
+
+        self._stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            dtype='int16',
+            blocksize=self.block_size,
+            device=self.device,
+            callback=callback
+        )
+        self._stream.start()
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+
+class _ThreadSource(CaptureSource):
+    """Source that produces blocks on a worker thread, paced to real time."""
+
+    def __init__(self, sample_rate: int, channels: int = 1, block_size: int = 512,
+                 realtime: bool = True):
+        super().__init__(sample_rate, channels, block_size)
+        self.realtime = realtime
+        self.finished = threading.Event()
+        self._running = False
+        self._thread = None
+
+    def start(self, on_block: BlockCallback):
+        self._running = True
+        self.finished.clear()
+        self._thread = threading.Thread(target=self._run, args=(on_block,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _run(self, on_block: BlockCallback):
+        block_seconds = self.block_size / self.sample_rate
+        started = time.perf_counter()
+        produced = 0
+
+        while self._running:
+            block = self._next_block()
+            if block is None:
+                break
+            on_block(block, False)
+            produced += 1
+
+            if self.realtime:
+                delay = started + produced * block_seconds - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+        self.finished.set()
+
+    def _next_block(self) -> Optional[np.ndarray]:
+        raise NotImplementedError
+
+
+class WavFileSource(_ThreadSource):
+    """Plays a 16-bit WAV file into the hub, for tests and benchmarks."""
+
+    def __init__(self, path: str, block_size: int = 512, realtime: bool = True,
+                 loop: bool = False):
+        """Open the file.
+
+        Args:
+            path: 16-bit PCM WAV file
+            block_size: Frames per block
+            realtime: Pace blocks to the file's duration (False: as fast as
+                possible; subscribers that fall behind then lose frames)
+            loop: Start over at the end instead of finishing
+        """
+        self.path = path
+        self._wav = wave.open(path, 'rb')
+        if self._wav.getsampwidth() != 2:
+            raise ValueError(f"Unsupported WAV sample width: {self._wav.getsampwidth()}")
+        super().__init__(self._wav.getframerate(), self._wav.getnchannels(), block_size, realtime)
+        self.loop = loop
+
+    def start(self, on_block: BlockCallback):
+        # stop() closes the file; a restart plays it from the beginning
+        if self._wav is None:
+            self._wav = wave.open(self.path, 'rb')
+        super().start(on_block)
+
+    def _next_block(self) -> Optional[np.ndarray]:
+        data = self._wav.readframes(self.block_size)
+        if not data and self.loop:
+            self._wav.rewind()
+            data = self._wav.readframes(self.block_size)
+        if not data:
+            return None
+        return np.frombuffer(data, dtype='<i2')
+
+    def stop(self):
+        super().stop()
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+
+
+class NullSource(_ThreadSource):
+    """Digital silence at real-time pace, for running without a microphone."""
+
+    def __init__(self, sample_rate: int = 16000, block_size: int = 512):
+        super().__init__(sample_rate, 1, block_size, realtime=True)
+        self._silence = np.zeros(block_size, dtype=np.int16)
+
+    def _next_block(self) -> Optional[np.ndarray]:
+        return self._silence
+
+
+class _Resampler:
+    """Streaming linear-interpolation resampler for float mono audio."""
+
+    def __init__(self, source_rate: int, target_rate: int):
+        self.step = source_rate / target_rate
+        self._position = 0.0
+        self._last = None
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        # Index 0 is the previous block's last sample, so interpolation
+        # continues across block boundaries
+        data = samples if self._last is None else np.concatenate(([self._last], samples))
+        positions = np.arange(self._position, len(data) - 1, self.step)
+        out = np.interp(positions, np.arange(len(data)), data)
+
+        next_position = positions[-1] + self.step if len(positions) else self._position
+        self._position = next_position - (len(data) - 1)
+        self._last = data[-1]
+        return out
+
+
+class CaptureHub:
+    """Owns the input device and fans captured frames out to subscribers.
+
+    Each block from the source is converted once (downmixed to mono,
+    resampled to sample_rate, cut into frame_length frames) and every
+    frame is then copied into each subscriber's AudioRingBuffer. A
+    subscriber that falls behind only loses its own frames; the others
+    and the device callback are unaffected.
+    """
+
+    def __init__(self, source: CaptureSource, sample_rate: int = 16000, frame_length: int = 512):
+        """Set up the hub (the source is started by start()).
+
+        Args:
+            source: Where audio comes from
+            sample_rate: Rate of the published frames, in Hz
+            frame_length: Samples per published frame
+        """
+        self.source = source
+        self.sample_rate = sample_rate
+        self.frame_length = frame_length
+
+        self._subscribers: Tuple[AudioRingBuffer, ...] = ()
+        self._names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._running = False
+
+        self._resampler = None
+        self._frame = np.zeros(frame_length, dtype=np.int16)
+        self._filled = 0
+
+        self.blocks = 0
+        self.frames_published = 0
+        self.input_overflows = 0
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'CaptureHub':
+        """Build the hub described by the audio config section.
+
+        Args:
+            config: Full configuration
+
+        Returns:
+            Hub over the configured source (not started)
+        """
+        audio = config.get('audio', {})
+        sample_rate = audio.get('sample_rate', 16000)
+        frame_length = audio.get('frame_length', 512)
+        capture_rate = audio.get('capture_rate') or sample_rate
+        channels = audio.get('channels', 1)
+        device = audio.get('input_device')
+
+        kind = audio.get('source', 'pyaudio')
+        if kind == 'pyaudio' and not PYAUDIO_AVAILABLE and SOUNDDEVICE_AVAILABLE:
+            kind = 'sounddevice'
+        elif kind == 'sounddevice' and not SOUNDDEVICE_AVAILABLE and PYAUDIO_AVAILABLE:
+            kind = 'pyaudio'
+
+        if kind == 'pyaudio':
+            source = PyAudioSource(capture_rate, channels, frame_length, device)
+        elif kind == 'sounddevice':
+            source = SoundDeviceSource(capture_rate, channels, frame_length, device)
+        elif kind == 'wav':
+            path = audio.get('source_file')
+            if not path:
+                raise ValueError("audio.source is 'wav' but audio.source_file is not set")
+            if not os.path.isfile(path):
+                raise ValueError(f"audio.source_file not found: {path}")
+            source = WavFileSource(path, frame_length, loop=audio.get('source_loop', False))
+        elif kind == 'null':
+            source = NullSource(sample_rate, frame_length)
+        else:
+            raise ValueError(f"Unknown audio source: {kind}")
+
+        return cls(source, sample_rate, frame_length)
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def subscribe(self, name: str, seconds: float = 2.0) -> AudioRingBuffer:
+        """Start receiving frames.
+
+        Args:
+            name: Label for stats()
+            seconds: Audio the subscriber's queue holds before frames are dropped
+
+        Returns:
+            Ring buffer to read frames from (read_into())
+        """
+        capacity = max(1, int(seconds * self.sample_rate / self.frame_length))
+        ring = AudioRingBuffer(capacity, self.frame_length)
+        with self._lock:
+            self._names[id(ring)] = name
+            self._subscribers = self._subscribers + (ring,)
+        return ring
+
+    def unsubscribe(self, ring: AudioRingBuffer):
+        """Stop delivering frames to a ring returned by subscribe()."""
+        with self._lock:
+            self._names.pop(id(ring), None)
+            self._subscribers = tuple(r for r in self._subscribers if r is not ring)
+
+    def start(self) -> bool:
+        """Open the source if it is not running yet.
+
+        Returns:
+            True if audio is being captured
+        """
+        with self._lock:
+            if self._running:
+                return True
+            self._resampler = None
+            if self.source.sample_rate != self.sample_rate:
+                self._resampler = _Resampler(self.source.sample_rate, self.sample_rate)
+                logger.info(f"Resampling capture from {self.source.sample_rate} Hz "
+                            f"to {self.sample_rate} Hz")
+            self._filled = 0
+            try:
+                self.source.start(self._on_block)
+            except Exception as e:
+                logger.error(f"Failed to start audio capture: {e}")
+                return False
+            self._running = True
+
+        logger.info(f"Audio capture started ({type(self.source).__name__})")
+        return True
+
+    def stop(self):
+        """Close the source."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self.source.stop()
+        logger.info("Audio capture stopped")
+
+    def _on_block(self, block: np.ndarray, overflowed: bool):
+        """Source callback: convert a block once and publish its frames."""
+        self.blocks += 1
+        subscribers = self._subscribers
+        if overflowed:
+            self.input_overflows += 1
+            for ring in subscribers:
+                ring.input_overflows += 1
+
+        channels = self.source.channels
+        if channels > 1 or self._resampler is not None:
+            samples = block.astype(np.float32)
+            if channels > 1:
+                samples = samples.reshape(-1, channels).mean(axis=1)
+            if self._resampler is not None:
+                samples = self._resampler.process(samples)
+            block = np.clip(samples, -32768, 32767).astype(np.int16)
+
+        position = 0
+        while position < len(block):
+            take = min(self.frame_length - self._filled, len(block) - position)
+            self._frame[self._filled:self._filled + take] = block[position:position + take]
+            self._filled += take
+            position += take
+
+            if self._filled == self.frame_length:
+                self._filled = 0
+                self.frames_published += 1
+                for ring in subscribers:
+                    ring.write_samples(self._frame)
+
+    def stats(self) -> Dict[str, object]:
+        """Counters.
+
+        Returns:
+            Source blocks received, frames published, driver input
+            overflows and each subscriber's ring counters
+        """
+        with self._lock:
+            subscribers = {self._names.get(id(ring), '?'): ring.stats()
+                           for ring in self._subscribers}
+        return {
+            'source': type(self.source).__name__,
+            'blocks': self.blocks,
+            'frames_published': self.frames_published,
+            'input_overflows': self.input_overflows,
+            'subscribers': subscribers
+        }
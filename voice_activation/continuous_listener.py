@@ -1,11 +1,17 @@
 """Continuous listening service for voice activation."""
 
 import logging
+import re
 import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
+import numpy as np
 import yaml
 
+from jarvis_core.model_registry import memory_budget
+from .capture import CaptureHub
+from .streaming_recognizer import StreamingTranscriber
+from .vad import Endpointer
 from .wake_word import WakeWordDetector
 
 logger = logging.getLogger(__name__)
@@ -14,13 +20,18 @@ logger = logging.getLogger(__name__)
 class ContinuousListener:
     """Always-on listening service with wake word activation."""
     
-    def __init__(self, config_path: str = "config.yaml"):
+    def __init__(self, config_path: str = "config.yaml", capture: Optional[CaptureHub] = None):
         """Initialize continuous listener.
         
         Args:
             config_path: Path to configuration file
+            capture: Shared audio capture (created from the audio config
+                section if not given)
         """
         self.config = self._load_config(config_path)
+        self.config_path = config_path
+        self.capture = capture
+        self._owns_capture = capture is None
         self.wake_word_detector = None
         self.is_running = False
         self.listen_thread = None
@@ -28,6 +39,29 @@ class ContinuousListener:
         # Callbacks
         self.on_wake_word = None
         self.on_command_received = None
+        self.on_partial_transcript = None
+        
+        # Barge-in: speech output to cut off when the wake word fires
+        self.speech_output = None
+        self.barge_in = self.config.get('voice_activation', {}).get('barge_in', True)
+        
+        # Command capture after the wake word
+        self.recognizer = None
+        self.capture_thread = None
+        
+        # Pre-roll plus live audio of the command being recorded, filled by
+        # the listening thread from the wake word stream
+        self._command_audio = None
+        self._command_length = 0
+        self._endpointer = None
+        self._stream = None
+        
+        # CPU used by the listening thread, for capture_stats(); idle is
+        # the time spent waiting for the wake word
+        self._loop_cpu = 0.0
+        self._loop_wall = 0.0
+        self._idle_cpu = 0.0
+        self._idle_wall = 0.0
         
     def _load_config(self, config_path: str) -> dict:
         """Load configuration."""
@@ -45,15 +79,54 @@ class ContinuousListener:
         """Set callback for voice command."""
         self.on_command_received = callback
         
+    def set_partial_callback(self, callback: Callable):
+        """Set callback for the transcript so far while a command is spoken."""
+        self.on_partial_transcript = callback
+        
+    def set_speech_output(self, tts_engine):
+        """Set the TTS engine to interrupt when the wake word is heard.
+        
+        Args:
+            tts_engine: Object with interrupt() (e.g. TTSEngine)
+        """
+        self.speech_output = tts_engine
+        
+    def set_recognizer(self, recognizer):
+        """Set the recognizer used to capture the command after the wake word.
+        
+        Args:
+            recognizer: Object with transcribe() and listen_and_transcribe()
+                (e.g. WhisperRecognizer)
+        """
+        self.recognizer = recognizer
+        self._share_capture()
+        
+    def _share_capture(self):
+        """Let the recognizer record from the listener's capture."""
+        if self.capture is not None and hasattr(self.recognizer, 'set_capture'):
+            self.recognizer.set_capture(self.capture)
+        
     def start(self) -> bool:
         """Start continuous listening."""
         if self.is_running:
             logger.warning("Listener already running")
             return False
             
+        # One input stream for the wake word engine and command recording
+        if self.capture is None:
+            try:
+                self.capture = CaptureHub.from_config(self.config)
+            except Exception as e:
+                logger.error(f"Failed to set up audio capture: {e}")
+                return False
+        self._share_capture()
+        
         # Initialize wake word detector
         self.wake_word_detector = WakeWordDetector(
-            callback=self._handle_wake_word
+            self.config_path,
+            callback=self._handle_wake_word,
+            capture=self.capture,
+            stop_callback=self._handle_stop_word
         )
         
         if not self.wake_word_detector.start():
@@ -79,37 +152,238 @@ class ContinuousListener:
         if self.listen_thread:
             self.listen_thread.join(timeout=2.0)
             self.listen_thread = None
+        
+        self._command_audio = None
+        if self._stream is not None:
+            self._stream.cancel()
+            self._stream = None
+        
+        if self._owns_capture and self.capture is not None:
+            self.capture.stop()
             
         logger.info("Continuous listener stopped")
         
     def _listen_loop(self):
         """Main listening loop (runs in thread)."""
         logger.info("Listening loop started")
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
         
         while self.is_running:
+            iteration_cpu = time.thread_time()
+            iteration_wall = time.perf_counter()
+            idle = self._command_audio is None
             try:
-                # Check for wake word
-                if self.wake_word_detector:
-                    self.wake_word_detector.listen()
+                # Blocks until the capture callback delivers a frame
+                if not idle:
+                    self._record_command_frame()
+                elif self.wake_word_detector:
+                    self.wake_word_detector.listen(timeout=0.1)
                     
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.01)
-                
             except Exception as e:
                 logger.error(f"Error in listen loop: {e}")
                 time.sleep(0.1)
-                
-        logger.info("Listening loop stopped")
+            
+            if idle:
+                self._idle_cpu += time.thread_time() - iteration_cpu
+                self._idle_wall += time.perf_counter() - iteration_wall
+            self._loop_cpu = time.thread_time() - cpu_start
+            self._loop_wall = time.perf_counter() - wall_start
+        
+        stats = self.capture_stats()
+        if stats['idle_cpu_percent'] is not None:
+            logger.info(f"Listening loop stopped: {stats['idle_cpu_percent']:.2f}% of one core "
+                        f"while waiting for the wake word ({self._idle_wall:.1f} s), "
+                        f"{stats['listener_cpu_percent']:.2f}% overall, "
+                        f"{stats.get('overflows', 0)} frames dropped")
+        else:
+            logger.info("Listening loop stopped")
+        
+    def capture_stats(self) -> Dict[str, Optional[float]]:
+        """Audio capture health.
+        
+        Returns:
+            Ring buffer counters (frames written and queued, frames dropped
+            because the consumer fell behind, driver input overflows), VAD
+            gate counters and the listening thread's CPU usage in percent
+            of one core, overall and while waiting for the wake word
+        """
+        stats = dict(self.wake_word_detector.capture_stats()) if self.wake_word_detector else {}
+        stats['listener_cpu_percent'] = (
+            self._loop_cpu / self._loop_wall * 100 if self._loop_wall else None
+        )
+        stats['idle_cpu_percent'] = (
+            self._idle_cpu / self._idle_wall * 100 if self._idle_wall else None
+        )
+        return stats
         
     def _handle_wake_word(self):
         """Handle wake word detection."""
         logger.info("Wake word callback triggered")
         
+        # Barge-in: stop talking over the user before anything else
+        if self.barge_in and self.speech_output is not None:
+            self.speech_output.interrupt()
+        
+        # Reload models unloaded while idle before the command needs them
+        if self.config.get('memory', {}).get('prewarm_on_wake', True):
+            memory_budget.prewarm()
+        
         if self.on_wake_word:
             self.on_wake_word()
             
-        # TODO: Record and transcribe the following command
-        # For now, just trigger the callback
+        self._start_command_capture()
+        
+    def _handle_stop_word(self):
+        """Handle a stop keyword: cut off speech without starting a command."""
+        if self.speech_output is not None:
+            self.speech_output.interrupt()
+        
+    def _start_command_capture(self):
+        """Record and transcribe the command following the wake word."""
+        if self.recognizer is None or self.on_command_received is None:
+            return
+        
+        if self._command_audio is not None or (self.capture_thread and self.capture_thread.is_alive()):
+            logger.debug("Command capture already in progress")
+            return
+        
+        preroll = self.wake_word_detector.preroll if self.wake_word_detector else None
+        if preroll is None:
+            # No pre-roll: the recognizer opens its own recording
+            self.capture_thread = threading.Thread(target=self._capture_command, daemon=True)
+            self.capture_thread.start()
+            return
+        
+        # Runs on the listening thread, which keeps the wake word stream open
+        # and appends live frames after the pre-roll (see _record_command_frame)
+        engine = self.wake_word_detector.engine
+        self._endpointer = Endpointer.from_config(
+            self.config.get('speech_recognition', {}), engine.sample_rate, engine.frame_length
+        )
+        if self._endpointer is not None:
+            duration = self._endpointer.max_seconds
+        else:
+            duration = self.config.get('voice_activation', {}).get('command_seconds', 5)
+        recent = preroll.view()
+        live = int(duration * engine.sample_rate)
+        
+        self._command_audio = np.empty(len(recent) + live, dtype=np.int16)
+        self._command_audio[:len(recent)] = recent
+        self._command_length = len(recent)
+        
+        # Transcribe while the command is still being spoken
+        sr_config = self.config.get('speech_recognition', {})
+        if sr_config.get('streaming', True) and hasattr(self.recognizer, 'transcribe_words'):
+            self._stream = StreamingTranscriber(
+                self.recognizer,
+                sr_config.get('language', 'en'),
+                engine.sample_rate,
+                step_seconds=sr_config.get('stream_step_seconds', 1.0),
+                window_seconds=sr_config.get('stream_window_seconds', 5),
+                on_partial=self._handle_partial
+            )
+            self._stream.feed(recent)
+        logger.info(f"Recording command ({len(recent)} samples of pre-roll)")
+        
+    def _record_command_frame(self):
+        """Append the next captured frame to the command being recorded."""
+        frame = self.wake_word_detector.read_frame(timeout=0.1)
+        if frame is None:
+            return
+        
+        end = min(self._command_length + len(frame), len(self._command_audio))
+        self._command_audio[self._command_length:end] = frame[:end - self._command_length]
+        self._command_length = end
+        if self._stream is not None:
+            self._stream.feed(frame)
+        
+        # Stop when the speaker is done, or when the buffer is full
+        ended = self._endpointer is not None and self._endpointer.update(frame)
+        if ended or self._command_length == len(self._command_audio):
+            if self._endpointer is not None:
+                logger.info(f"Command recorded: {self._endpointer.elapsed:.1f} s "
+                            f"({self._endpointer.reason or 'max_length'})")
+            if self._stream is not None:
+                target, args = self._finish_stream, (self._stream,)
+                self._stream = None
+            else:
+                # Whisper takes float32 in [-1, 1]
+                audio = self._command_audio[:self._command_length].astype(np.float32) / 32768.0
+                target, args = self._transcribe_command, (audio,)
+            self._command_audio = None
+            self.capture_thread = threading.Thread(target=target, args=args, daemon=True)
+            self.capture_thread.start()
+        
+    def _capture_command(self):
+        """Capture thread: transcribe one command and hand it to the callback."""
+        # None lets the recognizer stop when the speaker does
+        duration = None
+        if not self.config.get('speech_recognition', {}).get('endpointing', True):
+            duration = self.config.get('voice_activation', {}).get('command_seconds', 5)
+        language = self.config.get('speech_recognition', {}).get('language', 'en')
+        
+        try:
+            text = self.recognizer.listen_and_transcribe(duration, language)
+        except Exception as e:
+            logger.error(f"Command capture failed: {e}")
+            return
+        
+        if text:
+            self.on_command_received(text)
+        
+    def _transcribe_command(self, audio: np.ndarray):
+        """Capture thread: transcribe recorded audio and hand it to the callback.
+        
+        Args:
+            audio: Pre-roll plus command audio, float32 at the capture rate
+        """
+        language = self.config.get('speech_recognition', {}).get('language', 'en')
+        
+        try:
+            text = self.recognizer.transcribe(audio, language)
+        except Exception as e:
+            logger.error(f"Command transcription failed: {e}")
+            return
+        
+        # The pre-roll usually contains the wake word itself
+        text = self._strip_wake_word(text or '')
+        if text:
+            self.on_command_received(text)
+        
+    def _finish_stream(self, stream: StreamingTranscriber):
+        """Capture thread: finalize a streamed transcript and hand it to the callback.
+        
+        Args:
+            stream: Transcriber fed with the pre-roll and command audio
+        """
+        try:
+            text = stream.finish()
+        except Exception as e:
+            logger.error(f"Command transcription failed: {e}")
+            return
+        
+        stats = stream.stats()
+        logger.info(f"Command transcribed {stats['finalize_seconds'] * 1000:.0f} ms after recording "
+                    f"({stats['decodes']} decodes, RTF {stats['real_time_factor']:.2f}, "
+                    f"final decode {stats['final_window_seconds'] or 0:.1f} s of audio)")
+        
+        text = self._strip_wake_word(text)
+        if text:
+            self.on_command_received(text)
+        
+    def _handle_partial(self, text: str):
+        """Pass the transcript so far (without the wake word) to the callback."""
+        text = self._strip_wake_word(text)
+        if text and self.on_partial_transcript:
+            self.on_partial_transcript(text)
+        
+    def _strip_wake_word(self, text: str) -> str:
+        """Remove a leading wake word (e.g. "Jarvis, open Chrome")."""
+        heard = self.wake_word_detector.last_keyword if self.wake_word_detector else None
+        wake_word = heard.word if heard else self.config.get('voice_activation', {}).get('wake_word', 'jarvis')
+        pattern = rf"^\W*(?:hey\s+)?{re.escape(wake_word)}\b[\s,.!?]*"
+        return re.sub(pattern, '', text, flags=re.IGNORECASE).strip()
         
     def __del__(self):
         """Cleanup on deletion."""
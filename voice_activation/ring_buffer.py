@@ -0,0 +1,170 @@
+"""Fixed-size audio buffers for the capture path."""
+
+import threading
+from typing import Dict
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Single-producer, single-consumer ring of int16 audio frames.
+
+    The producer (the audio driver's callback thread) only advances the
+    write index and the consumer only advances the read index, so neither
+    side takes a lock. When the ring is full the incoming frame is
+    dropped and counted, rather than blocking the callback. The consumer
+    sleeps on an event that the producer sets when data arrives.
+    """
+
+    def __init__(self, capacity: int, frame_length: int):
+        """Allocate the ring.
+
+        Args:
+            capacity: Number of frames held
+            frame_length: Samples per frame
+        """
+        self.capacity = capacity
+        self.frame_length = frame_length
+        self._frames = np.zeros((capacity, frame_length), dtype=np.int16)
+        self._write = 0
+        self._read = 0
+        self._data_ready = threading.Event()
+
+        self.frames_written = 0
+        self.overflows = 0
+        self.input_overflows = 0
+
+    def __len__(self) -> int:
+        """Frames waiting to be read."""
+        return self._write - self._read
+
+    def write(self, pcm: bytes) -> int:
+        """Append whole frames of int16 PCM (producer side).
+
+        Args:
+            pcm: Raw audio bytes; a multiple of frame_length samples
+
+        Returns:
+            Number of frames stored (the rest were dropped as overflow)
+        """
+        return self.write_samples(np.frombuffer(pcm, dtype='<i2'))
+
+    def write_samples(self, samples: np.ndarray) -> int:
+        """Append whole frames of int16 samples (producer side).
+
+        Args:
+            samples: Audio; a multiple of frame_length samples
+
+        Returns:
+            Number of frames stored (the rest were dropped as overflow)
+        """
+        stored = 0
+        for start in range(0, len(samples) - self.frame_length + 1, self.frame_length):
+            if self._write - self._read >= self.capacity:
+                self.overflows += 1
+                continue
+            self._frames[self._write % self.capacity] = samples[start:start + self.frame_length]
+            self._write += 1
+            stored += 1
+
+        self.frames_written += stored
+        if stored:
+            self._data_ready.set()
+        return stored
+
+    def read_into(self, out: np.ndarray, timeout: float = None) -> bool:
+        """Copy the oldest frame into out (consumer side).
+
+        Args:
+            out: int16 array of frame_length samples
+            timeout: Seconds to wait for data (None waits indefinitely)
+
+        Returns:
+            True if a frame was read, False on timeout
+        """
+        if self._read == self._write:
+            self._data_ready.clear()
+            # Re-check after clearing so a write in between is not missed
+            if self._read == self._write and not self._data_ready.wait(timeout):
+                return False
+            if self._read == self._write:
+                return False
+
+        out[:] = self._frames[self._read % self.capacity]
+        self._read += 1
+        return True
+
+    def clear(self):
+        """Discard unread frames (consumer side)."""
+        self._read = self._write
+
+    def stats(self) -> Dict[str, int]:
+        """Counters.
+
+        Returns:
+            Frames written, frames queued, frames dropped because the ring
+            was full, and input overflows reported by the audio driver
+        """
+        return {
+            'frames_written': self.frames_written,
+            'queued': len(self),
+            'overflows': self.overflows,
+            'input_overflows': self.input_overflows
+        }
+
+
+class PreRollBuffer:
+    """Rolling window of the most recent samples, readable without copying.
+
+    Every sample is stored twice, at its slot and one capacity further on,
+    so the newest `capacity` samples always lie contiguously in the
+    backing array. view() is therefore a plain slice, however often the
+    window has wrapped around.
+    """
+
+    def __init__(self, capacity: int):
+        """Allocate the window.
+
+        Args:
+            capacity: Number of samples kept
+        """
+        self.capacity = capacity
+        self._samples = np.zeros(2 * capacity, dtype=np.int16)
+        self._end = 0
+        self._filled = 0
+
+    def __len__(self) -> int:
+        """Samples currently held."""
+        return self._filled
+
+    def append(self, samples: np.ndarray):
+        """Add samples, forgetting the oldest once the window is full.
+
+        Args:
+            samples: int16 audio
+        """
+        if len(samples) > self.capacity:
+            samples = samples[-self.capacity:]
+        count = len(samples)
+
+        head = min(count, self.capacity - self._end)
+        for offset in (0, self.capacity):
+            start = self._end + offset
+            self._samples[start:start + head] = samples[:head]
+            self._samples[offset:offset + count - head] = samples[head:]
+
+        self._end = (self._end + count) % self.capacity
+        self._filled = min(self.capacity, self._filled + count)
+
+    def view(self) -> np.ndarray:
+        """The held samples, oldest first.
+
+        Returns:
+            int16 view into the buffer (overwritten by later appends)
+        """
+        end = self._end + self.capacity
+        return self._samples[end - self._filled:end]
+
+    def clear(self):
+        """Forget the held samples."""
+        self._filled = 0
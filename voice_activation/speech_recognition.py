@@ -2,9 +2,13 @@
 
 import logging
 import numpy as np
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 import yaml
 
+from jarvis_core.model_registry import ResidentModel, memory_budget, models
+from .capture import CaptureHub, SoundDeviceSource
+from .vad import Endpointer
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -14,6 +18,12 @@ except ImportError:
     WHISPER_AVAILABLE = False
     logger.warning("Whisper not installed. Install with: pip install openai-whisper")
 
+try:
+    import faster_whisper
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
 try:
     import sounddevice as sd
     SOUNDDEVICE_AVAILABLE = True
@@ -22,17 +32,218 @@ except ImportError:
     logger.warning("sounddevice not installed. Install with: pip install sounddevice")
 
 
+class STTBackend:
+    """Loads a Whisper model with one inference library and runs it.
+    
+    load() builds the model (called again after the memory budget unloads
+    it); transcribe() runs a loaded model on 16 kHz float32 audio.
+    """
+    
+    name = 'base'
+    
+    def __init__(self, model_size: str = 'base', device: str = 'cpu'):
+        """Configure the backend without loading anything.
+        
+        Args:
+            model_size: Whisper model size (tiny, base, small, medium, large)
+            device: "cpu" or "cuda"
+        """
+        self.model_size = model_size
+        self.device = device
+    
+    @property
+    def key(self) -> tuple:
+        """Settings that determine the loaded model, for sharing it."""
+        return (self.name, self.model_size, self.device)
+    
+    def load(self) -> Any:
+        """Load the model.
+        
+        Returns:
+            The model passed to transcribe()
+        """
+        raise NotImplementedError
+    
+    def transcribe(self, model: Any, audio: np.ndarray, language: str,
+                   prompt: Optional[str] = None,
+                   word_timestamps: bool = False) -> Tuple[str, List[Tuple[str, float, float]]]:
+        """Transcribe audio.
+        
+        Args:
+            model: Model returned by load()
+            audio: Audio data (float32, 16 kHz)
+            language: Language code
+            prompt: Text preceding the audio, for context
+            word_timestamps: Time individual words instead of segments
+            
+        Returns:
+            The text, and (text, start, end) per word (or per segment
+            without word_timestamps, or when the library cannot time words)
+        """
+        raise NotImplementedError
+
+
+class OpenAIWhisperBackend(STTBackend):
+    """The reference PyTorch implementation (openai-whisper)."""
+    
+    name = 'whisper'
+    
+    def __init__(self, model_size: str = 'base', device: str = 'cpu'):
+        if not WHISPER_AVAILABLE:
+            raise RuntimeError("Whisper not available. Install with: pip install openai-whisper")
+        super().__init__(model_size, device)
+    
+    def load(self) -> Any:
+        return whisper.load_model(self.model_size, device=self.device)
+    
+    def transcribe(self, model: Any, audio: np.ndarray, language: str,
+                   prompt: Optional[str] = None,
+                   word_timestamps: bool = False) -> Tuple[str, List[Tuple[str, float, float]]]:
+        # Half precision only helps (and only works) on the GPU
+        options = {'language': language, 'initial_prompt': prompt,
+                   'fp16': self.device.startswith('cuda')}
+        
+        result = None
+        if word_timestamps:
+            try:
+                result = model.transcribe(audio, word_timestamps=True, **options)
+            except TypeError:
+                # Whisper releases before word timestamps
+                pass
+        if result is None:
+            result = model.transcribe(audio, **options)
+        
+        spans = []
+        for segment in result['segments']:
+            for word in segment.get('words') or [{'word': segment['text'], 'start': segment['start'],
+                                                   'end': segment['end']}]:
+                spans.append((word['word'].strip(), word['start'], word['end']))
+        return result['text'].strip(), [span for span in spans if span[0]]
+
+
+class QuantizedWhisperBackend(OpenAIWhisperBackend):
+    """openai-whisper with int8 dynamic quantization of the linear layers (CPU only).
+    
+    Weights of the attention and MLP projections are stored as int8 and
+    activations are quantized on the fly, which cuts the model's memory
+    and speeds up CPU inference without extra dependencies.
+    """
+    
+    name = 'whisper-int8'
+    
+    def __init__(self, model_size: str = 'base', device: str = 'cpu'):
+        if device != 'cpu':
+            logger.warning(f"{self.name} runs on the CPU only (device {device} ignored)")
+        super().__init__(model_size, 'cpu')
+    
+    def load(self) -> Any:
+        import torch
+        
+        model = whisper.load_model(self.model_size, device='cpu')
+        # Whisper's Linear subclass only adds a dtype cast; quantize_dynamic
+        # matches exact module types, so present its layers as nn.Linear
+        for module in model.modules():
+            if isinstance(module, torch.nn.Linear):
+                module.__class__ = torch.nn.Linear
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class FasterWhisperBackend(STTBackend):
+    """CTranslate2 inference through faster-whisper, int8 by default."""
+    
+    name = 'faster-whisper'
+    
+    def __init__(self, model_size: str = 'base', device: str = 'cpu',
+                 compute_type: str = 'int8', cpu_threads: int = 0):
+        """Configure the backend without loading anything.
+        
+        Args:
+            model_size: Whisper model size (tiny, base, small, medium, large)
+            device: "cpu" or "cuda"
+            compute_type: CTranslate2 weight type (int8, int8_float16,
+                float16, float32)
+            cpu_threads: Inference threads (0: CTranslate2's default)
+        """
+        if not FASTER_WHISPER_AVAILABLE:
+            raise RuntimeError("faster-whisper not available. Install with: pip install faster-whisper")
+        super().__init__(model_size, device)
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+    
+    @property
+    def key(self) -> tuple:
+        return (self.name, self.model_size, self.device, self.compute_type, self.cpu_threads)
+    
+    def load(self) -> Any:
+        return faster_whisper.WhisperModel(self.model_size, device=self.device,
+                                           compute_type=self.compute_type,
+                                           cpu_threads=self.cpu_threads)
+    
+    def transcribe(self, model: Any, audio: np.ndarray, language: str,
+                   prompt: Optional[str] = None,
+                   word_timestamps: bool = False) -> Tuple[str, List[Tuple[str, float, float]]]:
+        # Greedy decoding, as openai-whisper's transcribe() does by default
+        segments, _ = model.transcribe(audio, language=language, beam_size=1,
+                                       initial_prompt=prompt, word_timestamps=word_timestamps)
+        
+        text = []
+        spans = []
+        # Segments are decoded lazily while iterating
+        for segment in segments:
+            text.append(segment.text)
+            if word_timestamps and segment.words:
+                spans += [(word.word.strip(), word.start, word.end) for word in segment.words]
+            else:
+                spans.append((segment.text.strip(), segment.start, segment.end))
+        return ''.join(text).strip(), [span for span in spans if span[0]]
+
+
+BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    QuantizedWhisperBackend.name: QuantizedWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend
+}
+
+
+def create_backend(config: dict) -> STTBackend:
+    """Build the backend named by speech_recognition.engine.
+    
+    Args:
+        config: speech_recognition settings
+        
+    Returns:
+        The backend (not loaded yet)
+    """
+    name = config.get('engine', 'whisper')
+    model_size = config.get('model_size', 'base')
+    device = config.get('device', 'cpu')
+    
+    if name == FasterWhisperBackend.name:
+        return FasterWhisperBackend(model_size, device,
+                                    compute_type=config.get('compute_type', 'int8'),
+                                    cpu_threads=config.get('cpu_threads', 0))
+    if name in BACKENDS:
+        return BACKENDS[name](model_size, device)
+    raise ValueError(f"Unknown speech recognition engine: {name} (choose from {', '.join(BACKENDS)})")
+
+
 class WhisperRecognizer:
-    """Speech-to-text using OpenAI Whisper."""
+    """Speech-to-text using Whisper (backend chosen by speech_recognition.engine)."""
     
-    def __init__(self, config_path: str = "config.yaml"):
-        """Initialize Whisper recognizer."""
+    def __init__(self, config_path: str = "config.yaml", backend: Optional[STTBackend] = None):
+        """Initialize Whisper recognizer.
+        
+        Args:
+            config_path: Path to configuration file
+            backend: Backend to use instead of the configured one
+        """
         self.config = self._load_config(config_path)
+        self.backend = backend
         self.model = None
         self.sample_rate = 16000
+        self.capture = None
         
-        if WHISPER_AVAILABLE:
-            self._load_model()
+        self._load_model()
     
     def _load_config(self, config_path: str) -> dict:
         """Load configuration."""
@@ -50,22 +261,66 @@ class WhisperRecognizer:
     def _load_model(self):
         """Load Whisper model."""
         try:
-            model_size = self.config.get('speech_recognition', {}).get('model_size', 'base')
-            logger.info(f"Loading Whisper model: {model_size}")
-            self.model = whisper.load_model(model_size)
+            if self.backend is None:
+                self.backend = create_backend(self.config.get('speech_recognition', {}))
+            backend = self.backend
+            logger.info(f"Loading Whisper model: {backend.model_size} ({backend.name})")
+            memory_budget.configure(self.config.get('memory'))
+            
+            def load() -> ResidentModel:
+                # Unloaded while idle and reloaded on the next transcription
+                resident = ResidentModel(f"{backend.name}:{backend.model_size}", backend.load)
+                resident.load()
+                return resident
+            
+            # One copy per backend configuration, shared by every recognizer
+            self.model = models.acquire('whisper', backend.key, load, closer=ResidentModel.close)
             logger.info("Whisper model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
     
-    def record_audio(self, duration: int = 5) -> Optional[np.ndarray]:
+    def close(self):
+        """Release the shared Whisper model."""
+        if self.model is not None:
+            models.release(self.model)
+            self.model = None
+    
+    def set_capture(self, capture):
+        """Record from a shared audio capture instead of opening a stream.
+        
+        Args:
+            capture: CaptureHub publishing audio at this recognizer's sample rate
+        """
+        if capture.sample_rate != self.sample_rate:
+            logger.warning(f"Capture runs at {capture.sample_rate} Hz; "
+                           f"Whisper needs {self.sample_rate} Hz. Recording separately.")
+            return
+        self.capture = capture
+    
+    def record_audio(self, duration: Optional[float] = None) -> Optional[np.ndarray]:
         """Record audio from microphone.
         
         Args:
-            duration: Recording duration in seconds
+            duration: Recording duration in seconds; None records until the
+                speaker stops (speech_recognition.endpointing), or for 5
+                seconds when endpointing is off
             
         Returns:
             Audio data as numpy array
         """
+        endpointing = duration is None and self.config.get('speech_recognition', {}).get('endpointing', True)
+        if duration is None and not endpointing:
+            duration = 5
+        
+        if self.capture is not None or endpointing:
+            capture = self.capture
+            if capture is None:
+                if not SOUNDDEVICE_AVAILABLE:
+                    logger.error("sounddevice not available")
+                    return None
+                capture = CaptureHub(SoundDeviceSource(self.sample_rate), self.sample_rate)
+            return self._record_from_capture(capture, duration, endpointing)
+        
         if not SOUNDDEVICE_AVAILABLE:
             logger.error("sounddevice not available")
             return None
@@ -85,6 +340,50 @@ class WhisperRecognizer:
             logger.error(f"Recording failed: {e}")
             return None
     
+    def _record_from_capture(self, capture: CaptureHub, duration: Optional[float],
+                             endpointing: bool) -> Optional[np.ndarray]:
+        """Record by subscribing to an audio capture, optionally until the speaker stops."""
+        frame_length = capture.frame_length
+        endpointer = None
+        if endpointing:
+            endpointer = Endpointer.from_config(self.config.get('speech_recognition', {}),
+                                                self.sample_rate, frame_length)
+            duration = endpointer.max_seconds
+        
+        frames = int(np.ceil(duration * self.sample_rate / frame_length))
+        audio = np.empty(frames * frame_length, dtype=np.int16)
+        recorded = 0
+        
+        ring = capture.subscribe('recorder', duration + 1.0)
+        started_here = not capture.is_running
+        try:
+            if not capture.start():
+                return None
+            if endpointer is not None:
+                logger.info(f"Recording until speech ends (at most {duration} seconds)...")
+            else:
+                logger.info(f"Recording for {duration} seconds...")
+            
+            while recorded < frames:
+                frame = audio[recorded * frame_length:(recorded + 1) * frame_length]
+                if not ring.read_into(frame, timeout=1.0):
+                    logger.error("Recording failed: audio capture stopped delivering")
+                    return None
+                recorded += 1
+                if endpointer is not None and endpointer.update(frame):
+                    break
+        finally:
+            capture.unsubscribe(ring)
+            if started_here:
+                capture.stop()
+        
+        if endpointer is not None:
+            logger.info(f"Recording complete: {endpointer.elapsed:.1f} s, "
+                        f"{endpointer.speech_seconds:.1f} s of speech ({endpointer.reason or 'max_length'})")
+        else:
+            logger.info("Recording complete")
+        return audio[:recorded * frame_length].astype(np.float32) / 32768.0
+    
     def transcribe(self, audio: np.ndarray, language: str = 'en') -> Optional[str]:
         """Transcribe audio to text.
         
@@ -95,29 +394,53 @@ class WhisperRecognizer:
         Returns:
             Transcribed text
         """
-        if not WHISPER_AVAILABLE or self.model is None:
+        if self.model is None:
             logger.error("Whisper not available")
             return None
         
         try:
             logger.info("Transcribing audio...")
-            result = self.model.transcribe(
-                audio,
-                language=language,
-                fp16=False
-            )
-            text = result['text'].strip()
+            with self.model.use() as model:
+                text, _ = self.backend.transcribe(model, audio, language)
             logger.info(f"Transcription: {text}")
             return text
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             return None
     
-    def listen_and_transcribe(self, duration: int = 5, language: str = 'en') -> Optional[str]:
+    def transcribe_words(self, audio: np.ndarray, language: str = 'en',
+                         prompt: Optional[str] = None) -> Optional[List[Tuple[str, float, float]]]:
+        """Transcribe audio into timed words (used for streaming).
+        
+        Args:
+            audio: Audio data (float32, 16 kHz)
+            language: Language code
+            prompt: Text preceding the audio, for context
+            
+        Returns:
+            (word, start, end) tuples with times in seconds, or None on
+            failure; backends that cannot time words yield one entry per
+            segment
+        """
+        if self.model is None:
+            logger.error("Whisper not available")
+            return None
+        
+        try:
+            with self.model.use() as model:
+                _, words = self.backend.transcribe(model, audio, language, prompt,
+                                                   word_timestamps=True)
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            return None
+        return words
+    
+    def listen_and_transcribe(self, duration: Optional[float] = None,
+                              language: str = 'en') -> Optional[str]:
         """Record audio and transcribe in one step.
         
         Args:
-            duration: Recording duration
+            duration: Recording duration (None: until the speaker stops, see record_audio)
             language: Language code
             
         Returns:
@@ -135,14 +458,13 @@ if __name__ == "__main__":
     
     print("\nTesting Whisper Speech Recognition...")
     
-    if not WHISPER_AVAILABLE:
-        print("❌ Whisper not installed")
-        print("Install with: pip install openai-whisper")
+    recognizer = WhisperRecognizer()
+    if recognizer.model is None:
+        print("❌ Whisper model could not be loaded (see speech_recognition.engine)")
     elif not SOUNDDEVICE_AVAILABLE:
         print("❌ sounddevice not installed")
         print("Install with: pip install sounddevice")
     else:
-        recognizer = WhisperRecognizer()
         print("\n🎤 Speak now (5 seconds)...")
         text = recognizer.listen_and_transcribe(5)
         
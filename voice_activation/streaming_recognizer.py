@@ -0,0 +1,234 @@
+"""Incremental transcription of an utterance while it is being recorded."""
+
+import logging
+import re
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class Word(NamedTuple):
+    """A decoded word with its time span in the utterance (seconds)."""
+    text: str
+    start: float
+    end: float
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r'[^\w]', '', text.lower())
+
+
+class StreamingTranscriber:
+    """Re-decodes the growing recording and commits what stops changing.
+
+    A worker thread decodes the uncommitted part of the audio every
+    step_seconds of new input. Words on which two consecutive decodes
+    agree (the longest common prefix of their hypotheses) are committed
+    and never revisited; the audio they cover is dropped right away, and
+    the committed text is passed as the prompt for context. If the
+    uncommitted tail still grows past window_seconds, the tentative words
+    are committed as they are. When the speaker is done, finish() only
+    has to decode the short uncommitted tail.
+    """
+
+    def __init__(self, recognizer, language: str = 'en', sample_rate: int = 16000,
+                 step_seconds: float = 1.0, window_seconds: float = 5.0,
+                 on_partial: Optional[Callable[[str], None]] = None):
+        """Start the decoding thread.
+
+        Args:
+            recognizer: Object with transcribe_words() (e.g. WhisperRecognizer)
+            language: Language code
+            sample_rate: Rate of the fed audio in Hz
+            step_seconds: New audio between decodes
+            window_seconds: Longest uncommitted tail; beyond it the
+                tentative words are committed without waiting for agreement
+            on_partial: Called with committed plus tentative text after
+                every decode
+        """
+        self.recognizer = recognizer
+        self.language = language
+        self.sample_rate = sample_rate
+        self.step_samples = int(step_seconds * sample_rate)
+        self.window_samples = int(window_seconds * sample_rate)
+        self.on_partial = on_partial
+
+        self._lock = threading.Lock()
+        self._audio = np.zeros(30 * sample_rate, dtype=np.float32)
+        self._length = 0
+        self._offset = 0.0  # Utterance time of self._audio[0]
+        self._decoded_length = 0
+        self._fed = 0
+
+        self._committed: List[Word] = []
+        self._tentative: List[Word] = []
+
+        self.decodes = 0
+        self.decode_seconds = 0.0
+        self.final_window_seconds = None
+        self.finalize_seconds = None
+
+        self._pending = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def feed(self, samples: np.ndarray):
+        """Append recorded audio (int16, or float32 in [-1, 1]).
+
+        Args:
+            samples: Mono audio at sample_rate; copied, so the caller may
+                reuse the buffer
+        """
+        if samples.dtype == np.int16:
+            samples = samples.astype(np.float32) / 32768.0
+
+        with self._lock:
+            needed = self._length + len(samples)
+            if needed > len(self._audio):
+                grown = np.zeros(max(needed, 2 * len(self._audio)), dtype=np.float32)
+                grown[:self._length] = self._audio[:self._length]
+                self._audio = grown
+            self._audio[self._length:needed] = samples
+            self._length = needed
+            self._fed += len(samples)
+            ready = self._length - self._decoded_length >= self.step_samples
+
+        if ready:
+            self._pending.set()
+
+    def finish(self) -> str:
+        """Decode the remaining audio and return the full transcript.
+
+        A decode still running on the worker thread is not waited for;
+        its result is discarded.
+
+        Returns:
+            The transcript (committed words plus the final tail)
+        """
+        started = time.perf_counter()
+        self.cancel()
+
+        self._decode(final=True)
+        self.finalize_seconds = time.perf_counter() - started
+        return self.text()
+
+    def cancel(self):
+        """Stop the decoding thread without finalizing (does not block)."""
+        with self._lock:
+            self._closed = True
+        self._pending.set()
+
+    def text(self, partial: bool = False) -> str:
+        """Committed transcript, optionally followed by the tentative words."""
+        words = self._committed + (self._tentative if partial else [])
+        return ' '.join(word.text for word in words)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Decode counters.
+
+        Returns:
+            Number of decodes, audio fed (seconds), real-time factor
+            (decode time over audio time), the time finish() took and the
+            audio its decode covered (seconds)
+        """
+        audio_seconds = self._fed / self.sample_rate
+        return {
+            'decodes': self.decodes,
+            'audio_seconds': audio_seconds,
+            'real_time_factor': self.decode_seconds / audio_seconds if audio_seconds else None,
+            'finalize_seconds': self.finalize_seconds,
+            'final_window_seconds': self.final_window_seconds
+        }
+
+    def _run(self):
+        """Worker: decode whenever enough new audio has arrived."""
+        while True:
+            self._pending.wait()
+            self._pending.clear()
+            if self._closed:
+                return
+            try:
+                self._decode(final=False)
+            except Exception as e:
+                logger.error(f"Streaming transcription failed: {e}")
+
+    def _decode(self, final: bool):
+        """Decode the uncommitted tail and commit the words that settled."""
+        with self._lock:
+            if self._length == 0 or (self._closed and not final):
+                return
+            audio = self._audio[:self._length].copy()
+            offset = self._offset
+            self._decoded_length = self._length
+        if final:
+            self.final_window_seconds = len(audio) / self.sample_rate
+
+        # Committed text gives the decoder context for the trimmed window
+        prompt = self.text()[-200:] or None
+        started = time.perf_counter()
+        decoded = self.recognizer.transcribe_words(audio, self.language, prompt)
+        self.decode_seconds += time.perf_counter() - started
+        self.decodes += 1
+        if decoded is None:
+            return
+
+        with self._lock:
+            # finish() took over while this decode ran; its result wins
+            if self._closed and not final:
+                return
+
+            hypothesis = self._new_words([Word(text, start + offset, end + offset)
+                                          for text, start, end in decoded])
+            if final:
+                agreed = len(hypothesis)
+            else:
+                agreed = 0
+                while (agreed < min(len(hypothesis), len(self._tentative))
+                       and _normalize(hypothesis[agreed].text) == _normalize(self._tentative[agreed].text)):
+                    agreed += 1
+                if self._length > self.window_samples:
+                    # Keep the decode short; the last word may still be cut off
+                    agreed = max(agreed, len(hypothesis) - 1)
+
+            self._committed += hypothesis[:agreed]
+            self._tentative = hypothesis[agreed:]
+            self._trim()
+
+        if self.on_partial is not None and not final:
+            self.on_partial(self.text(partial=True))
+
+    def _new_words(self, words: List[Word]) -> List[Word]:
+        """Words of a decode that are not already committed."""
+        if not self._committed:
+            return words
+
+        # The window may still cover committed audio; timestamps are not
+        # exact, so also drop a repeated run of committed words at the start
+        committed_end = self._committed[-1].end
+        words = [word for word in words if word.start > committed_end - 0.1]
+        tail = [_normalize(word.text) for word in self._committed[-5:]]
+        for n in range(min(len(tail), len(words)), 0, -1):
+            if tail[-n:] == [_normalize(word.text) for word in words[:n]]:
+                return words[n:]
+        return words
+
+    def _trim(self):
+        """Drop the audio up to the end of the last committed word.
+
+        Called with the lock held.
+        """
+        if not self._committed:
+            return
+        cut = int((self._committed[-1].end - self._offset) * self.sample_rate)
+        cut = max(0, min(cut, self._length))
+        if cut == 0:
+            return
+        self._audio[:self._length - cut] = self._audio[cut:self._length]
+        self._length -= cut
+        self._decoded_length = max(0, self._decoded_length - cut)
+        self._offset += cut / self.sample_rate
@@ -0,0 +1,299 @@
+"""Voice activity detection for the capture path."""
+
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+
+def frame_level_db(frame: np.ndarray) -> float:
+    """RMS level of int16 audio in dBFS (-inf for digital silence)."""
+    samples = frame.astype(np.float32)
+    power = float(np.dot(samples, samples)) / max(1, len(samples))
+    if power == 0.0:
+        return float('-inf')
+    return 10.0 * np.log10(power / (32768.0 ** 2))
+
+
+class VoiceActivityDetector:
+    """Classifies int16 frames as speech or silence.
+
+    The energy mode compares the frame's RMS level with a fixed threshold.
+    The webrtc mode asks WebRTC VAD about each 10 ms slice of the frame
+    and reports speech if any slice is voiced; it falls back to the
+    energy mode when webrtcvad is not installed.
+    """
+
+    MODES = ('energy', 'webrtc')
+
+    def __init__(self, mode: str = 'energy', sample_rate: int = 16000,
+                 threshold_db: float = -50.0, aggressiveness: int = 2):
+        """Set up the detector.
+
+        Args:
+            mode: 'energy' or 'webrtc'
+            sample_rate: Sample rate of the frames in Hz
+            threshold_db: Energy mode: level (dBFS) below which a frame is silence
+            aggressiveness: WebRTC mode: 0 (lenient) to 3 (strict)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown VAD mode: {mode}")
+
+        if mode == 'webrtc' and not WEBRTCVAD_AVAILABLE:
+            logger.warning("webrtcvad not installed, using the energy VAD. "
+                           "Install with: pip install webrtcvad")
+            mode = 'energy'
+
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.threshold_db = threshold_db
+        self._vad = webrtcvad.Vad(aggressiveness) if mode == 'webrtc' else None
+        # WebRTC VAD accepts 10, 20 or 30 ms of audio at a time
+        self._slice = sample_rate // 100
+
+    def is_speech(self, frame: np.ndarray) -> bool:
+        """Whether an int16 frame contains speech.
+
+        Args:
+            frame: Mono int16 samples at sample_rate
+
+        Returns:
+            True for speech
+        """
+        if self._vad is None:
+            return frame_level_db(frame) >= self.threshold_db
+
+        for start in range(0, len(frame) - self._slice + 1, self._slice):
+            if self._vad.is_speech(frame[start:start + self._slice].tobytes(), self.sample_rate):
+                return True
+        return False
+
+
+class SpeechGate:
+    """Lets only frames around speech through to the wake word engine.
+
+    The gate opens on a voiced frame and stays open for a hangover after
+    the last one. While it is closed it keeps the last few frames, and
+    when it opens it hands them back (take_backlog()) so the engine also
+    hears the quiet onset of the word that opened it.
+    """
+
+    def __init__(self, vad: VoiceActivityDetector, frame_length: int,
+                 hangover_frames: int = 10, lookback_frames: int = 3):
+        """Set up the gate.
+
+        Args:
+            vad: Frame classifier
+            frame_length: Samples per frame
+            hangover_frames: Frames kept open after the last voiced frame
+            lookback_frames: Skipped frames replayed when the gate opens
+        """
+        self.vad = vad
+        self.hangover_frames = hangover_frames
+        self._held = np.zeros((lookback_frames, frame_length), dtype=np.int16)
+        self._held_count = 0
+        self._open_frames = 0
+        self._backlog = self._held[:0]
+
+        self.frames_seen = 0
+        self.frames_admitted = 0
+        self.openings = 0
+
+    @classmethod
+    def from_config(cls, config: dict, sample_rate: int,
+                    frame_length: int) -> Optional['SpeechGate']:
+        """Build the gate described by the voice_activation config section.
+
+        Args:
+            config: voice_activation settings
+            sample_rate: Sample rate of the frames in Hz
+            frame_length: Samples per frame
+
+        Returns:
+            The gate, or None when vad_gate is off
+        """
+        mode = config.get('vad_gate', 'off')
+        if not mode or mode == 'off':
+            return None
+
+        vad = VoiceActivityDetector(
+            mode,
+            sample_rate,
+            threshold_db=config.get('vad_threshold_db', -50.0),
+            aggressiveness=config.get('vad_aggressiveness', 2)
+        )
+        frame_ms = frame_length * 1000 / sample_rate
+        return cls(
+            vad,
+            frame_length,
+            hangover_frames=int(config.get('vad_hangover_ms', 300) / frame_ms),
+            lookback_frames=int(config.get('vad_lookback_ms', 100) / frame_ms)
+        )
+
+    def admit(self, frame: np.ndarray) -> bool:
+        """Decide whether a frame goes to the engine.
+
+        Args:
+            frame: int16 samples
+
+        Returns:
+            True to run the engine on it
+        """
+        self.frames_seen += 1
+        was_open = self._open_frames > 0
+
+        if self.vad.is_speech(frame):
+            self._open_frames = self.hangover_frames + 1
+        elif was_open:
+            self._open_frames -= 1
+
+        if self._open_frames == 0:
+            self._hold(frame)
+            return False
+
+        if not was_open:
+            self.openings += 1
+            self._backlog = self._release()
+        self.frames_admitted += 1
+        return True
+
+    def take_backlog(self) -> np.ndarray:
+        """Frames skipped just before the gate opened, oldest first.
+
+        Returns:
+            Array of frames (one per row); empty unless admit() just
+            opened the gate
+        """
+        backlog, self._backlog = self._backlog, self._held[:0]
+        return backlog
+
+    def _hold(self, frame: np.ndarray):
+        if len(self._held) == 0:
+            return
+        self._held[self._held_count % len(self._held)] = frame
+        self._held_count += 1
+
+    def _release(self) -> np.ndarray:
+        count = min(self._held_count, len(self._held))
+        start = self._held_count - count
+        order = [(start + i) % len(self._held) for i in range(count)]
+        self._held_count = 0
+        return self._held[order]
+
+    def stats(self) -> Dict[str, float]:
+        """Counters.
+
+        Returns:
+            Frames seen and admitted, the admitted share in percent and
+            how often the gate opened
+        """
+        return {
+            'gate_frames_seen': self.frames_seen,
+            'gate_frames_admitted': self.frames_admitted,
+            'gate_admitted_percent': (
+                self.frames_admitted / self.frames_seen * 100 if self.frames_seen else 0.0
+            ),
+            'gate_openings': self.openings
+        }
+
+
+class Endpointer:
+    """Decides when a spoken utterance is over.
+
+    Fed one frame at a time after recording starts. The utterance ends
+    once speech has been heard and followed by hangover_seconds of
+    silence (but not before min_seconds), when nothing was said within
+    no_speech_seconds, or at max_seconds at the latest.
+    """
+
+    def __init__(self, vad: VoiceActivityDetector, frame_seconds: float,
+                 hangover_seconds: float = 0.7, min_seconds: float = 0.5,
+                 max_seconds: float = 10.0, no_speech_seconds: float = 3.0):
+        """Set up the endpointer.
+
+        Args:
+            vad: Frame classifier
+            frame_seconds: Duration of one frame
+            hangover_seconds: Silence after speech that ends the utterance
+            min_seconds: Shortest recording
+            max_seconds: Longest recording
+            no_speech_seconds: Give up if no speech starts within this time
+        """
+        self.vad = vad
+        self.frame_seconds = frame_seconds
+        self.hangover_seconds = hangover_seconds
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.no_speech_seconds = no_speech_seconds
+        self.reset()
+
+    @classmethod
+    def from_config(cls, config: dict, sample_rate: int,
+                    frame_length: int) -> Optional['Endpointer']:
+        """Build the endpointer described by the speech_recognition config section.
+
+        Args:
+            config: speech_recognition settings
+            sample_rate: Sample rate of the frames in Hz
+            frame_length: Samples per frame
+
+        Returns:
+            The endpointer, or None when endpointing is off
+        """
+        if not config.get('endpointing', True):
+            return None
+
+        vad = VoiceActivityDetector(
+            config.get('vad_mode', 'webrtc'),
+            sample_rate,
+            threshold_db=config.get('vad_threshold_db', -50.0),
+            aggressiveness=config.get('vad_aggressiveness', 2)
+        )
+        return cls(
+            vad,
+            frame_length / sample_rate,
+            hangover_seconds=config.get('endpoint_hangover_ms', 700) / 1000,
+            min_seconds=config.get('min_utterance_seconds', 0.5),
+            max_seconds=config.get('max_utterance_seconds', 10),
+            no_speech_seconds=config.get('no_speech_timeout_seconds', 3)
+        )
+
+    def reset(self):
+        """Start a new utterance."""
+        self.elapsed = 0.0
+        self.speech_seconds = 0.0
+        self.silence = 0.0
+        self.reason = None
+
+    def update(self, frame: np.ndarray) -> bool:
+        """Account for one recorded frame.
+
+        Args:
+            frame: int16 samples
+
+        Returns:
+            True once the recording should stop (reason says why)
+        """
+        self.elapsed += self.frame_seconds
+        if self.vad.is_speech(frame):
+            self.speech_seconds += self.frame_seconds
+            self.silence = 0.0
+        else:
+            self.silence += self.frame_seconds
+
+        if self.elapsed >= self.max_seconds:
+            self.reason = 'max_length'
+        elif not self.speech_seconds and self.elapsed >= self.no_speech_seconds:
+            self.reason = 'no_speech'
+        elif (self.speech_seconds and self.elapsed >= self.min_seconds
+              and self.silence >= self.hangover_seconds):
+            self.reason = 'end_of_speech'
+        return self.reason is not None
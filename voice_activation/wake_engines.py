@@ -0,0 +1,390 @@
+"""Wake word engines behind one interface.
+
+Each engine checks every configured keyword in a single pass over each
+frame and reports which one (if any) was heard. Engines are built from
+the voice_activation config section by create_engine().
+"""
+
+import ctypes
+import json
+import logging
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from jarvis_core.model_registry import models
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pvporcupine
+    PORCUPINE_AVAILABLE = True
+except ImportError:
+    PORCUPINE_AVAILABLE = False
+
+try:
+    from openwakeword.model import Model as OpenWakeWordModel
+    OPENWAKEWORD_AVAILABLE = True
+except ImportError:
+    OPENWAKEWORD_AVAILABLE = False
+
+try:
+    import vosk
+    VOSK_AVAILABLE = True
+except ImportError:
+    VOSK_AVAILABLE = False
+
+
+class KeywordSpec(NamedTuple):
+    """One keyword to listen for.
+
+    action is 'wake' (start a command) or 'stop' (only interrupt speech);
+    model optionally points at a custom keyword model for the engine
+    (Porcupine .ppn, openWakeWord model name or .onnx/.tflite file).
+    """
+    word: str
+    sensitivity: float = 0.5
+    action: str = 'wake'
+    model: Optional[str] = None
+
+
+def keyword_specs(config: dict) -> List[KeywordSpec]:
+    """Keywords from the voice_activation config section.
+
+    Args:
+        config: voice_activation settings; wake_word and sensitivity give
+            the main keyword, keywords lists extra ones
+
+    Returns:
+        The main keyword first, then the extra ones
+    """
+    specs = [KeywordSpec(
+        config.get('wake_word', 'jarvis').lower(),
+        config.get('sensitivity', 0.5),
+        'wake',
+        config.get('wake_word_model')
+    )]
+    for entry in config.get('keywords') or []:
+        if isinstance(entry, str):
+            entry = {'word': entry}
+        specs.append(KeywordSpec(
+            entry['word'].lower(),
+            entry.get('sensitivity', config.get('sensitivity', 0.5)),
+            entry.get('action', 'wake'),
+            entry.get('model')
+        ))
+    return specs
+
+
+class FrameBuffer:
+    """Preallocated int16 frame shared by NumPy and ctypes.
+
+    Incoming PCM bytes are viewed with np.frombuffer and copied into the
+    same buffer every frame, so no per-sample Python objects are created.
+    The ctypes side can be handed straight to a C engine.
+    """
+
+    def __init__(self, frame_length: int):
+        """Allocate the buffer.
+
+        Args:
+            frame_length: Samples per frame
+        """
+        self.frame_length = frame_length
+        self.c_buffer = (ctypes.c_short * frame_length)()
+        self.array = np.frombuffer(self.c_buffer, dtype=np.int16)
+
+    def load(self, pcm: bytes) -> np.ndarray:
+        """Copy one frame of little-endian int16 PCM into the buffer.
+
+        Args:
+            pcm: Raw audio bytes (frame_length samples)
+
+        Returns:
+            The buffer as an int16 array (overwritten by the next load)
+        """
+        self.array[:] = np.frombuffer(pcm, dtype='<i2', count=self.frame_length)
+        return self.array
+
+
+class WakeWordEngine:
+    """Interface for keyword spotting engines.
+
+    Subclasses set sample_rate and frame_length, allocate self.frame and
+    implement process(). Callers fill self.frame.array and pass it in,
+    which lets engines with a native API skip copying.
+    """
+
+    name = 'base'
+
+    def __init__(self, keywords: List[KeywordSpec]):
+        self.keywords = keywords
+        self.sample_rate = 16000
+        self.frame_length = 512
+        self.frame = None
+
+    def process(self, frame: np.ndarray) -> int:
+        """Check one frame for every keyword.
+
+        Args:
+            frame: int16 samples (frame_length of them at sample_rate)
+
+        Returns:
+            Index into keywords of the keyword heard, or -1
+        """
+        raise NotImplementedError
+
+    def reset(self):
+        """Forget the audio heard so far (between utterances or files)."""
+
+    def close(self):
+        """Release the engine's models."""
+
+
+class PorcupineEngine(WakeWordEngine):
+    """Picovoice Porcupine: built-in keywords or custom .ppn models."""
+
+    name = 'porcupine'
+
+    # Used when pvporcupine does not list its built-in keywords
+    BUILTIN_KEYWORDS = [
+        'jarvis', 'computer', 'ok google', 'hey google', 'terminator',
+        'picovoice', 'porcupine', 'alexa', 'americano', 'blueberry',
+        'bumblebee', 'grapefruit', 'grasshopper', 'hey siri'
+    ]
+
+    def __init__(self, keywords: List[KeywordSpec], access_key: Optional[str] = None):
+        """Create (or share) a Porcupine handle for the keywords.
+
+        Args:
+            keywords: Keywords to detect; ones that are neither built in
+                nor backed by a .ppn model are left out with a warning
+            access_key: Picovoice access key (required by pvporcupine 2+)
+        """
+        if not PORCUPINE_AVAILABLE:
+            raise RuntimeError("Porcupine not available. Install with: pip install pvporcupine")
+
+        builtin = set(getattr(pvporcupine, 'KEYWORDS', self.BUILTIN_KEYWORDS))
+        usable = []
+        for spec in keywords:
+            if spec.model or spec.word in builtin:
+                usable.append(spec)
+            else:
+                logger.warning(f"Porcupine has no built-in keyword '{spec.word}'; "
+                               f"set a .ppn model for it. Built-in: {', '.join(sorted(builtin))}")
+        if not usable:
+            raise ValueError("No usable Porcupine keywords configured")
+        super().__init__(usable)
+
+        words = tuple(spec.word for spec in usable)
+        paths = [spec.model for spec in usable]
+        sensitivities = [spec.sensitivity for spec in usable]
+
+        def create():
+            kwargs = {'sensitivities': sensitivities}
+            if access_key:
+                kwargs['access_key'] = access_key
+            if any(paths):
+                kwargs['keyword_paths'] = [
+                    path or pvporcupine.KEYWORD_PATHS[word] for word, path in zip(words, paths)
+                ]
+            else:
+                kwargs['keywords'] = list(words)
+            return pvporcupine.create(**kwargs)
+
+        self.handle = models.acquire(
+            'porcupine', (words, tuple(paths), tuple(sensitivities)), create,
+            closer=lambda handle: handle.delete()
+        )
+        self.sample_rate = self.handle.sample_rate
+        self.frame_length = self.handle.frame_length
+        self.frame = FrameBuffer(self.frame_length)
+
+        # Porcupine.process() rebuilds a ctypes array from a sequence of
+        # ints every call; call the native function on our buffer instead
+        self._native_process = None
+        self._keyword_index = ctypes.c_int()
+        process_func = getattr(self.handle, '_process_func', None)
+        if process_func is not None and hasattr(self.handle, '_handle'):
+            self._native_process = process_func
+
+    def process(self, frame: np.ndarray) -> int:
+        if self._native_process is not None and frame is self.frame.array:
+            status = self._native_process(
+                self.handle._handle,
+                self.frame.c_buffer,
+                ctypes.byref(self._keyword_index)
+            )
+            # restype is pvporcupine's PicovoiceStatuses enum; SUCCESS is 0
+            if getattr(status, 'value', status) == 0:
+                return self._keyword_index.value
+            # Let the public API raise its own error for this status
+
+        return self.handle.process(frame)
+
+    def close(self):
+        if self.handle is not None:
+            models.release(self.handle)
+            self.handle = None
+
+
+class OpenWakeWordEngine(WakeWordEngine):
+    """openWakeWord: open-source ONNX/TFLite keyword models, fully offline."""
+
+    name = 'openwakeword'
+
+    # Pre-trained model names for keywords that differ from the word
+    PRETRAINED = {
+        'jarvis': 'hey_jarvis',
+        'mycroft': 'hey_mycroft',
+        'rhasspy': 'hey_rhasspy'
+    }
+
+    def __init__(self, keywords: List[KeywordSpec], refractory_frames: int = 12):
+        """Load the keyword models into a Model of this engine's own.
+
+        The Model keeps per-stream audio, feature and score buffers, so it
+        is not shared between engines like the other engines' weights.
+
+        Args:
+            keywords: Keywords to detect; a keyword fires when its score
+                reaches 1 - sensitivity
+            refractory_frames: Frames a keyword stays quiet after firing,
+                since scores stay high for a while
+        """
+        if not OPENWAKEWORD_AVAILABLE:
+            raise RuntimeError("openWakeWord not available. Install with: pip install openwakeword")
+        super().__init__(keywords)
+
+        self._model_names = [
+            spec.model or self.PRETRAINED.get(spec.word, spec.word.replace(' ', '_'))
+            for spec in keywords
+        ]
+        self.model = OpenWakeWordModel(wakeword_models=self._model_names)
+        # openWakeWord scores 80 ms windows
+        self.frame_length = 1280
+        self.frame = FrameBuffer(self.frame_length)
+
+        self._thresholds = np.array([1.0 - spec.sensitivity for spec in keywords])
+        self._refractory_frames = refractory_frames
+        self._quiet = np.zeros(len(keywords), dtype=int)
+        self._score_keys: Optional[List[str]] = None
+
+    def _resolve_keys(self, scores: Dict[str, float]) -> List[str]:
+        """Prediction keys per keyword (they carry model file names/versions)."""
+        keys = []
+        for name in self._model_names:
+            stem = name.rsplit('/', 1)[-1].split('.')[0]
+            keys.append(next((key for key in scores if key.startswith(stem)), stem))
+        return keys
+
+    def process(self, frame: np.ndarray) -> int:
+        scores = self.model.predict(frame)
+        if self._score_keys is None:
+            self._score_keys = self._resolve_keys(scores)
+
+        self._quiet[self._quiet > 0] -= 1
+        best, best_margin = -1, 0.0
+        for i, key in enumerate(self._score_keys):
+            margin = scores.get(key, 0.0) - self._thresholds[i]
+            if margin >= best_margin and self._quiet[i] == 0:
+                best, best_margin = i, margin
+
+        if best >= 0:
+            self._quiet[best] = self._refractory_frames
+        return best
+
+    def reset(self):
+        self.model.reset()
+        self._quiet[:] = 0
+
+    def close(self):
+        self.model = None
+
+
+class VoskEngine(WakeWordEngine):
+    """Vosk speech recognition restricted to a grammar of the keywords.
+
+    Everything else is recognized as [unk], so decoding stays cheap. A
+    keyword fires once it has appeared in several consecutive partial
+    hypotheses; lower sensitivity asks for a more stable hypothesis.
+    """
+
+    name = 'vosk'
+
+    def __init__(self, keywords: List[KeywordSpec], model_path: str, sample_rate: int = 16000):
+        """Load the acoustic model (shared) and build the grammar recognizer.
+
+        Args:
+            keywords: Keywords (single words or short phrases) to detect
+            model_path: Directory of a Vosk model
+            sample_rate: Rate of the frames in Hz
+        """
+        if not VOSK_AVAILABLE:
+            raise RuntimeError("Vosk not available. Install with: pip install vosk")
+        super().__init__(keywords)
+
+        self.model = models.acquire('vosk', model_path, lambda: vosk.Model(model_path),
+                                    closer=lambda model: None)
+        self.sample_rate = sample_rate
+        self.frame = FrameBuffer(self.frame_length)
+
+        grammar = json.dumps([spec.word for spec in keywords] + ['[unk]'])
+        self._recognizer = vosk.KaldiRecognizer(self.model, sample_rate, grammar)
+        # 1 (sensitivity 1.0) to 5 (sensitivity 0.0) consistent partials
+        self._required = [1 + round((1.0 - spec.sensitivity) * 4) for spec in keywords]
+        self._seen = [0] * len(keywords)
+
+    def process(self, frame: np.ndarray) -> int:
+        if self._recognizer.AcceptWaveform(frame.tobytes()):
+            text = json.loads(self._recognizer.Result()).get('text', '')
+        else:
+            text = json.loads(self._recognizer.PartialResult()).get('partial', '')
+
+        padded = f" {text} "
+        for i, spec in enumerate(self.keywords):
+            self._seen[i] = self._seen[i] + 1 if f" {spec.word} " in padded else 0
+            if self._seen[i] >= self._required[i]:
+                # Start over so the same utterance does not fire again
+                self._recognizer.Reset()
+                self._seen = [0] * len(self.keywords)
+                return i
+        return -1
+
+    def reset(self):
+        self._recognizer.Reset()
+        self._seen = [0] * len(self.keywords)
+
+    def close(self):
+        if self.model is not None:
+            models.release(self.model)
+            self.model = None
+
+
+ENGINES = {
+    'porcupine': PorcupineEngine,
+    'openwakeword': OpenWakeWordEngine,
+    'vosk': VoskEngine
+}
+
+
+def create_engine(config: dict, keywords: Optional[List[KeywordSpec]] = None) -> WakeWordEngine:
+    """Build the engine named by voice_activation.engine.
+
+    Args:
+        config: voice_activation settings
+        keywords: Keywords to use instead of the configured ones
+
+    Returns:
+        The engine
+    """
+    name = config.get('engine', 'porcupine')
+    keywords = keywords if keywords is not None else keyword_specs(config)
+
+    if name == 'porcupine':
+        return PorcupineEngine(keywords, access_key=config.get('porcupine_access_key'))
+    if name == 'openwakeword':
+        return OpenWakeWordEngine(keywords)
+    if name == 'vosk':
+        return VoskEngine(keywords, config.get('vosk_model', 'models/vosk-model-small-en-us-0.15'))
+    raise ValueError(f"Unknown wake word engine: {name} (choose from {', '.join(ENGINES)})")
@@ -1,50 +1,59 @@
-"""Wake word detection using Porcupine."""
+"""Wake word detection on the shared audio capture."""
 
-import struct
 import logging
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
+import numpy as np
 import yaml
 
-try:
-    import pvporcupine
-    PORCUPINE_AVAILABLE = True
-except ImportError:
-    PORCUPINE_AVAILABLE = False
-    logging.warning("Porcupine not installed. Wake word detection unavailable.")
-
-try:
-    import pyaudio
-    PYAUDIO_AVAILABLE = True
-except ImportError:
-    PYAUDIO_AVAILABLE = False
-    logging.warning("PyAudio not installed. Audio input unavailable.")
+from .capture import CaptureHub
+from .ring_buffer import PreRollBuffer
+from .vad import SpeechGate
+from .wake_engines import KeywordSpec, WakeWordEngine, create_engine
 
 logger = logging.getLogger(__name__)
 
 
 class WakeWordDetector:
-    """Wake word detection for voice activation."""
+    """Wake word detection for voice activation.
+    
+    The keyword spotting itself is done by a WakeWordEngine (Porcupine,
+    openWakeWord or Vosk, chosen by voice_activation.engine), which checks
+    the wake word and any extra keywords in one pass over each frame.
+    """
     
-    def __init__(self, config_path: str = "config.yaml", callback: Optional[Callable] = None):
+    def __init__(self, config_path: str = "config.yaml", callback: Optional[Callable] = None,
+                 capture: Optional[CaptureHub] = None, sensitivity: Optional[float] = None,
+                 stop_callback: Optional[Callable] = None, engine: Optional[WakeWordEngine] = None):
         """Initialize wake word detector.
         
         Args:
             config_path: Path to configuration file
-            callback: Function to call when wake word is detected
+            callback: Function to call when a wake keyword is detected
+            capture: Shared audio capture; without one the detector
+                opens its own from the audio config section
+            sensitivity: Overrides voice_activation.sensitivity (0.0 - 1.0)
+            stop_callback: Function to call when a stop keyword is detected
+            engine: Engine to use instead of the configured one
         """
         self.config = self._load_config(config_path)
+        if sensitivity is not None:
+            self.config.setdefault('voice_activation', {})['sensitivity'] = sensitivity
         self.callback = callback
-        self.porcupine = None
-        self.audio_stream = None
+        self.stop_callback = stop_callback
+        self.engine = engine
+        self.capture = capture
+        self._owns_capture = capture is None
+        self.ring = None
+        self.preroll = None
+        self.gate = None
         self.is_listening = False
+        self.frame = None
+        self.last_keyword: Optional[KeywordSpec] = None
         
-        if not PORCUPINE_AVAILABLE:
-            logger.error("Porcupine not available. Install with: pip install pvporcupine")
-            return
-            
-        if not PYAUDIO_AVAILABLE:
-            logger.error("PyAudio not available. Install with: pip install pyaudio")
-            return
+        # Capture frames are regrouped when the engine wants another length
+        self._chunk = None
+        self._carry = None
+        self._carried = 0
             
         self._initialize()
         
@@ -67,55 +76,65 @@ class WakeWordDetector:
             }
             
     def _initialize(self):
-        """Initialize Porcupine."""
+        """Create the wake word engine."""
+        settings = self.config.get('voice_activation', {})
         try:
-            wake_word = self.config['voice_activation']['wake_word']
-            sensitivity = self.config['voice_activation']['sensitivity']
-            
-            # Create Porcupine instance
-            # Built-in wake words: alexa, americano, blueberry, bumblebee,
-            # computer, grapefruit, grasshopper, hey google, hey siri,
-            # jarvis, ok google, picovoice, porcupine, terminator
-            
-            available_keywords = [
-                'jarvis', 'computer', 'ok google', 'hey google', 'terminator',
-                'picovoice', 'porcupine', 'alexa', 'americano', 'blueberry',
-                'bumblebee', 'grapefruit', 'grasshopper', 'hey siri'
-            ]
-            
-            if wake_word.lower() in available_keywords:
-                keyword = wake_word.lower()
-            else:
-                logger.warning(f"Wake word '{wake_word}' not available. Using 'jarvis'")
-                keyword = 'jarvis'
-                
-            self.porcupine = pvporcupine.create(
-                keywords=[keyword],
-                sensitivities=[sensitivity]
+            if self.engine is None:
+                self.engine = create_engine(settings)
+            self.frame = self.engine.frame
+            
+            # Skip keyword inference on frames that are clearly silence
+            self.gate = SpeechGate.from_config(
+                settings,
+                self.engine.sample_rate,
+                self.engine.frame_length
             )
+            if self.gate is not None:
+                logger.info(f"Wake word VAD gate: {self.gate.vad.mode}")
             
-            logger.info(f"Wake word detector initialized: '{keyword}' (sensitivity: {sensitivity})")
+            keywords = ', '.join(f"'{spec.word}' ({spec.action}, sensitivity: {spec.sensitivity})"
+                                 for spec in self.engine.keywords)
+            logger.info(f"Wake word detector initialized with {self.engine.name}: {keywords}")
             
         except Exception as e:
-            logger.error(f"Failed to initialize Porcupine: {e}")
-            self.porcupine = None
+            logger.error(f"Failed to initialize wake word engine: {e}")
+            self.engine = None
             
     def start(self):
         """Start listening for wake word."""
-        if not self.porcupine:
-            logger.error("Porcupine not initialized")
+        if not self.engine:
+            logger.error("Wake word engine not initialized")
             return False
             
         try:
-            pa = pyaudio.PyAudio()
-            
-            self.audio_stream = pa.open(
-                rate=self.porcupine.sample_rate,
-                channels=1,
-                format=pyaudio.paInt16,
-                input=True,
-                frames_per_buffer=self.porcupine.frame_length
-            )
+            if self.capture is None:
+                self.capture = CaptureHub.from_config(self.config)
+            if self.capture.sample_rate != self.engine.sample_rate:
+                logger.error(f"Audio capture runs at {self.capture.sample_rate} Hz; "
+                             f"{self.engine.name} needs {self.engine.sample_rate} Hz")
+                return False
+            
+            self._chunk = None
+            self._carried = 0
+            if self.capture.frame_length != self.engine.frame_length:
+                self._chunk = np.zeros(self.capture.frame_length, dtype=np.int16)
+                self._carry = np.zeros(self.engine.frame_length + self.capture.frame_length,
+                                       dtype=np.int16)
+            
+            # The capture callback fills the ring; listen() drains it
+            seconds = self.config.get('voice_activation', {}).get('ring_buffer_seconds', 2.0)
+            self.ring = self.capture.subscribe('wake_word', seconds)
+            
+            # The last few seconds of audio, so a command capture can include
+            # what was said while the wake word was being recognized
+            preroll_seconds = self.config.get('voice_activation', {}).get('preroll_seconds', 1.5)
+            if preroll_seconds > 0:
+                self.preroll = PreRollBuffer(int(preroll_seconds * self.engine.sample_rate))
+            
+            if not self.capture.start():
+                self.capture.unsubscribe(self.ring)
+                self.ring = None
+                return False
             
             self.is_listening = True
             logger.info("Wake word detection started")
@@ -129,45 +148,141 @@ class WakeWordDetector:
         """Stop listening."""
         self.is_listening = False
         
-        if self.audio_stream:
-            self.audio_stream.close()
-            self.audio_stream = None
+        if self.ring is not None:
+            self.capture.unsubscribe(self.ring)
+            self.ring = None
+        
+        # A shared capture keeps running for its other subscribers
+        if self._owns_capture and self.capture is not None:
+            self.capture.stop()
             
         logger.info("Wake word detection stopped")
         
-    def listen(self) -> bool:
-        """Listen for one frame and check for wake word.
+    def read_frame(self, timeout: Optional[float] = 0.1) -> Optional[np.ndarray]:
+        """Wait for the next captured frame and add it to the pre-roll.
         
+        Args:
+            timeout: Maximum seconds to wait for audio
+            
         Returns:
-            True if wake word detected, False otherwise
+            The frame as an int16 array (overwritten by the next read), or
+            None if no audio arrived
         """
-        if not self.is_listening or not self.audio_stream:
-            return False
+        ring = self.ring
+        if not self.is_listening or ring is None:
+            return None
+        
+        if self._chunk is None:
+            if not ring.read_into(self.frame.array, timeout):
+                return None
+        elif not self._regroup(ring, timeout):
+            return None
+        
+        if self.preroll is not None:
+            self.preroll.append(self.frame.array)
+        return self.frame.array
+    
+    def _regroup(self, ring, timeout: Optional[float]) -> bool:
+        """Fill self.frame from capture frames of a different length."""
+        frame_length = len(self.frame.array)
+        while self._carried < frame_length:
+            if not ring.read_into(self._chunk, timeout):
+                return False
+            self._carry[self._carried:self._carried + len(self._chunk)] = self._chunk
+            self._carried += len(self._chunk)
+        
+        self.frame.array[:] = self._carry[:frame_length]
+        self._carried -= frame_length
+        self._carry[:self._carried] = self._carry[frame_length:frame_length + self._carried]
+        return True
+    
+    def listen(self, timeout: Optional[float] = 0.1) -> bool:
+        """Wait for the next captured frame and check it for the wake word.
+        
+        Args:
+            timeout: Maximum seconds to wait for audio
             
+        Returns:
+            True if a wake keyword was detected, False otherwise (stop
+            keywords call stop_callback and return False)
+        """
         try:
-            pcm = self.audio_stream.read(self.porcupine.frame_length, exception_on_overflow=False)
-            pcm = struct.unpack_from("h" * self.porcupine.frame_length, pcm)
+            frame = self.read_frame(timeout)
+            if frame is None:
+                return False
+            
+            index = self.detect(frame)
+            if index < 0:
+                return False
             
-            keyword_index = self.porcupine.process(pcm)
+            self.last_keyword = self.engine.keywords[index]
+            if self.last_keyword.action == 'stop':
+                logger.info(f"Stop word detected: '{self.last_keyword.word}'")
+                if self.stop_callback:
+                    self.stop_callback()
+                return False
             
-            if keyword_index >= 0:
-                logger.info("Wake word detected!")
-                if self.callback:
-                    self.callback()
-                return True
+            logger.info(f"Wake word detected: '{self.last_keyword.word}'")
+            if self.callback:
+                self.callback()
+            return True
                 
         except Exception as e:
             logger.error(f"Error processing audio: {e}")
             
         return False
         
+    def detect(self, frame: np.ndarray) -> int:
+        """Check one frame for the keywords, through the VAD gate if enabled.
+        
+        Args:
+            frame: int16 samples at the engine's rate and frame length
+            
+        Returns:
+            Index into engine.keywords of the keyword heard, or -1
+        """
+        detected = -1
+        if self.gate is not None:
+            if not self.gate.admit(frame):
+                return -1
+            # Let the engine hear the onset the gate held back
+            for held in self.gate.take_backlog():
+                index = self.process_frame(held)
+                if index >= 0:
+                    detected = index
+        index = self.process_frame(frame)
+        if index >= 0:
+            detected = index
+        if detected >= 0:
+            # The next utterance starts from clean engine state
+            self.engine.reset()
+        return detected
+        
+    def capture_stats(self) -> Dict[str, float]:
+        """Ring buffer and VAD gate counters (see AudioRingBuffer.stats and SpeechGate.stats)."""
+        stats = dict(self.ring.stats()) if self.ring is not None else {}
+        if self.gate is not None:
+            stats.update(self.gate.stats())
+        return stats
+    
+    def process_frame(self, frame: np.ndarray) -> int:
+        """Run the engine on one frame.
+        
+        Args:
+            frame: int16 samples; frames in self.frame skip all copying
+            
+        Returns:
+            Index of the detected keyword, or -1
+        """
+        return self.engine.process(frame)
+    
     def cleanup(self):
         """Cleanup resources."""
         self.stop()
         
-        if self.porcupine:
-            self.porcupine.delete()
-            self.porcupine = None
+        if self.engine:
+            self.engine.close()
+            self.engine = None
 
 
 if __name__ == "__main__":
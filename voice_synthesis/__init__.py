@@ -2,5 +2,11 @@
 
 from .tts_engine import TTSEngine
 from .aizen_voice import AizenVoice
+from .speech_queue import SpeechQueue
+from .audio_cache import AudioCache
+from .audio_output import AudioClip, AudioOutput
+from .speaker_latents import SpeakerLatentCache
+from .sentences import split_sentences
 
-__all__ = ['TTSEngine', 'AizenVoice']
+__all__ = ['TTSEngine', 'AizenVoice', 'SpeechQueue', 'AudioCache', 'AudioClip', 'AudioOutput',
+           'SpeakerLatentCache', 'split_sentences']
@@ -1,7 +1,12 @@
 """Aizen personality voice module for J.A.R.V.I.S."""
 
 import logging
+import threading
+import time
+from concurrent.futures import Future
 from typing import Optional
+
+from jarvis_core.model_registry import models
 from .tts_engine import TTSEngine
 
 logger = logging.getLogger(__name__)
@@ -56,27 +61,101 @@ class AizenVoice:
         ]
     }
     
+    # Rendered first during warm-up: spoken at startup and on every command
+    HOT_CATEGORIES = ['greeting', 'acknowledgement']
+    
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize Aizen voice.
         
         Args:
             config_path: Path to configuration file
         """
-        self.tts_engine = TTSEngine(config_path)
+        # Shared with every other AizenVoice using the same voice settings
+        self.tts_engine = TTSEngine.shared(config_path)
         logger.info("Aizen voice module initialized")
+        
+        if self.tts_engine.config['voice'].get('prerender_phrases', True):
+            self.warm_up()
+    
+    def close(self):
+        """Release the shared TTS engine."""
+        if self.tts_engine is not None:
+            models.release(self.tts_engine)
+            self.tts_engine = None
+    
+    def warm_up(self, background: bool = True) -> Optional[threading.Thread]:
+        """Pre-render the signature phrase table into the audio cache.
+        
+        Cached clips persist across launches, so only missing phrases are
+        synthesized. Does nothing for engines without an audio cache.
+        
+        Args:
+            background: Render on a worker thread instead of blocking
+            
+        Returns:
+            The worker thread when running in the background
+        """
+        if not self.tts_engine.can_cache:
+            return None
+        
+        if not background:
+            self._render_phrases()
+            return None
+        
+        thread = threading.Thread(target=self._render_phrases, name="phrase-warmup", daemon=True)
+        thread.start()
+        return thread
     
-    def speak(self, text: str, emotion: Optional[str] = None):
+    def _render_phrases(self):
+        """Render every signature phrase, hot categories first."""
+        categories = self.HOT_CATEGORIES + [
+            c for c in self.SIGNATURE_PHRASES if c not in self.HOT_CATEGORIES
+        ]
+        
+        start = time.perf_counter()
+        rendered = 0
+        for category in categories:
+            for phrase in self.SIGNATURE_PHRASES[category]:
+                # Same formatting as speak(), so the cache keys match
+                text = self._add_aizen_style(phrase, category)
+                try:
+                    if self.tts_engine.prerender(text):
+                        rendered += 1
+                except Exception as e:
+                    logger.warning(f"Phrase warm-up stopped: {e}")
+                    return
+        
+        logger.info(f"Phrase warm-up: rendered {rendered} new clip(s) "
+                    f"in {time.perf_counter() - start:.1f}s")
+    
+    def speak(self, text: str, emotion: Optional[str] = None) -> Future:
         """Speak with Aizen's voice and personality.
         
+        Returns immediately; speech plays in the background.
+        
         Args:
             text: Text to speak
             emotion: Optional emotion/context (greeting, acknowledgement, etc.)
+            
+        Returns:
+            Future resolved once the text has been spoken
         """
         # Add Aizen's speaking style
         formatted_text = self._add_aizen_style(text, emotion)
         
         logger.info(f"Aizen speaking: {formatted_text}")
-        self.tts_engine.speak(formatted_text)
+        return self.tts_engine.speak(formatted_text)
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until all queued speech has been spoken.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if all speech finished, False on timeout
+        """
+        return self.tts_engine.wait(timeout)
     
     def _add_aizen_style(self, text: str, emotion: Optional[str] = None) -> str:
         """Add Aizen's speaking style to text.
@@ -245,3 +324,4 @@ if __name__ == "__main__":
     
     print("\n4. Custom response...")
     aizen.speak("All is proceeding exactly as I have foreseen.")
+    aizen.wait()
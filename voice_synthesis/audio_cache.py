@@ -0,0 +1,248 @@
+"""Persistent cache of synthesized speech."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# (path, mtime, size) -> digest, so unchanged files are hashed once
+_DIGEST_MEMO: Dict[Tuple[str, float, int], str] = {}
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents, memoized by path, mtime and size.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_mtime, stat.st_size)
+    digest = _DIGEST_MEMO.get(memo_key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                sha.update(block)
+        digest = sha.hexdigest()
+        _DIGEST_MEMO[memo_key] = digest
+    return digest
+
+
+class AudioCache:
+    """Size-bounded LRU cache of audio files keyed by synthesis parameters.
+
+    Entries are written atomically (temp file + rename in the same
+    directory), so a crash never leaves a truncated clip behind, and
+    recency survives restarts through file modification times.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 200 * 1024 * 1024):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached clips
+            max_bytes: Total size above which least recently used clips are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Path, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._scan()
+
+    def _scan(self):
+        """Load existing entries, oldest first."""
+        files = []
+        for path in self.cache_dir.iterdir():
+            if not path.is_file():
+                continue
+            stat = path.stat()
+            if path.name.startswith('.tmp-'):
+                # Left behind by a synthesis that never finished
+                if time.time() - stat.st_mtime > 3600:
+                    path.unlink(missing_ok=True)
+                continue
+            files.append((stat.st_mtime, path, stat.st_size))
+
+        for _, path, size in sorted(files):
+            self._entries[path.name] = (path, size)
+            self._total_bytes += size
+
+        logger.info(f"Audio cache: {len(self._entries)} clips, "
+                    f"{self._total_bytes / (1024 * 1024):.1f} MB in {self.cache_dir}")
+
+    @staticmethod
+    def make_key(text: str, engine: str, model: Optional[str] = None,
+                 reference_audio: Optional[str] = None, speed: float = 1.0,
+                 language: Optional[str] = None) -> str:
+        """Build the cache key for a synthesis request.
+
+        The reference audio is identified by its content hash, so replacing
+        the file under the same name invalidates its clips.
+
+        Returns:
+            Hex key
+        """
+        reference_hash = None
+        if reference_audio and os.path.exists(reference_audio):
+            reference_hash = file_digest(reference_audio)
+
+        payload = json.dumps(
+            [text, engine, model, reference_hash, speed, language],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, extension: str) -> Optional[str]:
+        """Look up a cached clip and mark it as recently used.
+
+        Args:
+            key: Key from make_key()
+            extension: File extension including the dot (".wav", ".mp3")
+
+        Returns:
+            Path to the clip, or None on a miss
+        """
+        name = key + extension
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or not entry[0].exists():
+                if entry is not None:
+                    self._forget(name)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(name)
+            self.hits += 1
+
+        try:
+            os.utime(entry[0])
+        except OSError:
+            pass
+        return str(entry[0])
+
+    def contains(self, key: str, extension: str) -> bool:
+        """Whether a clip is cached, without counting a lookup.
+
+        Args:
+            key: Key from make_key()
+            extension: File extension including the dot
+
+        Returns:
+            True if the clip is present
+        """
+        with self._lock:
+            entry = self._entries.get(key + extension)
+        return entry is not None and entry[0].exists()
+
+    def temp_path(self, extension: str) -> str:
+        """Reserve a unique scratch file in the cache directory.
+
+        Synthesizing into this path and then calling put() keeps the final
+        rename on the same filesystem, which makes it atomic.
+
+        Args:
+            extension: File extension including the dot
+
+        Returns:
+            Path to an empty scratch file
+        """
+        fd, path = tempfile.mkstemp(suffix=extension, prefix='.tmp-', dir=self.cache_dir)
+        os.close(fd)
+        return path
+
+    def put(self, key: str, extension: str, source_path: str) -> str:
+        """Move a synthesized clip into the cache.
+
+        Args:
+            key: Key from make_key()
+            extension: File extension including the dot
+            source_path: Clip to adopt (moved, not copied)
+
+        Returns:
+            Path of the cached clip
+        """
+        name = key + extension
+        target = self.cache_dir / name
+        os.replace(source_path, target)
+        size = target.stat().st_size
+
+        with self._lock:
+            if name in self._entries:
+                self._forget(name)
+            self._entries[name] = (target, size)
+            self._total_bytes += size
+            self._evict()
+
+        return str(target)
+
+    def put_bytes(self, key: str, extension: str, data: bytes) -> str:
+        """Write an in-memory clip into the cache.
+
+        Args:
+            key: Key from make_key()
+            extension: File extension including the dot
+            data: File contents
+
+        Returns:
+            Path of the cached clip
+        """
+        temp_file = self.temp_path(extension)
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+            return self.put(key, extension, temp_file)
+        except Exception:
+            Path(temp_file).unlink(missing_ok=True)
+            raise
+
+    def _forget(self, name: str):
+        """Drop an entry from the index (lock held)."""
+        _, size = self._entries.pop(name)
+        self._total_bytes -= size
+
+    def _evict(self):
+        """Remove least recently used clips until under budget (lock held)."""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            name, (path, _) = next(iter(self._entries.items()))
+            self._forget(name)
+            self.evictions += 1
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"Could not evict {path}: {e}")
+
+    def stats(self) -> Dict[str, float]:
+        """Cache statistics.
+
+        Returns:
+            Hits, misses, hit rate, evictions, entry count and size in MB
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size_mb': self._total_bytes / (1024 * 1024)
+            }
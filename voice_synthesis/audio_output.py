@@ -0,0 +1,370 @@
+"""In-memory audio clips and a persistent output stream for playing them."""
+
+import io
+import logging
+import os
+import tempfile
+import threading
+import time
+import wave
+from collections import deque
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDDEVICE_AVAILABLE = False
+    logger.warning("sounddevice not installed. Install with: pip install sounddevice")
+
+
+class AudioClip(NamedTuple):
+    """Synthesized speech held in memory.
+
+    PCM clips carry float32 mono samples and their sample rate; encoded
+    clips (gTTS MP3) carry the compressed bytes and no sample rate.
+    """
+    data: Union[np.ndarray, bytes]
+    samplerate: Optional[int] = None
+
+    @property
+    def is_pcm(self) -> bool:
+        return self.samplerate is not None
+
+
+def encode_wav(samples: np.ndarray, samplerate: int) -> bytes:
+    """Encode float samples in [-1, 1] as 16-bit mono WAV.
+
+    Args:
+        samples: Audio samples
+        samplerate: Sample rate in Hz
+
+    Returns:
+        WAV file contents
+    """
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype('<i2')
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(samplerate)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def decode_wav(source: Union[str, bytes]) -> Tuple[np.ndarray, int]:
+    """Decode a 16-bit PCM WAV file to float32 mono samples.
+
+    Args:
+        source: Path to the file, or its contents
+
+    Returns:
+        Samples and sample rate
+    """
+    with wave.open(io.BytesIO(source) if isinstance(source, bytes) else source, 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"Unsupported WAV sample width: {wav.getsampwidth()}")
+        channels = wav.getnchannels()
+        samplerate = wav.getframerate()
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+
+    samples = pcm.astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples, samplerate
+
+
+def clip_to_bytes(clip: AudioClip) -> bytes:
+    """File contents for a clip (WAV for PCM, as-is for encoded audio)."""
+    if clip.is_pcm:
+        return encode_wav(clip.data, clip.samplerate)
+    return clip.data
+
+
+def read_clip(path: str) -> AudioClip:
+    """Load a clip file; WAV files are decoded to PCM."""
+    if path.endswith('.wav'):
+        return AudioClip(*decode_wav(path))
+    with open(path, 'rb') as f:
+        return AudioClip(f.read())
+
+
+class AudioOutput:
+    """Plays in-memory clips through one long-lived output stream.
+
+    PCM clips go to a sounddevice stream that is opened once and kept
+    running (emitting silence between clips), so starting an utterance
+    is a buffer swap instead of a device open. Clips handed over with
+    play_stream() are queued back to back in that stream, so chunks
+    synthesized while earlier ones play follow without a gap. Encoded
+    clips and systems without sounddevice use pygame's mixer, initialized
+    once. Only when neither is available is a clip written to a scratch
+    file for the platform player.
+    """
+
+    def __init__(self, poll_interval: float = 0.02):
+        """Initialize audio output (devices are opened on first use).
+
+        Args:
+            poll_interval: Seconds between checks for the end of playback
+                and for stop requests
+        """
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._stream = None
+        self._stream_rate = None
+        self._pending: "deque[np.ndarray]" = deque()
+        self._position = 0
+        self._producing = False
+        self._stopped = False
+        self._chunk_starts: List[float] = []
+        self._finished = threading.Event()
+        self._finished.set()
+
+        self._mixer = None
+        self._channel = None
+        self._process = None
+
+    def play(self, clip: AudioClip,
+             should_stop: Optional[Callable[[], bool]] = None) -> Optional[float]:
+        """Play a clip, blocking until it ends or is stopped.
+
+        Args:
+            clip: Audio to play
+            should_stop: Checked every poll interval; playback stops when
+                it returns True
+
+        Returns:
+            Seconds from the call until the first samples reached the
+            output, or None if that could not be measured
+        """
+        start = time.perf_counter()
+        starts = self.play_stream([clip], should_stop)
+        return starts[0] - start if starts and starts[0] is not None else None
+
+    def play_stream(self, clips: Iterable[AudioClip],
+                    should_stop: Optional[Callable[[], bool]] = None) -> List[Optional[float]]:
+        """Play clips back to back as they become available.
+
+        The iterable may block (e.g. while the next chunk is synthesized);
+        clips already handed over keep playing meanwhile.
+
+        Args:
+            clips: Audio to play, in order
+            should_stop: Checked every poll interval; playback stops when
+                it returns True
+
+        Returns:
+            time.perf_counter() at which each played clip's first samples
+            reached the output (None where that could not be measured)
+        """
+        self._stopped = False
+        if SOUNDDEVICE_AVAILABLE:
+            return self._play_stream(clips, should_stop)
+
+        starts = []
+        for clip in clips:
+            if self._stopped or (should_stop is not None and should_stop()):
+                break
+            starts.append(self._play_encoded(clip, should_stop))
+        return starts
+
+    def stop(self):
+        """Cut off whatever is playing."""
+        self._stopped = True
+        with self._lock:
+            self._pending.clear()
+            self._position = 0
+        self._finished.set()
+
+        if self._channel is not None:
+            self._channel.stop()
+        elif self._mixer is not None:
+            self._mixer.music.stop()
+        if self._process is not None:
+            self._process.terminate()
+
+    def close(self):
+        """Stop playback and release the output devices."""
+        self.stop()
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._mixer is not None:
+            self._mixer.quit()
+            self._mixer = None
+
+    def _wait(self, is_busy: Callable[[], bool],
+              should_stop: Optional[Callable[[], bool]]) -> bool:
+        """Poll until playback ends; returns True if it was stopped."""
+        while is_busy():
+            if should_stop is not None and should_stop():
+                self.stop()
+                return True
+            time.sleep(self.poll_interval)
+        return False
+
+    # -- sounddevice ---------------------------------------------------------
+
+    def _ensure_stream(self, samplerate: int):
+        """Open (or reopen for a new sample rate) the output stream."""
+        if self._stream is not None and self._stream_rate == samplerate:
+            return
+
+        if self._stream is not None:
+            # Let queued audio at the old rate finish first
+            self._drain()
+            self._stream.close()
+
+        self._stream = sd.OutputStream(
+            samplerate=samplerate,
+            channels=1,
+            dtype='float32',
+            callback=self._callback
+        )
+        self._stream.start()
+        self._stream_rate = samplerate
+        logger.info(f"Opened audio output stream at {samplerate} Hz")
+
+    def _callback(self, outdata, frames, time_info, status):
+        """Stream callback: fill the block from the queued clips."""
+        written = 0
+        with self._lock:
+            while written < frames and self._pending:
+                buffer = self._pending[0]
+                if self._position == 0:
+                    self._chunk_starts.append(time.perf_counter())
+
+                chunk = buffer[self._position:self._position + frames - written]
+                outdata[written:written + len(chunk), 0] = chunk
+                written += len(chunk)
+                self._position += len(chunk)
+
+                if self._position >= len(buffer):
+                    self._pending.popleft()
+                    self._position = 0
+
+            if not self._pending and not self._producing:
+                self._finished.set()
+
+        outdata[written:] = 0
+
+    def _play_stream(self, clips: Iterable[AudioClip],
+                     should_stop: Optional[Callable[[], bool]]) -> List[Optional[float]]:
+        with self._lock:
+            self._pending.clear()
+            self._position = 0
+            self._chunk_starts = []
+            self._producing = True
+            self._finished.clear()
+
+        starts = []
+        try:
+            for clip in clips:
+                if self._stopped:
+                    break
+                if not clip.is_pcm:
+                    # Compressed audio cannot go to the stream; keep the order
+                    self._drain()
+                    starts.append(self._play_encoded(clip, should_stop))
+                    continue
+                self._ensure_stream(clip.samplerate)
+                with self._lock:
+                    self._pending.append(np.ascontiguousarray(clip.data, dtype=np.float32))
+                    starts.append(None)
+        finally:
+            with self._lock:
+                self._producing = False
+                if not self._pending:
+                    self._finished.set()
+
+        while not self._finished.wait(self.poll_interval):
+            if should_stop is not None and should_stop():
+                self.stop()
+                break
+
+        # Fill in stream start times for the PCM clips, in order
+        stream_starts = iter(list(self._chunk_starts))
+        return [next(stream_starts, None) if start is None else start for start in starts]
+
+    def _drain(self):
+        """Wait until queued stream audio has been played (or stopped)."""
+        while self._pending and not self._stopped:
+            time.sleep(self.poll_interval)
+
+    # -- pygame --------------------------------------------------------------
+
+    def _play_encoded(self, clip: AudioClip,
+                      should_stop: Optional[Callable[[], bool]]) -> Optional[float]:
+        """Play a clip without the sounddevice stream."""
+        if self._init_mixer():
+            return self._play_mixer(clip, should_stop)
+        return self._play_file(clip, should_stop)
+
+    def _init_mixer(self) -> bool:
+        """Initialize pygame's mixer once; False if pygame is missing."""
+        if self._mixer is not None:
+            return True
+        try:
+            import pygame
+        except ImportError:
+            return False
+
+        pygame.mixer.init()
+        self._mixer = pygame.mixer
+        return True
+
+    def _play_mixer(self, clip: AudioClip,
+                    should_stop: Optional[Callable[[], bool]]) -> Optional[float]:
+        data = io.BytesIO(clip_to_bytes(clip))
+
+        if clip.is_pcm:
+            # The mixer resamples WAV sounds to its own output rate
+            self._channel = self._mixer.Sound(file=data).play()
+            started_at = time.perf_counter()
+            try:
+                self._wait(lambda: self._channel is not None and self._channel.get_busy(),
+                           should_stop)
+            finally:
+                self._channel = None
+        else:
+            self._mixer.music.load(data, 'mp3')
+            self._mixer.music.play()
+            started_at = time.perf_counter()
+            self._wait(self._mixer.music.get_busy, should_stop)
+
+        return started_at
+
+    # -- platform player -----------------------------------------------------
+
+    def _play_file(self, clip: AudioClip,
+                   should_stop: Optional[Callable[[], bool]]) -> Optional[float]:
+        """Last resort: hand a scratch file to the platform's player."""
+        import platform
+        import subprocess
+
+        extension = ".wav" if clip.is_pcm else ".mp3"
+        fd, path = tempfile.mkstemp(suffix=extension, prefix='jarvis-speech-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(clip_to_bytes(clip))
+
+        system = platform.system()
+        if system == "Windows":
+            # Plays asynchronously; the file is left for the player
+            os.startfile(path)
+            return None
+
+        player = "afplay" if system == "Darwin" else "aplay"
+        try:
+            self._process = subprocess.Popen([player, path])
+            self._wait(lambda: self._process is not None and self._process.poll() is None,
+                       should_stop)
+        finally:
+            self._process = None
+            os.unlink(path)
+        return None
@@ -0,0 +1,79 @@
+"""Split responses into sentence-sized chunks for streaming synthesis."""
+
+import re
+from typing import List
+
+# End of sentence: terminal punctuation (plus closing quotes/brackets),
+# then whitespace and something that starts a new sentence. "Hmm... interesting"
+# stays together because the next word is lowercase.
+_SENTENCE_END = re.compile(r'(?<=[.!?…])(["\')\]]*)\s+(?=["\'(\[]?[A-Z0-9])')
+
+# Places a long sentence can be broken without sounding cut off
+_CLAUSE_END = re.compile(r'[,;:—]\s+')
+
+_ABBREVIATIONS = {'mr.', 'mrs.', 'ms.', 'dr.', 'st.', 'vs.', 'etc.', 'e.g.', 'i.e.'}
+
+
+def split_sentences(text: str, max_chars: int = 200, min_chars: int = 12) -> List[str]:
+    """Split text into chunks that can be synthesized independently.
+
+    Args:
+        text: Text to split
+        max_chars: Sentences longer than this are broken at clause
+            punctuation, or at a space if there is none
+        min_chars: Chunks shorter than this are merged into the next one
+
+    Returns:
+        Non-empty chunks in reading order
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        sentence = text[start:match.end(1)]
+        words = sentence.split()
+        if words and words[-1].lower() in _ABBREVIATIONS:
+            continue
+        sentences.append(sentence)
+        start = match.end()
+    sentences.append(text[start:])
+
+    chunks = []
+    for sentence in sentences:
+        chunks.extend(_split_long(sentence.strip(), max_chars))
+
+    merged = []
+    carry = ""
+    for chunk in chunks:
+        chunk = f"{carry} {chunk}".strip() if carry else chunk
+        if len(chunk) < min_chars:
+            carry = chunk
+        else:
+            merged.append(chunk)
+            carry = ""
+    if carry:
+        if merged:
+            merged[-1] = f"{merged[-1]} {carry}"
+        else:
+            merged.append(carry)
+
+    return [chunk for chunk in merged if chunk]
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """Break a sentence longer than max_chars at clause boundaries."""
+    parts = []
+    while len(sentence) > max_chars:
+        cut = None
+        for match in _CLAUSE_END.finditer(sentence, 0, max_chars):
+            cut = match.end()
+        if cut is None:
+            cut = sentence.rfind(' ', 0, max_chars) + 1
+        if cut <= 0:
+            cut = max_chars
+
+        parts.append(sentence[:cut].strip())
+        sentence = sentence[cut:].strip()
+
+    if sentence:
+        parts.append(sentence)
+    return parts
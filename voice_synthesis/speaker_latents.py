@@ -0,0 +1,211 @@
+"""Reusable speaker conditioning for Coqui voice cloning."""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .audio_cache import file_digest
+
+logger = logging.getLogger(__name__)
+
+
+class SpeakerLatentCache:
+    """Computes a reference clip's speaker conditioning once and reuses it.
+
+    Coqui recomputes the conditioning from speaker_wav on every call: XTTS
+    through get_conditioning_latents(), d-vector models such as YourTTS
+    through the speaker encoder's compute_embedding_from_clip(). install()
+    wraps whichever hook the loaded model has, so every synthesis path
+    (tts, tts_to_file) picks up the cached result.
+
+    Results are kept in memory and pickled to disk keyed by the reference
+    file's content hash and mtime, so they survive restarts and are
+    recomputed when the reference audio changes.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str = ""):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted conditioning
+            model_name: Coqui model name, part of the key
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Any] = {}
+        self.compute_times: List[float] = []
+        self.reuse_times: List[float] = []
+
+    def install(self, model) -> bool:
+        """Wrap the conditioning hook of a loaded Coqui TTS model.
+
+        Args:
+            model: TTS.api.TTS instance
+
+        Returns:
+            True if the model has a supported hook
+        """
+        hook = self.conditioning_hook(model)
+        if hook is None:
+            logger.info("Model has no speaker conditioning to cache")
+            return False
+
+        self._wrap(*hook)
+        return True
+
+    @staticmethod
+    def conditioning_hook(model) -> Optional[tuple]:
+        """Find the method a loaded Coqui TTS model computes conditioning with.
+
+        Args:
+            model: TTS.api.TTS instance
+
+        Returns:
+            (owner, method name, reference audio parameter name), or None
+        """
+        tts_model = getattr(getattr(model, 'synthesizer', None), 'tts_model', None)
+        if tts_model is None:
+            return None
+
+        if hasattr(tts_model, 'get_conditioning_latents'):
+            return tts_model, 'get_conditioning_latents', 'audio_path'
+
+        speaker_manager = getattr(tts_model, 'speaker_manager', None)
+        if getattr(speaker_manager, 'encoder', None) is not None:
+            return speaker_manager, 'compute_embedding_from_clip', 'wav_file'
+
+        return None
+
+    def _wrap(self, owner, method_name: str, audio_arg: str):
+        """Replace owner.method_name with a caching version.
+
+        Args:
+            owner: Object whose method computes the conditioning
+            method_name: Name of that method
+            audio_arg: Name of its reference audio parameter (the first
+                one), which callers may pass positionally or by keyword
+        """
+        original = getattr(owner, method_name)
+
+        def cached(*args, **kwargs):
+            if args:
+                audio, params = args[0], [args[1:], sorted(kwargs.items())]
+            else:
+                audio = kwargs.get(audio_arg)
+                params = [(), sorted((k, v) for k, v in kwargs.items() if k != audio_arg)]
+            return self.get(method_name, audio, lambda: original(*args, **kwargs), params=params)
+
+        setattr(owner, method_name, cached)
+        logger.info(f"Caching speaker conditioning from {type(owner).__name__}.{method_name}")
+
+    def get(self, kind: str, audio: Union[str, List[str]], compute: Callable[[], Any],
+            params: Any = None) -> Any:
+        """Return cached conditioning for reference audio, computing it on a miss.
+
+        Args:
+            kind: Name of the conditioning (part of the key)
+            audio: Reference file path or list of paths
+            compute: Function computing the conditioning
+            params: Extra arguments that affect the result
+
+        Returns:
+            The conditioning as returned by compute()
+        """
+        paths = [audio] if isinstance(audio, (str, os.PathLike)) else audio
+        if not isinstance(paths, (list, tuple)) or not all(
+                isinstance(p, (str, os.PathLike)) and os.path.exists(p) for p in paths):
+            # In-memory audio or missing files: nothing to key on
+            return compute()
+
+        start = time.perf_counter()
+        key = self._key(kind, paths, params)
+
+        with self._lock:
+            value = self._memory.get(key)
+        if value is None:
+            value = self._load(key)
+            if value is not None:
+                with self._lock:
+                    self._memory[key] = value
+        if value is not None:
+            self.reuse_times.append(time.perf_counter() - start)
+            return value
+
+        # Computed without the lock, so lookups for other speakers go on
+        value = compute()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.compute_times.append(elapsed)
+            self._memory[key] = value
+            self._save(key, kind, paths, value)
+
+        logger.info(f"Computed speaker conditioning for {Path(paths[0]).name} "
+                    f"in {elapsed * 1000:.0f} ms")
+        return value
+
+    def _key(self, kind: str, paths: List[str], params: Any) -> str:
+        """Key from the model, hook, arguments and each file's hash and mtime."""
+        sources = [(file_digest(str(p)), os.stat(p).st_mtime) for p in paths]
+        payload = json.dumps([self.model_name, kind, sources, repr(params)])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _source_prefix(self, kind: str, paths: List[str]) -> str:
+        """File name prefix shared by every version of the same model, hook and paths."""
+        joined = '|'.join([self.model_name, kind] + [os.path.abspath(p) for p in paths])
+        return hashlib.sha256(joined.encode('utf-8')).hexdigest()[:16]
+
+    def _load(self, key: str) -> Optional[Any]:
+        """Read persisted conditioning."""
+        for path in self.cache_dir.glob(f"*-{key}.pkl"):
+            try:
+                with open(path, 'rb') as f:
+                    return pickle.load(f)
+            except FileNotFoundError:
+                # Replaced by a newer version while we looked
+                continue
+            except Exception as e:
+                logger.warning(f"Discarding unreadable speaker conditioning {path.name}: {e}")
+                path.unlink(missing_ok=True)
+        return None
+
+    def _save(self, key: str, kind: str, paths: List[str], value: Any):
+        """Persist conditioning and drop entries for older versions of the same files (lock held)."""
+        prefix = self._source_prefix(kind, paths)
+        for stale in self.cache_dir.glob(f"{prefix}-*.pkl"):
+            stale.unlink(missing_ok=True)
+
+        fd, temp_file = tempfile.mkstemp(suffix='.pkl', prefix='.tmp-', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f)
+            os.replace(temp_file, self.cache_dir / f"{prefix}-{key}.pkl")
+        except Exception as e:
+            Path(temp_file).unlink(missing_ok=True)
+            logger.warning(f"Could not persist speaker conditioning: {e}")
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Conditioning cost per utterance.
+
+        Returns:
+            Number of computations and reuses, with the mean milliseconds
+            each took
+        """
+        def mean_ms(times):
+            return sum(times) / len(times) * 1000 if times else None
+
+        return {
+            'computed': len(self.compute_times),
+            'compute_mean_ms': mean_ms(self.compute_times),
+            'reused': len(self.reuse_times),
+            'reuse_mean_ms': mean_ms(self.reuse_times)
+        }
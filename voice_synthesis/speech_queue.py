@@ -0,0 +1,144 @@
+"""Background speech queue so callers never wait on synthesis or playback."""
+
+import itertools
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SpeechQueue:
+    """Priority queue of utterances spoken one at a time on a worker thread.
+
+    Each submitted utterance gets a concurrent.futures.Future that resolves
+    when it has finished playing (or carries the synthesis error). Pending
+    utterances can be cancelled individually through their future or all at
+    once with flush().
+    """
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+    _STOP = object()
+
+    def __init__(self, speak_fn: Callable[..., None], name: str = "speech"):
+        """Initialize and start the worker.
+
+        Args:
+            speak_fn: Blocking function that synthesizes and plays one text
+            name: Worker thread name
+        """
+        self.speak_fn = speak_fn
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._unfinished = 0
+        self._idle = threading.Condition()
+        self.current: Optional[Future] = None
+
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str, priority: int = NORMAL, **kwargs) -> Future:
+        """Queue text to be spoken.
+
+        Args:
+            text: Text to speak
+            priority: HIGH, NORMAL or LOW; equal priorities play in order
+            **kwargs: Extra arguments for speak_fn
+
+        Returns:
+            Future resolved when the utterance has been spoken
+        """
+        future = Future()
+        with self._idle:
+            self._unfinished += 1
+        self._queue.put((priority, next(self._sequence), text, kwargs, future))
+        return future
+
+    def flush(self) -> int:
+        """Cancel every utterance that has not started yet.
+
+        Returns:
+            Number of utterances cancelled
+        """
+        cancelled = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item[2] is self._STOP:
+                # Keep the shutdown request queued
+                self._queue.put(item)
+                break
+
+            if item[4].cancel():
+                cancelled += 1
+            self._task_done()
+
+        if cancelled:
+            logger.info(f"Flushed {cancelled} pending utterance(s)")
+        return cancelled
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far has been spoken.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    @property
+    def is_busy(self) -> bool:
+        """Whether anything is playing or queued."""
+        with self._idle:
+            return self._unfinished > 0
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker after the current utterance.
+
+        Args:
+            wait: Speak everything already queued before stopping
+        """
+        if not wait:
+            self.flush()
+        self._queue.put((float('inf'), next(self._sequence), self._STOP, {}, None))
+        self._worker.join(timeout=None if wait else 1.0)
+
+    def _task_done(self):
+        with self._idle:
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._idle.notify_all()
+
+    def _run(self):
+        """Worker loop: speak utterances in priority order."""
+        while True:
+            _, _, text, kwargs, future = self._queue.get()
+            if text is self._STOP:
+                break
+
+            # Skips utterances cancelled while they were queued
+            if not future.set_running_or_notify_cancel():
+                self._task_done()
+                continue
+
+            self.current = future
+            try:
+                self.speak_fn(text, **kwargs)
+                future.set_result(None)
+            except Exception as e:
+                logger.error(f"Speech failed: {e}")
+                future.set_exception(e)
+            finally:
+                self.current = None
+                self._task_done()
@@ -1,17 +1,38 @@
 """Text-to-Speech Engine with multiple backend support."""
 
+import io
+import json
 import os
 import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+import numpy as np
 import yaml
 
+from jarvis_core.model_registry import ResidentModel, memory_budget, models
+from .speech_queue import SpeechQueue
+from .audio_cache import AudioCache
+from .audio_output import AudioClip, AudioOutput, clip_to_bytes, read_clip
+from .speaker_latents import SpeakerLatentCache
+from .sentences import split_sentences
+
 logger = logging.getLogger(__name__)
 
 
 class TTSEngine:
     """Text-to-Speech engine with voice cloning support."""
     
+    # Upper bound on how long playback keeps going after interrupt()
+    PLAYBACK_POLL_S = 0.02
+    
+    # Coqui models that do not report their output rate
+    DEFAULT_SAMPLE_RATE = 22050
+    
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize TTS engine.
         
@@ -21,8 +42,93 @@ class TTSEngine:
         self.config = self._load_config(config_path)
         self.engine_name = self.config['voice']['engine']
         self.model = None
+        
+        # Coqui models are unloaded while idle and reloaded on demand
+        self.resident_model: Optional[ResidentModel] = None
+        memory_budget.configure(self.config.get('memory'))
+        
+        # Speaker conditioning computed once per reference clip
+        self.speaker_latents = None
+        if self.engine_name == "coqui_tts" and self.config['voice'].get('cache_speaker_latents', True):
+            self.speaker_latents = SpeakerLatentCache(
+                Path(self.config['paths']['cache']) / "speaker_latents",
+                model_name=self.config['voice']['voice_model']
+            )
+        
         self._initialize_engine()
         
+        # Persistent cache of synthesized clips
+        self.audio_cache = None
+        if self.config['voice'].get('cache_enabled', True):
+            max_mb = self.config['voice'].get('cache_max_mb', 200)
+            self.audio_cache = AudioCache(
+                Path(self.config['paths']['cache']) / "tts",
+                max_bytes=int(max_mb * 1024 * 1024)
+            )
+        
+        # Serializes model use between speech and background pre-rendering
+        self._synthesis_lock = threading.Lock()
+        
+        # Barge-in: interrupt() bumps the generation, and anything submitted
+        # under an older generation stops at the next PLAYBACK_POLL_S tick
+        self._generation = 0
+        self._speaking_generation = 0
+        self._playback_idle = threading.Event()
+        self._playback_idle.set()
+        self.stop_latencies: List[float] = []
+        
+        # Clips are played from memory through one long-lived output stream
+        self.audio_output = AudioOutput(poll_interval=self.PLAYBACK_POLL_S)
+        self.handoff_latencies = deque(maxlen=1000)
+        self._stream_timings: Optional[Dict[str, Any]] = None
+        
+        # Time from _speak_now() to the first audible sample, per path
+        self.first_audio_latencies = {'streamed': deque(maxlen=1000), 'whole': deque(maxlen=1000)}
+        self._utterance_started = 0.0
+        
+        # Synthesis and playback happen on a background worker
+        self.speech_queue = SpeechQueue(self._speak_now, name="tts")
+        
+    @classmethod
+    def shared(cls, config_path: str = "config.yaml") -> "TTSEngine":
+        """Get the process-wide engine for a configuration.
+        
+        Callers whose voice and cache settings match get the same engine,
+        so the model is loaded once and their speech goes through one
+        queue. Release it with models.release(engine) when done.
+        
+        Args:
+            config_path: Path to configuration file
+            
+        Returns:
+            Shared TTS engine
+        """
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f)
+        key = json.dumps([config['voice'], config['paths']['cache']], sort_keys=True)
+        return models.acquire('tts', key, lambda: cls(config_path), closer=cls.close)
+    
+    def close(self):
+        """Drop queued speech, stop the speech worker and release audio output."""
+        barge_in = self.barge_in_stats()
+        if barge_in['count']:
+            logger.info(f"Barge-in stopped playback {barge_in['count']} times in "
+                        f"{barge_in['mean_ms']:.1f} ms on average (max {barge_in['max_ms']:.1f} ms)")
+        for path, stats in self.first_audio_stats().items():
+            if stats['count']:
+                logger.info(f"Time to first audio ({path}): {stats['mean_ms']:.0f} ms on average "
+                            f"(max {stats['max_ms']:.0f} ms) over {stats['count']} utterances")
+        if self.speaker_latents is not None:
+            stats = self.speaker_latents.stats()
+            if stats['computed'] or stats['reused']:
+                logger.info(f"Speaker conditioning per utterance: {stats['computed']} computed "
+                            f"(mean {stats['compute_mean_ms'] or 0:.0f} ms), {stats['reused']} "
+                            f"reused from cache (mean {stats['reuse_mean_ms'] or 0:.1f} ms)")
+        self.speech_queue.shutdown(wait=False)
+        self.audio_output.close()
+        if self.resident_model is not None:
+            self.resident_model.close()
+    
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file."""
         with open(config_path, 'r') as f:
@@ -44,12 +150,9 @@ class TTSEngine:
     def _init_coqui_tts(self):
         """Initialize Coqui TTS with voice cloning."""
         try:
-            from TTS.api import TTS
-            
             model_name = self.config['voice']['voice_model']
-            logger.info(f"Loading Coqui TTS model: {model_name}")
-            
-            self.model = TTS(model_name)
+            self.resident_model = ResidentModel(f"coqui:{model_name}", self._load_coqui)
+            self.resident_model.load()
             logger.info("Coqui TTS initialized successfully")
             
         except ImportError:
@@ -58,9 +161,24 @@ class TTSEngine:
         except Exception as e:
             logger.error(f"Failed to initialize Coqui TTS: {e}")
             logger.info("Falling back to pyttsx3")
+            if self.resident_model is not None:
+                self.resident_model.close()
+                self.resident_model = None
             self.engine_name = "pyttsx3"
             self._init_pyttsx3()
     
+    def _load_coqui(self):
+        """Load the Coqui model (also used to reload it after an idle unload)."""
+        from TTS.api import TTS
+        
+        model_name = self.config['voice']['voice_model']
+        logger.info(f"Loading Coqui TTS model: {model_name}")
+        model = TTS(model_name)
+        
+        if self.speaker_latents is not None:
+            self.speaker_latents.install(model)
+        return model
+    
     def _init_pyttsx3(self):
         """Initialize pyttsx3 (offline TTS)."""
         try:
@@ -96,15 +214,155 @@ class TTSEngine:
             logger.error("gTTS not installed. Install with: pip install gtts")
             raise
     
-    def speak(self, text: str, reference_audio: Optional[str] = None) -> None:
-        """Synthesize and play speech.
+    def speak(self, text: str, reference_audio: Optional[str] = None,
+              priority: int = SpeechQueue.NORMAL, stream: Optional[bool] = None) -> Future:
+        """Queue speech and return immediately.
+        
+        Args:
+            text: Text to speak
+            reference_audio: Path to reference audio for voice cloning (Coqui TTS only)
+            priority: SpeechQueue.HIGH, NORMAL or LOW
+            stream: Synthesize sentence by sentence, playing each one while
+                the next is rendered (defaults to voice.streaming)
+            
+        Returns:
+            Future resolved once the text has been spoken
+        """
+        return self.speech_queue.submit(text, priority, reference_audio=reference_audio,
+                                        generation=self._generation, stream=stream)
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until all queued speech has been spoken.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if all speech finished, False on timeout
+        """
+        return self.speech_queue.wait(timeout)
+    
+    def flush(self) -> int:
+        """Cancel queued speech that has not started yet.
+        
+        Returns:
+            Number of utterances cancelled
+        """
+        return self.speech_queue.flush()
+    
+    def interrupt(self, timeout: float = 1.0) -> float:
+        """Stop current playback and drop queued speech (barge-in).
+        
+        Args:
+            timeout: Maximum seconds to wait for audio output to stop
+            
+        Returns:
+            Seconds from the request until audio output stopped
+            (0.0 if nothing was playing)
+        """
+        start = time.perf_counter()
+        self._generation += 1
+        self.flush()
+        
+        if self._playback_idle.is_set():
+            return 0.0
+        
+        if self.engine_name == "pyttsx3" and self.model is not None:
+            self.model.stop()
+        else:
+            self.audio_output.stop()
+        
+        self._playback_idle.wait(timeout)
+        latency = time.perf_counter() - start
+        self.stop_latencies.append(latency)
+        logger.info(f"Barge-in stopped playback in {latency * 1000:.1f} ms")
+        return latency
+    
+    def barge_in_stats(self) -> Dict[str, Optional[float]]:
+        """Stop latency of interrupts that cut off playback.
+        
+        Returns:
+            Count, mean and max stop latency in milliseconds
+        """
+        latencies = list(self.stop_latencies)
+        if not latencies:
+            return {'count': 0, 'mean_ms': None, 'max_ms': None}
+        return {
+            'count': len(latencies),
+            'mean_ms': sum(latencies) / len(latencies) * 1000,
+            'max_ms': max(latencies) * 1000
+        }
+    
+    def first_audio_stats(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Time from the start of an utterance until its first audio.
+        
+        Returns:
+            Count, mean and max in milliseconds for 'streamed' utterances
+            (sentence by sentence) and 'whole' ones (one clip)
+        """
+        stats = {}
+        for path, latencies in self.first_audio_latencies.items():
+            latencies = list(latencies)
+            if not latencies:
+                stats[path] = {'count': 0, 'mean_ms': None, 'max_ms': None}
+                continue
+            stats[path] = {
+                'count': len(latencies),
+                'mean_ms': sum(latencies) / len(latencies) * 1000,
+                'max_ms': max(latencies) * 1000
+            }
+        return stats
+    
+    def playback_stats(self) -> Dict[str, Optional[float]]:
+        """Delay between the end of synthesis and the start of audio.
+        
+        Returns:
+            Count, mean and max handoff latency in milliseconds
+        """
+        latencies = list(self.handoff_latencies)
+        if not latencies:
+            return {'count': 0, 'mean_ms': None, 'max_ms': None}
+        return {
+            'count': len(latencies),
+            'mean_ms': sum(latencies) / len(latencies) * 1000,
+            'max_ms': max(latencies) * 1000
+        }
+    
+    def _interrupted(self) -> bool:
+        """Whether the utterance being spoken was cut off by interrupt()."""
+        return self._speaking_generation != self._generation
+    
+    @property
+    def is_playing(self) -> bool:
+        """Whether audio is being output right now."""
+        return not self._playback_idle.is_set()
+    
+    def _speak_now(self, text: str, reference_audio: Optional[str] = None,
+                   generation: Optional[int] = None, stream: Optional[bool] = None) -> None:
+        """Synthesize and play speech (blocking, runs on the speech worker).
         
         Args:
             text: Text to speak
             reference_audio: Path to reference audio for voice cloning (Coqui TTS only)
+            generation: Interrupt generation the text was queued under
+            stream: Pipeline synthesis sentence by sentence
         """
+        self._speaking_generation = self._generation if generation is None else generation
+        if self._interrupted():
+            return
+        self._utterance_started = time.perf_counter()
+        
         logger.info(f"Speaking: {text[:50]}...")
         
+        if stream is None:
+            stream = self.config['voice'].get('streaming', True)
+        if stream and self.engine_name in ("coqui_tts", "gtts"):
+            chunks = split_sentences(text, max_chars=self.config['voice'].get('stream_max_chars', 200))
+            # A clip of the whole text (e.g. a pre-rendered phrase) beats streaming
+            if len(chunks) > 1 and not self._is_cached(text, reference_audio):
+                self._speak_streaming(chunks, reference_audio)
+                return
+        
         if self.engine_name == "coqui_tts":
             self._speak_coqui(text, reference_audio)
         elif self.engine_name == "pyttsx3":
@@ -112,38 +370,142 @@ class TTSEngine:
         elif self.engine_name == "gtts":
             self._speak_gtts(text)
     
-    def _speak_coqui(self, text: str, reference_audio: Optional[str] = None):
-        """Speak using Coqui TTS with voice cloning."""
+    def _cache_key(self, text: str, reference_audio: Optional[str] = None) -> str:
+        """Audio cache key for text spoken with the current settings."""
+        voice_config = self.config['voice']
+        return AudioCache.make_key(
+            text,
+            self.engine_name,
+            model=voice_config.get('voice_model') if self.engine_name == "coqui_tts" else None,
+            reference_audio=reference_audio,
+            speed=voice_config.get('speed', 1.0),
+            language=voice_config.get('language')
+        )
+    
+    def _synthesize_clip(self, text: str, extension: str,
+                         synthesize: Callable[[], AudioClip],
+                         reference_audio: Optional[str] = None) -> AudioClip:
+        """Get a clip for the text, synthesizing it only on a cache miss.
+        
+        Args:
+            text: Text to speak
+            extension: Cache file extension including the dot
+            synthesize: Function returning the synthesized clip
+            reference_audio: Voice cloning reference, part of the cache key
+            
+        Returns:
+            The clip, in memory
+        """
+        if self.audio_cache is None:
+            with self._synthesis_lock:
+                return synthesize()
+        
+        key = self._cache_key(text, reference_audio)
+        cached = self.audio_cache.get(key, extension)
+        if cached:
+            logger.debug(f"Audio cache hit: {text[:50]}")
+            return read_clip(cached)
+        
+        with self._synthesis_lock:
+            # Another thread (e.g. phrase warm-up) may have just rendered it
+            if self.audio_cache.contains(key, extension):
+                return read_clip(self.audio_cache.get(key, extension))
+            
+            clip = synthesize()
+            self.audio_cache.put_bytes(key, extension, clip_to_bytes(clip))
+            return clip
+    
+    def _coqui_sample_rate(self, model) -> int:
+        """Output sample rate of a loaded Coqui model."""
+        synthesizer = getattr(model, 'synthesizer', None)
+        return getattr(synthesizer, 'output_sample_rate', None) or self.DEFAULT_SAMPLE_RATE
+    
+    def _render(self, text: str, reference_audio: Optional[str] = None) -> AudioClip:
+        """Synthesize text to an in-memory clip (Coqui TTS and gTTS).
+        
+        Args:
+            text: Text to synthesize
+            reference_audio: Path to reference audio for voice cloning (Coqui TTS only)
+            
+        Returns:
+            PCM samples (Coqui TTS) or MP3 bytes (gTTS)
+        """
+        if self.engine_name == "gtts":
+            from gtts import gTTS
+            
+            def synthesize() -> AudioClip:
+                buffer = io.BytesIO()
+                gTTS(text=text, lang=self.config['voice']['language']).write_to_fp(buffer)
+                return AudioClip(buffer.getvalue())
+            
+            return self._synthesize_clip(text, ".mp3", synthesize)
+        
         # Use reference audio from config if not provided
         if reference_audio is None:
             reference_audio = self.config['voice'].get('reference_audio')
         
-        # Create cache directory if it doesn't exist
-        cache_dir = Path(self.config['paths']['cache'])
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        if reference_audio and os.path.exists(reference_audio):
+            # Voice cloning mode
+            logger.info(f"Using voice cloning with reference: {reference_audio}")
+            tts_kwargs = {
+                'text': text,
+                'speaker_wav': reference_audio,
+                'language': self.config['voice']['language']
+            }
+        else:
+            # Standard TTS mode
+            logger.warning("No reference audio found, using default voice")
+            reference_audio = None
+            tts_kwargs = {'text': text}
+        
+        def synthesize() -> AudioClip:
+            with self.resident_model.use() as model:
+                samples = np.asarray(model.tts(**tts_kwargs), dtype=np.float32)
+                return AudioClip(samples, self._coqui_sample_rate(model))
         
-        output_file = cache_dir / "temp_speech.wav"
+        return self._synthesize_clip(text, ".wav", synthesize, reference_audio)
+    
+    @property
+    def can_cache(self) -> bool:
+        """Whether synthesized audio for this engine goes through the cache."""
+        return self.audio_cache is not None and self.engine_name in ("coqui_tts", "gtts")
+    
+    def prerender(self, text: str, reference_audio: Optional[str] = None) -> bool:
+        """Synthesize text into the audio cache without playing it.
         
+        Args:
+            text: Text to synthesize
+            reference_audio: Path to reference audio for voice cloning
+            
+        Returns:
+            True if a clip was rendered, False if it was already cached or
+            the engine cannot cache audio (pyttsx3, cache disabled)
+        """
+        if not self.can_cache or self._is_cached(text, reference_audio):
+            return False
+        
+        self._render(text, reference_audio)
+        return True
+    
+    def _is_cached(self, text: str, reference_audio: Optional[str] = None) -> bool:
+        """Whether _render() would find the whole text in the audio cache."""
+        if not self.can_cache:
+            return False
+        
+        if self.engine_name == "gtts":
+            reference_audio = None
+        elif reference_audio is None:
+            reference_audio = self.config['voice'].get('reference_audio')
+        if reference_audio and not os.path.exists(reference_audio):
+            reference_audio = None
+        
+        extension = ".wav" if self.engine_name == "coqui_tts" else ".mp3"
+        return self.audio_cache.contains(self._cache_key(text, reference_audio), extension)
+    
+    def _speak_coqui(self, text: str, reference_audio: Optional[str] = None):
+        """Speak using Coqui TTS with voice cloning."""
         try:
-            if reference_audio and os.path.exists(reference_audio):
-                # Voice cloning mode
-                logger.info(f"Using voice cloning with reference: {reference_audio}")
-                self.model.tts_to_file(
-                    text=text,
-                    speaker_wav=reference_audio,
-                    file_path=str(output_file),
-                    language=self.config['voice']['language']
-                )
-            else:
-                # Standard TTS mode
-                logger.warning("No reference audio found, using default voice")
-                self.model.tts_to_file(
-                    text=text,
-                    file_path=str(output_file)
-                )
-            
-            # Play the audio file
-            self._play_audio(str(output_file))
+            self._play(self._render(text, reference_audio))
             
         except Exception as e:
             logger.error(f"Error in Coqui TTS: {e}")
@@ -151,67 +513,143 @@ class TTSEngine:
     
     def _speak_pyttsx3(self, text: str):
         """Speak using pyttsx3."""
+        self._playback_idle.clear()
         try:
             self.model.say(text)
             self.model.runAndWait()
         except Exception as e:
             logger.error(f"Error in pyttsx3: {e}")
             raise
+        finally:
+            self._playback_idle.set()
     
     def _speak_gtts(self, text: str):
         """Speak using Google TTS."""
         try:
-            from gtts import gTTS
-            import pygame
-            
-            cache_dir = Path(self.config['paths']['cache'])
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            output_file = cache_dir / "temp_speech.mp3"
-            
-            tts = gTTS(text=text, lang=self.config['voice']['language'])
-            tts.save(str(output_file))
-            
-            self._play_audio(str(output_file))
+            self._play(self._render(text))
             
         except Exception as e:
             logger.error(f"Error in gTTS: {e}")
             raise
     
-    def _play_audio(self, file_path: str):
-        """Play audio file.
+    def _speak_streaming(self, chunks: List[str], reference_audio: Optional[str] = None):
+        """Speak chunks back to back, synthesizing ahead of playback.
+        
+        A producer thread renders the chunks in order while the speech
+        worker queues each finished one on the output stream, so audio
+        starts as soon as the first chunk is ready and later chunks follow
+        without a gap as long as synthesis outpaces playback.
         
         Args:
-            file_path: Path to audio file
+            chunks: Text chunks in order (see split_sentences)
+            reference_audio: Path to reference audio for voice cloning (Coqui TTS only)
         """
-        try:
-            # Try pygame first (cross-platform)
-            import pygame
-            
-            pygame.mixer.init()
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
-            
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
-                
-        except ImportError:
-            # Fallback to platform-specific players
-            import platform
-            import subprocess
-            
-            system = platform.system()
+        start = time.perf_counter()
+        timings = [{'chunk': i, 'chars': len(chunk)} for i, chunk in enumerate(chunks)]
+        rendered: "queue.Queue[Optional[AudioClip]]" = queue.Queue()
+        errors = []
+        
+        def produce():
+            try:
+                for i, chunk in enumerate(chunks):
+                    if self._interrupted():
+                        return
+                    synth_start = time.perf_counter()
+                    clip = self._render(chunk, reference_audio)
+                    timings[i]['synth_ms'] = (time.perf_counter() - synth_start) * 1000
+                    timings[i]['ready_ms'] = (time.perf_counter() - start) * 1000
+                    rendered.put(clip)
+            except Exception as e:
+                logger.error(f"Streaming synthesis failed: {e}")
+                errors.append(e)
+            finally:
+                rendered.put(None)
+        
+        def clips() -> Iterator[AudioClip]:
+            while not self._interrupted():
+                try:
+                    clip = rendered.get(timeout=self.PLAYBACK_POLL_S)
+                except queue.Empty:
+                    continue
+                if clip is None:
+                    return
+                yield clip
+        
+        producer = threading.Thread(target=produce, name="tts-stream", daemon=True)
+        producer.start()
+        audio_starts = self._play_clips(clips())
+        producer.join()
+        
+        for timing, audio_start in zip(timings, audio_starts):
+            if audio_start is not None:
+                timing['audio_ms'] = (audio_start - start) * 1000
+        
+        first = timings[0]
+        if 'audio_ms' in first:
+            self.handoff_latencies.append((first['audio_ms'] - first['ready_ms']) / 1000)
+            self.first_audio_latencies['streamed'].append(
+                audio_starts[0] - self._utterance_started
+            )
+        self._stream_timings = {
+            'chunks': timings,
+            'first_audio_ms': first.get('audio_ms'),
+            'total_ms': (time.perf_counter() - start) * 1000
+        }
+        
+        if first.get('audio_ms') is not None:
+            logger.info(f"Streamed {len(chunks)} chunks, first audio after "
+                        f"{first['audio_ms']:.0f} ms")
+        if errors:
+            raise errors[0]
+    
+    def stream_timings(self) -> Optional[Dict[str, Any]]:
+        """Per-chunk timings of the last streamed utterance.
+        
+        Returns:
+            'chunks' (one entry per chunk with its length in characters and,
+            when reached, 'synth_ms' spent synthesizing it, 'ready_ms' and
+            'audio_ms' since the utterance started), 'first_audio_ms' and
+            'total_ms'; None if nothing has been streamed yet
+        """
+        return self._stream_timings
+    
+    def _play(self, clip: AudioClip):
+        """Play a single clip and record its synthesis-to-audio handoff.
+        
+        Args:
+            clip: Synthesized audio
+        """
+        ready = time.perf_counter()
+        starts = self._play_clips([clip])
+        if starts and starts[0] is not None:
+            latency = starts[0] - ready
+            self.handoff_latencies.append(latency)
+            self.first_audio_latencies['whole'].append(starts[0] - self._utterance_started)
+            logger.debug(f"Audio started {latency * 1000:.1f} ms after synthesis")
+    
+    def _play_clips(self, clips: Iterable[AudioClip]) -> List[Optional[float]]:
+        """Play clips back to back, stopping early if interrupt() is called.
+        
+        Args:
+            clips: Synthesized audio, possibly still being produced
             
-            if system == "Windows":
-                os.startfile(file_path)
-            elif system == "Darwin":  # macOS
-                subprocess.call(["afplay", file_path])
-            else:  # Linux
-                subprocess.call(["aplay", file_path])
+        Returns:
+            time.perf_counter() at which each clip started playing
+        """
+        if self._interrupted():
+            # Interrupted while this utterance was being synthesized
+            return []
+        
+        self._playback_idle.clear()
+        try:
+            return self.audio_output.play_stream(clips, should_stop=self._interrupted)
         
         except Exception as e:
             logger.error(f"Error playing audio: {e}")
-            logger.info(f"Audio saved to: {file_path}")
+            return []
+        
+        finally:
+            self._playback_idle.set()
     
     def save_speech(self, text: str, output_path: str, reference_audio: Optional[str] = None):
         """Save synthesized speech to file.
@@ -227,15 +665,16 @@ class TTSEngine:
             if reference_audio is None:
                 reference_audio = self.config['voice'].get('reference_audio')
             
-            if reference_audio and os.path.exists(reference_audio):
-                self.model.tts_to_file(
-                    text=text,
-                    speaker_wav=reference_audio,
-                    file_path=output_path,
-                    language=self.config['voice']['language']
-                )
-            else:
-                self.model.tts_to_file(text=text, file_path=output_path)
+            with self.resident_model.use() as model:
+                if reference_audio and os.path.exists(reference_audio):
+                    model.tts_to_file(
+                        text=text,
+                        speaker_wav=reference_audio,
+                        file_path=output_path,
+                        language=self.config['voice']['language']
+                    )
+                else:
+                    model.tts_to_file(text=text, file_path=output_path)
                 
         elif self.engine_name == "gtts":
             from gtts import gTTS
@@ -253,3 +692,4 @@ if __name__ == "__main__":
     print("Testing TTS Engine...")
     tts = TTSEngine()
     tts.speak("All according to plan.")
+    tts.wait()